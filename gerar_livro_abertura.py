@@ -0,0 +1,39 @@
+import os
+import time
+
+from src.ai.livro_abertura import PASTA_LIVROS, gerar_livro, nome_arquivo, salvar_livro
+from src.utils.log import configurar_verbosidade, obter_logger
+
+logger = obter_logger("gerar_livro_abertura")
+
+# --- Configurações ---
+TAMANHO_TABULEIRO = 5  # Tabuleiro 5x5, como na GUI
+PAREDES_POR_JOGADOR = 3  # 3 paredes por jogador
+PLIES = 6  # Jogadas (dos dois jogadores) cobertas pelo livro
+PROFUNDIDADE = 6  # Profundidade da busca de cada posição
+LARGURA = 3  # Movimentos seguidos a partir de cada posição: o melhor e as alternativas
+NUM_PROCESSOS = os.cpu_count() or 1  # Processos que analisam as posições em paralelo
+# Verbosidade do log: 'silencioso', 'erro', 'aviso', 'info' ou 'debug'
+# (None usa a variável de ambiente QUORIDOR_VERBOSIDADE, ou 'info')
+VERBOSIDADE = None
+
+
+def gerar():
+    """Gera o livro de aberturas da variante configurada e o grava em PASTA_LIVROS."""
+    os.makedirs(PASTA_LIVROS, exist_ok=True)
+    caminho = os.path.join(PASTA_LIVROS, nome_arquivo(TAMANHO_TABULEIRO, TAMANHO_TABULEIRO, PAREDES_POR_JOGADOR))
+
+    inicio = time.time()
+    livro = gerar_livro(
+        TAMANHO_TABULEIRO, TAMANHO_TABULEIRO, PAREDES_POR_JOGADOR, PLIES, PROFUNDIDADE, LARGURA, NUM_PROCESSOS
+    )
+    logger.info("Livro gerado em %.1f segundos", time.time() - inicio)
+
+    salvar_livro(caminho, TAMANHO_TABULEIRO, TAMANHO_TABULEIRO, PAREDES_POR_JOGADOR, livro)
+    logger.info("Livro gravado em %s (%d posições, %d bytes)", caminho, len(livro), os.path.getsize(caminho))
+    return caminho
+
+
+if __name__ == "__main__":
+    configurar_verbosidade(VERBOSIDADE)
+    gerar()
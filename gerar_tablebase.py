@@ -0,0 +1,96 @@
+import os
+import random
+import time
+
+from src.ai import mcts, minimax
+from src.ai.tablebase import (
+    PAREDES_SOB_DEMANDA,
+    PASTA_TABLEBASES,
+    nome_arquivo,
+    resolver_fatias,
+    salvar_tablebase,
+)
+from src.core.game import JogoQuoridor
+from src.core.movimento_util import gerar_movimentos_possiveis
+from src.utils.log import configurar_verbosidade, obter_logger
+
+logger = obter_logger("gerar_tablebase")
+
+# --- Configurações ---
+TAMANHO_TABULEIRO = 5  # Tabuleiro 5x5, como na GUI
+PAREDES_POR_JOGADOR = 3  # 3 paredes por jogador
+# A variante inteira tem ~870 milhões de estados, além do que este resolvedor suporta.
+# A tablebase cobre as fatias em que as partidas chegam com no máximo esta quantidade
+# de paredes para cada jogador, a partir das paredes já colocadas. As configurações
+# com até PAREDES_SOB_DEMANDA paredes no total ficam de fora do arquivo: elas são
+# resolvidas durante a partida (ver tablebase.consultar_fatia)
+LIMITE_RESTANTES = 1
+# Partidas do agente minimax contra o MCTS (semente diferente a cada partida, cores
+# alternadas) que fornecem as configurações de paredes de partida das fatias. As
+# primeiras jogadas são sorteadas: o livro de aberturas tornaria as partidas iguais
+NUM_PARTIDAS = 60
+JOGADAS_ALEATORIAS = 2
+TEMPO_JOGADA = 0.2  # Segundos por jogada nessas partidas
+LIMITE_JOGADAS = 200  # Jogadas (dos dois jogadores) por partida, contra empates por repetição
+# Verbosidade do log: 'silencioso', 'erro', 'aviso', 'info' ou 'debug'
+# (None usa a variável de ambiente QUORIDOR_VERBOSIDADE, ou 'info')
+VERBOSIDADE = None
+
+
+def raiz_partida(semente):
+    """
+    Joga uma partida de minimax contra MCTS até os dois jogadores ficarem com no máximo
+    LIMITE_RESTANTES paredes.
+
+    Returns:
+        tuple | None: (paredes_h, paredes_v, restantes_j1, restantes_j2) nesse momento, ou
+            None se a partida terminar antes.
+    """
+    jogo = JogoQuoridor(
+        linhas=TAMANHO_TABULEIRO, colunas=TAMANHO_TABULEIRO, total_paredes_jogador=PAREDES_POR_JOGADOR
+    )
+    sorteio = random.Random(semente)
+    turno = 0
+    for jogada in range(LIMITE_JOGADAS):
+        restantes_j1, restantes_j2 = jogo.paredes_restantes["J1"], jogo.paredes_restantes["J2"]
+        if max(restantes_j1, restantes_j2) <= LIMITE_RESTANTES:
+            return jogo.tabuleiro.paredes_h, jogo.tabuleiro.paredes_v, restantes_j1, restantes_j2
+        if jogada < JOGADAS_ALEATORIAS:
+            movimento = sorteio.choice(gerar_movimentos_possiveis(jogo, turno, ordenar=False))
+        elif turno == semente % 2:
+            movimento = minimax.escolher_movimento_ai(jogo, turno, tempo_limite=TEMPO_JOGADA)
+        else:
+            movimento = mcts.escolher_movimento_ai(jogo, turno, tempo_limite=TEMPO_JOGADA, semente=semente)
+        if movimento is None or not jogo.aplicar_movimento(movimento, turno) or jogo.jogo_terminado:
+            return None
+        turno = 1 - turno
+    return None
+
+
+def gerar():
+    """Resolve as fatias alcançadas pelas partidas e grava a tablebase em PASTA_TABLEBASES."""
+    os.makedirs(PASTA_TABLEBASES, exist_ok=True)
+    caminho = os.path.join(PASTA_TABLEBASES, nome_arquivo(TAMANHO_TABULEIRO, TAMANHO_TABULEIRO, PAREDES_POR_JOGADOR))
+
+    inicio = time.time()
+    raizes = set()
+    for semente in range(NUM_PARTIDAS):
+        raiz = raiz_partida(semente)
+        if raiz is not None:
+            raizes.add(raiz)
+    logger.info("%d partidas jogadas em %.1f segundos: %d raízes", NUM_PARTIDAS, time.time() - inicio, len(raizes))
+
+    inicio = time.time()
+    chaves, resultados, movimentos = resolver_fatias(
+        TAMANHO_TABULEIRO, TAMANHO_TABULEIRO, PAREDES_POR_JOGADOR, list(raizes), PAREDES_SOB_DEMANDA + 1
+    )
+    logger.info("%d configurações resolvidas em %.1f segundos", len(chaves), time.time() - inicio)
+
+    salvar_tablebase(caminho, TAMANHO_TABULEIRO, TAMANHO_TABULEIRO, PAREDES_POR_JOGADOR, chaves, resultados, movimentos)
+    logger.info("Tablebase gravada em %s (%d bytes)", caminho, os.path.getsize(caminho))
+    return caminho
+
+
+if __name__ == "__main__":
+    configurar_verbosidade(VERBOSIDADE)
+    gerar()
@@ -46,3 +46,8 @@ WALL_THICKNESS = 10
 BOARD_MARGIN = 50
 BOARD_OFFSET_X = BOARD_MARGIN
 BOARD_OFFSET_Y = BOARD_MARGIN
+
+# --- Configurações da IA ---
+# No modo Humano vs Minimax, a IA continua buscando enquanto o humano pensa
+# (ver src/ai/ponderacao.py)
+PONDERACAO = True
@@ -5,6 +5,8 @@ from enum import Enum, auto
 import pygame
 from src.ai.q_learning_agent import AgenteQLearningTabular
 from src.ai.minimax import escolher_movimento_ai
+from src.ai.ponderacao import Ponderador
+from src.core.codificacao import codificar_direcao, codificar_parede, decodificar_movimento, notacao_movimento
 from src.core.constantes import (
     LARGURA,  # Apenas LARGURA é usada diretamente aqui para botões  # noqa: E402
 )
@@ -53,6 +55,7 @@ class QuoridorGUI:
         self.parede_orientacao = 'h'  # 'h' para horizontal, 'v' para vertical
         self.parede_temp_pos = None  # Posição (col, row) para preview da parede
         self.ai_is_thinking = False  # Trava para impedir chamadas repetidas da IA
+        self.ponderador = None  # Busca do Minimax durante a vez do humano, se ativada
 
         # Inicializa os agentes de IA
         self.q_learning_agent = self._carregar_q_learning_agent()
@@ -91,7 +94,7 @@ class QuoridorGUI:
             caminho_modelo_recente = max(lista_arquivos, key=os.path.getmtime)
 
             agent = AgenteQLearningTabular(
-                taxa_aprendizado=0, epsilon=0, fator_desconto=0
+                taxa_aprendizado=0, epsilon=0, fator_desconto=0, dimensoes_tabuleiro=(5, 5)
             )
             agent.carregar_q_tabela(caminho_modelo_recente)
             return agent
@@ -107,6 +110,9 @@ class QuoridorGUI:
         self.turno = 0
         self.mensagem = f"Modo: {mode.value}"
         self.ai_is_thinking = False
+        if self.ponderador is not None:
+            self.ponderador.parar()
+        self.ponderador = Ponderador() if config.PONDERACAO and mode == GameMode.HUMAN_VS_MINIMAX else None
 
         if mode == GameMode.HUMAN_VS_HUMAN:
             self.human_players = [0, 1]
@@ -154,12 +160,14 @@ class QuoridorGUI:
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.colocando_parede:
             if self.parede_temp_pos:
                 col, row = self.parede_temp_pos
-                letra_coluna = chr(ord('a') + col)
-                numero_linha = str(row + 1)
-                notacao_parede = f"{letra_coluna}{numero_linha}{self.parede_orientacao}"
-                movimento_tupla = ('parede', notacao_parede)
+                # A parede vertical do preview fica à direita da coluna do mouse,
+                # e na notação a coluna de uma parede 'v' é a da direita
+                coluna_parede = col + 1 if self.parede_orientacao == 'v' else col
+                movimento = codificar_parede(
+                    row, coluna_parede, self.parede_orientacao, self.jogo.linhas, self.jogo.colunas
+                )
 
-                if self.jogo.aplicar_movimento(movimento_tupla, self.turno):
+                if movimento is not None and self.jogo.aplicar_movimento(movimento, self.turno):
                     self.mensagem = f"Jogador {self.turno + 1} colocou uma parede."
                     self.turno = 1 - self.turno
                 else:
@@ -199,8 +207,8 @@ class QuoridorGUI:
                     movimento_str = "d"
 
                 if movimento_str:
-                    movimento_tupla = ('mover', movimento_str)
-                    if self.jogo.aplicar_movimento(movimento_tupla, self.turno):
+                    movimento = codificar_direcao(self.jogo, movimento_str, self.turno)
+                    if movimento is not None and self.jogo.aplicar_movimento(movimento, self.turno):
                         self.mensagem = f"Jogador {self.turno + 1} moveu o peão."
                         self.turno = 1 - self.turno
                     else:
@@ -212,6 +220,8 @@ class QuoridorGUI:
             self.game_state = GameState.GAME_OVER
             vencedor_num = 1 if self.jogo.vencedor == "J1" else 2
             self.mensagem = f"Fim de Jogo! Vencedor: Jogador {vencedor_num}"
+            if self.ponderador is not None:
+                self.ponderador.parar()
             return  # Fim do update, o jogo acabou.
 
         # Log de depuração para verificar o estado do turno e dos jogadores humanos
@@ -246,7 +256,7 @@ class QuoridorGUI:
     def _ai_turn(self):
         """Executa o movimento de uma das IAs, dependendo do modo de jogo."""
         self.ai_is_thinking = True
-        movimento_tupla = None
+        movimento = None
         jogador_idx = self.turno
         agent_name = ""
 
@@ -255,7 +265,10 @@ class QuoridorGUI:
             if self.game_mode == GameMode.HUMAN_VS_MINIMAX and jogador_idx == 1:
                 agent_name = "Minimax"
                 print(f"Turno do {agent_name} (Jogador {jogador_idx + 1})")
-                movimento_tupla = escolher_movimento_ai(self.jogo, jogador_idx, profundidade=2)
+                if self.ponderador is not None:
+                    movimento = self.ponderador.escolher_movimento(self.jogo, jogador_idx, profundidade=2)
+                else:
+                    movimento = escolher_movimento_ai(self.jogo, jogador_idx, profundidade=2)
 
             # Modo: Humano vs. Q-Learning
             elif self.game_mode == GameMode.HUMAN_VS_Q_LEARNING and jogador_idx == 1:
@@ -264,7 +277,7 @@ class QuoridorGUI:
                     print(f"Turno do {agent_name} (Jogador {jogador_idx + 1})")
                     estado = self.jogo.get_estado_tupla(jogador_idx)
                     acoes_validas = self.jogo.get_acoes_validas(jogador_idx)
-                    movimento_tupla = self.q_learning_agent.escolher_acao(estado, acoes_validas)
+                    movimento = self.q_learning_agent.escolher_acao(estado, acoes_validas)
                 else:
                     print("ERRO: Agente Q-Learning não foi carregado.")
 
@@ -276,24 +289,29 @@ class QuoridorGUI:
                         print(f"Turno do {agent_name} (Jogador {jogador_idx + 1})")
                         estado = self.jogo.get_estado_tupla(jogador_idx)
                         acoes_validas = self.jogo.get_acoes_validas(jogador_idx)
-                        movimento_tupla = self.q_learning_agent.escolher_acao(estado, acoes_validas)
+                        movimento = self.q_learning_agent.escolher_acao(estado, acoes_validas)
                     else:
                         print("ERRO: Agente Q-Learning não foi carregado.")
                 else:  # Vez do Minimax (J2)
                     agent_name = "Minimax"
                     print(f"Turno do {agent_name} (Jogador {jogador_idx + 1})")
-                    movimento_tupla = escolher_movimento_ai(self.jogo, jogador_idx, profundidade=2)
+                    movimento = escolher_movimento_ai(self.jogo, jogador_idx, profundidade=2)
 
             # Aplica o movimento se um foi escolhido pela IA
-            if movimento_tupla:
-                sucesso = self.jogo.aplicar_movimento(movimento_tupla, jogador_idx)
+            if movimento is not None:
+                sucesso = self.jogo.aplicar_movimento(movimento, jogador_idx)
                 if sucesso:
-                    tipo_mov, valor_mov = movimento_tupla
+                    linhas, colunas = self.jogo.linhas, self.jogo.colunas
+                    tipo_mov, _ = decodificar_movimento(movimento, linhas, colunas)
+                    valor_mov = notacao_movimento(movimento, linhas, colunas)
                     acao_desc = f"moveu para {valor_mov}" if tipo_mov == 'mover' else f"colocou parede em {valor_mov}"
                     self.mensagem = f"IA ({agent_name}) jogou: {acao_desc}"
                     self.turno = 1 - self.turno
+                    if self.ponderador is not None and agent_name == "Minimax":
+                        # Continua buscando enquanto o humano pensa
+                        self.ponderador.iniciar(self.jogo, jogador_idx)
                 else:
-                    self.mensagem = f"ERRO CRÍTICO: IA ({agent_name}) gerou mov. inválido: {movimento_tupla}"
+                    self.mensagem = f"ERRO CRÍTICO: IA ({agent_name}) gerou mov. inválido: {movimento}"
                     print(self.mensagem)
             elif agent_name:  # Se um agente deveria jogar mas não retornou movimento
                 self.mensagem = f"AVISO: {agent_name} não retornou um movimento. Passando o turno."
@@ -323,6 +341,8 @@ class QuoridorGUI:
             self._draw()
             self.clock.tick(30)
 
+        if self.ponderador is not None:
+            self.ponderador.parar()
         pygame.quit()
         sys.exit()
 
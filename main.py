@@ -2,6 +2,7 @@ import sys
 import os
 
 from gui.quoridor_gui import QuoridorGUI
+from src.utils.log import configurar_verbosidade
 
 # Garante que o diretório raiz do projeto esteja no sys.path
 # para que as importações de 'src' e 'gui' funcionem corretamente.
@@ -10,6 +11,8 @@ if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
 if __name__ == "__main__":
+    # Nível de log definido por QUORIDOR_VERBOSIDADE ('silencioso', 'erro', 'aviso', 'info', 'debug')
+    configurar_verbosidade()
     # Instancia e executa a interface gráfica do jogo
     gui = QuoridorGUI()
     gui.run()
\ No newline at end of file
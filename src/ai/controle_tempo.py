@@ -0,0 +1,63 @@
+# Controle de tempo e de nós da busca.
+#
+# O negamax_alfabeta chama relogio.contar_no() em cada nó; quando o prazo ou o
+# orçamento de nós se esgota, BuscaInterrompida é lançada e sobe até a raiz.
+# Os movimentos são desfeitos no caminho (try/finally), então o jogo volta
+# intacto e o aprofundamento iterativo usa o resultado da última iteração completa.
+
+import time
+
+# A cada quantos nós o relógio é consultado. Um nó interno gera e valida todas as
+# paredes, então mesmo um intervalo pequeno custa pouco perto da busca
+INTERVALO_VERIFICACAO = 32
+
+
+class BuscaInterrompida(Exception):
+    """Lançada dentro da busca quando o tempo ou o orçamento de nós se esgota."""
+
+
+class RelogioBusca:
+    """Prazo e orçamento de nós de uma busca."""
+
+    def __init__(self, tempo_limite=None, limite_nos=None, intervalo=INTERVALO_VERIFICACAO):
+        """
+        Args:
+            tempo_limite (float | None): Tempo máximo em segundos a partir da criação do relógio.
+            limite_nos (int | None): Número máximo de nós visitados.
+            intervalo (int): A cada quantos nós o tempo é verificado.
+        """
+        self.inicio = time.time()
+        self.prazo = self.inicio + tempo_limite if tempo_limite is not None else None
+        self.limite_nos = limite_nos
+        self.intervalo = intervalo
+        self.nos = 0
+        self.interrompida = False
+        # Pedido de parada vindo de fora da busca (ver interromper)
+        self.parada_pedida = False
+
+    def tempo_decorrido(self):
+        return time.time() - self.inicio
+
+    def interromper(self):
+        """Pede que a busca pare na próxima verificação; pode ser chamado de outra thread."""
+        self.parada_pedida = True
+
+    def esgotado(self):
+        """True se o prazo ou o orçamento de nós já acabou (verificação completa, sem lançar)."""
+        if self.parada_pedida:
+            return True
+        if self.limite_nos is not None and self.nos >= self.limite_nos:
+            return True
+        return self.prazo is not None and time.time() >= self.prazo
+
+    def contar_no(self):
+        """Conta um nó e lança BuscaInterrompida se o limite foi atingido."""
+        self.nos += 1
+        if self.limite_nos is not None and self.nos > self.limite_nos:
+            self.interrompida = True
+            raise BuscaInterrompida()
+        if self.nos % self.intervalo == 0 and (
+            self.parada_pedida or (self.prazo is not None and time.time() >= self.prazo)
+        ):
+            self.interrompida = True
+            raise BuscaInterrompida()
@@ -0,0 +1,195 @@
+# Final de corrida: quando o oponente não tem mais paredes.
+#
+# Sem paredes para colocar, o jogo vira uma corrida de peões sobre uma configuração
+# de paredes fixa. Os estados são só as posições dos dois peões e a vez (no máximo
+# 81 * 80 * 2 no 9x9), então a corrida é resolvida de forma exata por análise
+# retrógrada, uma vez por configuração de paredes, já levando em conta saltos e
+# bloqueios entre os peões. Quem vence a corrida com o oponente sem paredes vence o
+# jogo só correndo; se os dois estão sem paredes, a corrida é o próprio jogo.
+
+from collections import deque
+
+from src.core.movimentos import destino_andar
+from src.utils.log import obter_logger
+
+logger = obter_logger(__name__)
+
+# Resultado para o jogador da vez
+DESCONHECIDO = 0  # Nenhum dos dois consegue forçar a chegada (repetição)
+VITORIA = 1
+DERROTA = 2
+
+# Devolvido por movimento_corrida quando a posição está decidida e o jogador da vez
+# não tem jogada (peão cercado e sem paredes): não há movimento nem o que buscar
+SEM_JOGADA = -1
+
+# Corridas resolvidas guardadas em cache (uma por configuração de paredes)
+LIMITE_CACHE_CORRIDAS = 8
+_CORRIDAS = {}
+
+
+class _Posicoes:
+    """Apenas o que destino_andar consulta do jogo, com os peões em casas arbitrárias."""
+
+    def __init__(self, jogo):
+        self.linhas = jogo.linhas
+        self.colunas = jogo.colunas
+        self.tabuleiro = jogo.tabuleiro
+        self.jogadores = {"J1": None, "J2": None}
+
+
+def _destinos(posicoes, casa_j1, casa_j2, vez):
+    """Casas para onde o peão da vez pode andar, pelas mesmas regras do jogo."""
+    colunas = posicoes.colunas
+    posicoes.jogadores["J1"] = divmod(casa_j1, colunas)
+    posicoes.jogadores["J2"] = divmod(casa_j2, colunas)
+    destinos = []
+    for direcao in ("w", "s", "a", "d"):
+        destino = destino_andar(posicoes, direcao, vez)
+        if destino is not None:
+            destinos.append(destino[0] * colunas + destino[1])
+    return destinos
+
+
+def resolver_corrida(jogo):
+    """
+    Resolve a corrida de peões para a configuração de paredes atual (com cache).
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual; só as paredes e o tamanho do tabuleiro importam.
+
+    Returns:
+        tuple: (resultados, distancias), listas indexadas por
+            (casa_j1 * casas + casa_j2) * 2 + vez. resultados[i] é VITORIA, DERROTA ou
+            DESCONHECIDO para o jogador da vez e distancias[i] o número de jogadas até o
+            fim com jogo ótimo (vencer o mais rápido, perder o mais devagar).
+    """
+    tabuleiro = jogo.tabuleiro
+    chave = (jogo.linhas, jogo.colunas, tabuleiro.paredes_h, tabuleiro.paredes_v)
+    corrida = _CORRIDAS.get(chave)
+    if corrida is not None:
+        return corrida
+
+    casas = jogo.linhas * jogo.colunas
+    ultima_linha = (jogo.linhas - 1) * jogo.colunas
+    total = casas * casas * 2
+    resultados = [DESCONHECIDO] * total
+    distancias = [0] * total
+    pendentes = [0] * total
+    antecessores = [[] for _ in range(total)]
+    fila = deque()
+    posicoes = _Posicoes(jogo)
+
+    for casa_j1 in range(casas):
+        for casa_j2 in range(casas):
+            if casa_j1 == casa_j2:
+                continue
+            for vez in (0, 1):
+                estado = (casa_j1 * casas + casa_j2) * 2 + vez
+                # Quem chegou ao objetivo venceu na jogada anterior
+                if casa_j1 >= ultima_linha or casa_j2 < jogo.colunas:
+                    resultados[estado] = DERROTA
+                    fila.append(estado)
+                    continue
+                destinos = _destinos(posicoes, casa_j1, casa_j2, vez)
+                if not destinos:
+                    # Sem movimento de peão (e sem paredes) o jogador não tem jogada
+                    resultados[estado] = DERROTA
+                    fila.append(estado)
+                    continue
+                pendentes[estado] = len(destinos)
+                for destino in destinos:
+                    if vez == 0:
+                        sucessor = (destino * casas + casa_j2) * 2 + 1
+                    else:
+                        sucessor = (casa_j1 * casas + destino) * 2
+                    antecessores[sucessor].append(estado)
+
+    # Análise retrógrada em ordem de distância: perder em n torna o antecessor uma
+    # vitória em n + 1; um estado é derrota quando todos os sucessores são vitórias
+    while fila:
+        estado = fila.popleft()
+        for anterior in antecessores[estado]:
+            if resultados[anterior] != DESCONHECIDO:
+                continue
+            if resultados[estado] == DERROTA:
+                resultados[anterior] = VITORIA
+                distancias[anterior] = distancias[estado] + 1
+                fila.append(anterior)
+            else:
+                pendentes[anterior] -= 1
+                if pendentes[anterior] == 0:
+                    resultados[anterior] = DERROTA
+                    distancias[anterior] = distancias[estado] + 1
+                    fila.append(anterior)
+
+    if len(_CORRIDAS) >= LIMITE_CACHE_CORRIDAS:
+        _CORRIDAS.clear()
+    corrida = (resultados, distancias)
+    _CORRIDAS[chave] = corrida
+    return corrida
+
+
+def movimento_corrida(jogo, turno):
+    """
+    Movimento de corrida ótimo, se a posição já estiver decidida pela corrida de peões.
+
+    A corrida decide quando o oponente não tem mais paredes e o jogador da vez vence a
+    corrida (as próprias paredes não são necessárias), ou quando nenhum dos dois tem
+    paredes (a corrida é o jogo inteiro; perdendo, o movimento adia a derrota ao máximo).
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual (não é alterado).
+        turno (int): Jogador da vez (0 para J1, 1 para J2).
+
+    Returns:
+        int | None: Movimento de peão codificado (ver codificacao.py), SEM_JOGADA se a
+            posição estiver decidida mas o jogador não tiver jogada, ou None se a posição
+            não for de corrida decidida e precisar de busca.
+    """
+    jogador = "J1" if turno == 0 else "J2"
+    oponente = "J2" if turno == 0 else "J1"
+    if jogo.paredes_restantes[oponente] > 0:
+        return None
+    if jogo.verificar_vitoria_jogador("J1") or jogo.verificar_vitoria_jogador("J2"):
+        return None
+
+    resultados, distancias = resolver_corrida(jogo)
+    casas = jogo.linhas * jogo.colunas
+    casa_j1, casa_j2 = jogo.tabuleiro.pos_j1, jogo.tabuleiro.pos_j2
+    estado = (casa_j1 * casas + casa_j2) * 2 + turno
+    resultado = resultados[estado]
+    if resultado == DESCONHECIDO:
+        return None
+    if resultado == DERROTA and jogo.paredes_restantes[jogador] > 0:
+        # Perde a corrida, mas ainda pode mudar os caminhos com as próprias paredes
+        return None
+
+    melhor_movimento = None
+    melhor_distancia = None
+    for destino in _destinos(_Posicoes(jogo), casa_j1, casa_j2, turno):
+        if turno == 0:
+            sucessor = (destino * casas + casa_j2) * 2 + 1
+        else:
+            sucessor = (casa_j1 * casas + destino) * 2
+        if resultado == VITORIA:
+            # Vitória mais rápida: um sucessor perdido pelo oponente
+            if resultados[sucessor] == DERROTA and (
+                melhor_distancia is None or distancias[sucessor] < melhor_distancia
+            ):
+                melhor_movimento, melhor_distancia = destino, distancias[sucessor]
+        elif melhor_distancia is None or distancias[sucessor] > melhor_distancia:
+            # Derrota mais lenta
+            melhor_movimento, melhor_distancia = destino, distancias[sucessor]
+
+    if melhor_movimento is None:
+        logger.debug("Corrida decidida para %s: sem jogada", jogador)
+        return SEM_JOGADA
+
+    logger.debug(
+        "Corrida decidida para %s: %s em %d jogadas",
+        jogador,
+        "vitória" if resultado == VITORIA else "derrota",
+        distancias[estado],
+    )
+    return melhor_movimento
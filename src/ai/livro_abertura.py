@@ -0,0 +1,256 @@
+# Livro de aberturas gerado por busca.
+#
+# gerar_livro percorre as primeiras jogadas a partir da posição inicial: cada
+# posição é analisada com uma busca profunda (várias posições em paralelo, uma por
+# processo) e o livro guarda o melhor movimento encontrado. Da posição seguem o
+# melhor movimento e as melhores alternativas, para cobrir as respostas mais
+# prováveis do oponente.
+#
+# O arquivo é indexado pela chave Zobrist da posição, que só depende do tamanho do
+# tabuleiro (ver zobrist.py), e tem entradas de tamanho fixo ordenadas pela chave:
+#
+#   cabeçalho | (chave de 8 bytes, movimento de 2 bytes) * num_entradas
+#
+# A consulta mapeia o arquivo com mmap e faz busca binária, como tablebase.py.
+
+import mmap
+import os
+import struct
+
+from src.core.game import JogoQuoridor
+from src.core.movimento_util import gerar_movimentos_possiveis
+from src.utils.log import obter_logger
+from .ordenacao import HeuristicasOrdenacao
+from .transposicao import TabelaTransposicao
+
+logger = obter_logger(__name__)
+
+# Pasta e nome padrão dos arquivos gerados por gerar_livro_abertura.py
+PASTA_LIVROS = "livros_abertura"
+
+MAGIA = b"QLIV"
+VERSAO = 1
+# magia, versão, linhas, colunas, paredes por jogador, número de entradas
+FORMATO_CABECALHO = "<4sBBBBI"
+TAMANHO_CABECALHO = struct.calcsize(FORMATO_CABECALHO)
+FORMATO_ENTRADA = "<QH"
+TAMANHO_ENTRADA = struct.calcsize(FORMATO_ENTRADA)
+
+
+def nome_arquivo(linhas, colunas, paredes):
+    return f"abertura_{linhas}x{colunas}_{paredes}p.qlv"
+
+
+def chave_posicao(jogo, turno):
+    """Chave Zobrist da posição com o jogador da vez ``turno`` (mesmo que jogo.lado_a_jogar seja outro)."""
+    chave = jogo.hash_zobrist
+    if jogo.lado_a_jogar != turno:
+        chave ^= jogo.zobrist["lado"]
+    return chave
+
+
+def _posicao(linhas, colunas, paredes, sequencia):
+    """Jogo na posição alcançada pela sequência de movimentos a partir do início, e o turno."""
+    jogo = JogoQuoridor(linhas=linhas, colunas=colunas, total_paredes_jogador=paredes)
+    turno = 0
+    for movimento in sequencia:
+        jogo.fazer_movimento(movimento, turno, validar=False)
+        turno = 1 - turno
+    return jogo, turno
+
+
+# Executado nos processos de trabalho do pool (ver paralelo.obter_pool): os ``largura``
+# melhores movimentos da posição, do melhor para o pior. Cada um é o melhor da raiz sem
+# os anteriores (aprofundamento iterativo sem limite de tempo até a profundidade pedida),
+# já que só o valor do melhor movimento de uma busca alfa-beta é exato. A busca usa
+# tabelas novas, para o livro não depender de qual processo analisou a posição; as de
+# minimax.py são restauradas no fim, já que com num_processos == 1 elas são as do agente
+def _analisar_posicao(tarefa):
+    from . import minimax
+
+    tabela, heuristicas = minimax.transposition_table, minimax.heuristicas
+    minimax.transposition_table = TabelaTransposicao()
+    minimax.heuristicas = HeuristicasOrdenacao(heuristicas.ordenacao_estatica)
+    try:
+        return _melhores_movimentos(tarefa)
+    finally:
+        minimax.transposition_table, minimax.heuristicas = tabela, heuristicas
+
+
+def _melhores_movimentos(tarefa):
+    from . import minimax
+
+    linhas, colunas, paredes, sequencia, profundidade, largura = tarefa
+    jogo, turno = _posicao(linhas, colunas, paredes, sequencia)
+    restantes = gerar_movimentos_possiveis(jogo, turno)
+    melhores = []
+    while restantes and len(melhores) < largura:
+        variacao_principal = []
+        valores_raiz = {}
+        melhor_jogada, valor = None, float("-inf")
+        for profundidade_atual in range(1, profundidade + 1):
+            melhor_jogada, valor = minimax.melhor_jogada_agente_poda(
+                jogo, turno, profundidade_atual, variacao_principal=variacao_principal,
+                valores_raiz=valores_raiz, movimentos_raiz=restantes
+            )
+            variacao_principal = [melhor_jogada]
+        melhores.append((melhor_jogada, valor))
+        restantes.remove(melhor_jogada)
+    return melhores
+
+
+def gerar_livro(linhas, colunas, paredes, plies, profundidade, largura=3, num_processos=1):
+    """
+    Gera o livro de aberturas de uma variante.
+
+    Args:
+        linhas (int): Linhas do tabuleiro.
+        colunas (int): Colunas do tabuleiro.
+        paredes (int): Paredes por jogador.
+        plies (int): Número de jogadas (dos dois jogadores) cobertas pelo livro.
+        profundidade (int): Profundidade da busca de cada posição.
+        largura (int): Movimentos seguidos a partir de cada posição (o melhor e as
+            largura - 1 melhores alternativas).
+        num_processos (int): Processos que analisam as posições de cada jogada em paralelo.
+
+    Returns:
+        dict: {chave_posicao: movimento codificado}
+    """
+    livro = {}
+    fronteira = [()]
+    for ply in range(plies):
+        # Posições repetidas por transposição são analisadas uma vez só
+        posicoes = {}
+        for sequencia in fronteira:
+            jogo, turno = _posicao(linhas, colunas, paredes, sequencia)
+            if jogo.verificar_vitoria_jogador("J1") or jogo.verificar_vitoria_jogador("J2"):
+                continue
+            chave = chave_posicao(jogo, turno)
+            if chave not in livro and chave not in posicoes:
+                posicoes[chave] = sequencia
+        if not posicoes:
+            break
+
+        tarefas = [(linhas, colunas, paredes, sequencia, profundidade, largura) for sequencia in posicoes.values()]
+        if num_processos > 1:
+            from .paralelo import obter_pool
+
+            resultados = obter_pool(num_processos).map(_analisar_posicao, tarefas)
+        else:
+            resultados = map(_analisar_posicao, tarefas)
+
+        fronteira = []
+        for (chave, sequencia), melhores in zip(posicoes.items(), resultados):
+            if not melhores:
+                continue
+            livro[chave] = melhores[0][0]
+            for movimento, _ in melhores:
+                fronteira.append(sequencia + (movimento,))
+        logger.info("Jogada %d: %d posições analisadas, %d no livro", ply + 1, len(posicoes), len(livro))
+    return livro
+
+
+def salvar_livro(caminho, linhas, colunas, paredes, livro):
+    """Grava o resultado de gerar_livro no formato lido por LivroAbertura."""
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(struct.pack(FORMATO_CABECALHO, MAGIA, VERSAO, linhas, colunas, paredes, len(livro)))
+        for chave in sorted(livro):
+            arquivo.write(struct.pack(FORMATO_ENTRADA, chave, livro[chave]))
+
+
+class LivroAbertura:
+    """Consulta a um arquivo gerado por salvar_livro, mapeado em memória com mmap."""
+
+    def __init__(self, caminho):
+        """
+        Args:
+            caminho (str): Arquivo do livro.
+
+        Raises:
+            ValueError: Se o arquivo não for um livro de aberturas desta versão.
+        """
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, versao, linhas, colunas, paredes, num_entradas = struct.unpack_from(
+            FORMATO_CABECALHO, self._mapa, 0
+        )
+        if magia != MAGIA or versao != VERSAO:
+            self._mapa.close()
+            raise ValueError(f"Arquivo de livro de aberturas inválido: {caminho}")
+        self.linhas = linhas
+        self.colunas = colunas
+        self.paredes = paredes
+        self._num_entradas = num_entradas
+
+    def __len__(self):
+        return self._num_entradas
+
+    def fechar(self):
+        self._mapa.close()
+
+    def consultar(self, jogo, turno):
+        """
+        Movimento do livro para a posição.
+
+        Args:
+            jogo (JogoQuoridor): Jogo atual.
+            turno (int): Jogador da vez (0 para J1, 1 para J2).
+
+        Returns:
+            int | None: Movimento codificado (ver codificacao.py), ou None se a posição
+                não estiver no livro.
+        """
+        if (jogo.linhas, jogo.colunas) != (self.linhas, self.colunas):
+            return None
+        if jogo.estado_inicial_paredes_restantes["J1"] != self.paredes:
+            return None
+        chave = chave_posicao(jogo, turno)
+        baixo, alto = 0, self._num_entradas
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            atual, movimento = struct.unpack_from(
+                FORMATO_ENTRADA, self._mapa, TAMANHO_CABECALHO + meio * TAMANHO_ENTRADA
+            )
+            if atual < chave:
+                baixo = meio + 1
+            elif atual > chave:
+                alto = meio
+            else:
+                return movimento
+        return None
+
+
+# Livros já abertos por variante (None quando não há arquivo)
+_LIVROS = {}
+
+
+def movimento_livro(jogo, turno, pasta=PASTA_LIVROS):
+    """
+    Movimento do livro de aberturas da variante do jogo, se o arquivo existir.
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual (não é alterado).
+        turno (int): Jogador da vez (0 para J1, 1 para J2).
+        pasta (str): Pasta dos arquivos gerados por gerar_livro_abertura.py.
+
+    Returns:
+        int | None: Movimento codificado, ou None se não houver livro para a variante,
+            a posição não estiver nele ou o movimento não for legal (colisão de chaves).
+    """
+    paredes = jogo.estado_inicial_paredes_restantes["J1"]
+    caminho = os.path.join(pasta, nome_arquivo(jogo.linhas, jogo.colunas, paredes))
+    if caminho not in _LIVROS:
+        _LIVROS[caminho] = LivroAbertura(caminho) if os.path.exists(caminho) else None
+    livro = _LIVROS[caminho]
+    if livro is None:
+        return None
+    movimento = livro.consultar(jogo, turno)
+    if movimento is None:
+        return None
+    token = jogo.fazer_movimento(movimento, turno)
+    if token is None:
+        logger.debug("Movimento %s do livro é ilegal nesta posição", movimento)
+        return None
+    jogo.desfazer_movimento(token)
+    logger.debug("Movimento %s do livro de aberturas", movimento)
+    return movimento
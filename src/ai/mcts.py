@@ -0,0 +1,298 @@
+# Agente Monte Carlo Tree Search (UCT).
+#
+# Com ~130 movimentos por nó no 9x9, o minimax não passa de poucas jogadas de
+# profundidade; o MCTS concentra as simulações nos ramos promissores e pode ser
+# interrompido a qualquer momento. Três adaptações ao Quoridor:
+# - alargamento progressivo: um nó expande todos os peões, mas só libera as paredes
+#   (ordenadas pelo aumento no caminho do oponente) conforme acumula visitas;
+# - rollouts baratos: o peão segue o menor caminho (campo_distancias), com paredes
+#   ocasionais no caminho do oponente, e o rollout longo termina numa corrida;
+# - paralelismo na raiz: cada processo constrói a própria árvore com outra semente
+#   e as visitas dos movimentos da raiz são somadas.
+
+import math
+import random
+
+from src.core.caminho import campo_distancias
+from src.core.codificacao import notacao_movimento
+from src.core.movimento_util import gerar_movimentos_possiveis, movimentos_peao
+from src.core.paredes_candidatas import POLITICA_AUMENTAM, slots_candidatos
+from src.utils.log import obter_logger
+from .controle_tempo import RelogioBusca
+from .corrida import SEM_JOGADA
+from .minimax import movimento_sem_busca
+
+logger = obter_logger(__name__)
+
+# Constante de exploração do UCT (resultados em [0, 1])
+CONSTANTE_UCT = 1.0
+
+# Alargamento progressivo: um nó com n visitas pode ter
+# CONSTANTE_ALARGAMENTO * n ** EXPOENTE_ALARGAMENTO paredes expandidas
+CONSTANTE_ALARGAMENTO = 1.0
+EXPOENTE_ALARGAMENTO = 0.5
+
+# Rollouts: chance de colocar parede a cada vez e número máximo de jogadas antes
+# de decidir o resultado pela corrida dos menores caminhos
+PROBABILIDADE_PAREDE_ROLLOUT = 0.1
+LIMITE_ROLLOUT = 40
+
+# Tempo padrão quando nem tempo_limite nem limite_simulacoes são informados
+TEMPO_PADRAO = 1.5
+
+
+class NoMCTS:
+    """Nó da árvore: estatísticas do ponto de vista de quem fez o movimento que leva a ele."""
+
+    def __init__(self, movimento, pai, turno):
+        """
+        Args:
+            movimento (int | None): Movimento que leva do pai a este nó (None na raiz).
+            pai (NoMCTS | None): Nó pai.
+            turno (int): Jogador da vez neste nó (0 para J1, 1 para J2).
+        """
+        self.movimento = movimento
+        self.pai = pai
+        self.turno = turno
+        self.filhos = []
+        self.visitas = 0
+        self.vitorias = 0
+        # Movimentos ainda não expandidos; calculados na primeira expansão
+        self.peoes = None
+        self.paredes = None
+        self.paredes_expandidas = 0
+
+    def proximo_movimento(self, jogo):
+        """
+        Próximo movimento a expandir (o jogo deve estar no estado deste nó), ou None se o
+        alargamento progressivo ainda não libera nenhum.
+        """
+        if self.peoes is None:
+            self.peoes = movimentos_peao(jogo, self.turno)
+        if self.peoes:
+            return self.peoes.pop()
+
+        jogador = "J1" if self.turno == 0 else "J2"
+        if jogo.paredes_restantes[jogador] <= 0:
+            return None
+        permitidas = int(CONSTANTE_ALARGAMENTO * self.visitas ** EXPOENTE_ALARGAMENTO)
+        if self.paredes_expandidas >= permitidas:
+            return None
+        if self.paredes is None:
+            self.paredes = _paredes_ordenadas(jogo, self.turno)
+        if self.paredes_expandidas >= len(self.paredes):
+            return None
+        movimento = self.paredes[self.paredes_expandidas]
+        self.paredes_expandidas += 1
+        return movimento
+
+    def selecionar_filho(self):
+        """Filho com o maior valor UCT."""
+        log_visitas = math.log(self.visitas)
+        return max(
+            self.filhos,
+            key=lambda filho: filho.vitorias / filho.visitas
+            + CONSTANTE_UCT * math.sqrt(log_visitas / filho.visitas),
+        )
+
+
+# Paredes que aumentam o menor caminho do oponente, da que mais aumenta para a que menos
+def _paredes_ordenadas(jogo, turno):
+    casas = jogo.linhas * jogo.colunas
+    movimentos = gerar_movimentos_possiveis(jogo, turno, ordenar=True, politica_paredes=POLITICA_AUMENTAM)
+    return [movimento for movimento in movimentos if movimento >= casas]
+
+
+# Jogador (0 ou 1) que já chegou ao objetivo, ou None. fazer_movimento não atualiza
+# jogo.vencedor, então a chegada é verificada pelas posições
+def _vencedor(jogo):
+    if jogo.verificar_vitoria_jogador("J1"):
+        return 0
+    if jogo.verificar_vitoria_jogador("J2"):
+        return 1
+    return None
+
+
+# Jogador (0 ou 1) que vence a corrida se ninguém mais colocar paredes: quem está
+# na vez vence com distância menor ou igual à do oponente
+def _vencedor_corrida(jogo, turno):
+    tabuleiro = jogo.tabuleiro
+    distancia_j1 = campo_distancias("J1", tabuleiro)[tabuleiro.pos_j1]
+    distancia_j2 = campo_distancias("J2", tabuleiro)[tabuleiro.pos_j2]
+    if turno == 0:
+        return 0 if distancia_j1 <= distancia_j2 else 1
+    return 1 if distancia_j2 <= distancia_j1 else 0
+
+
+def _rollout(jogo, turno, rng):
+    """
+    Joga a partir do estado atual com a política de rollout e devolve o vencedor (0 ou 1).
+    O jogo é restaurado ao final.
+    """
+    tokens = []
+    try:
+        for _ in range(LIMITE_ROLLOUT):
+            vencedor = _vencedor(jogo)
+            if vencedor is not None:
+                return vencedor
+            jogador = "J1" if turno == 0 else "J2"
+            token = None
+            if jogo.paredes_restantes[jogador] > 0 and rng.random() < PROBABILIDADE_PAREDE_ROLLOUT:
+                # Parede aleatória entre as que cortam o menor caminho do oponente
+                candidatos = slots_candidatos(jogo, turno, POLITICA_AUMENTAM)
+                if candidatos:
+                    casas = jogo.linhas * jogo.colunas
+                    token = jogo.fazer_movimento(casas + rng.choice(candidatos), turno)
+            if token is None:
+                # Peão para a casa vizinha mais próxima do objetivo (empates ao acaso)
+                peoes = movimentos_peao(jogo, turno)
+                if not peoes:
+                    return 1 - turno
+                campo = campo_distancias(jogador, jogo.tabuleiro)
+                menor = min(campo[movimento] for movimento in peoes)
+                token = jogo.fazer_movimento(
+                    rng.choice([movimento for movimento in peoes if campo[movimento] == menor]), turno
+                )
+            tokens.append(token)
+            turno = 1 - turno
+        vencedor = _vencedor(jogo)
+        if vencedor is not None:
+            return vencedor
+        return _vencedor_corrida(jogo, turno)
+    finally:
+        for token in reversed(tokens):
+            jogo.desfazer_movimento(token)
+
+
+def _simular(jogo, raiz, rng):
+    """Uma iteração do MCTS: seleção, expansão, rollout e retropropagação."""
+    no = raiz
+    tokens = []
+    try:
+        while True:
+            vencedor = _vencedor(jogo)
+            if vencedor is not None:
+                break
+            movimento = no.proximo_movimento(jogo)
+            if movimento is not None:
+                # Expansão: o novo filho é avaliado por um rollout
+                filho = NoMCTS(movimento, no, 1 - no.turno)
+                no.filhos.append(filho)
+                tokens.append(jogo.fazer_movimento(movimento, no.turno, validar=False))
+                no = filho
+                vencedor = _vencedor(jogo)
+                if vencedor is None:
+                    vencedor = _rollout(jogo, no.turno, rng)
+                break
+            if not no.filhos:
+                vencedor = _rollout(jogo, no.turno, rng)
+                break
+            no = no.selecionar_filho()
+            tokens.append(jogo.fazer_movimento(no.movimento, no.pai.turno, validar=False))
+    finally:
+        for token in reversed(tokens):
+            jogo.desfazer_movimento(token)
+
+    while no is not None:
+        no.visitas += 1
+        if no.pai is not None and vencedor == no.pai.turno:
+            no.vitorias += 1
+        no = no.pai
+
+
+def buscar_mcts(jogo, turno, tempo_limite=None, limite_simulacoes=None, semente=None):
+    """
+    Constrói uma árvore MCTS a partir do estado atual (o jogo é restaurado ao final).
+
+    Args:
+        jogo: Estado atual do jogo
+        turno: Turno atual (0 para J1, 1 para J2)
+        tempo_limite: Tempo máximo em segundos (None para não limitar)
+        limite_simulacoes: Número máximo de simulações (None para não limitar)
+        semente: Semente do gerador aleatório dos rollouts
+
+    Returns:
+        Tupla (estatisticas, simulacoes): {movimento: (visitas, vitorias)} dos filhos da raiz
+        e o número de simulações feitas
+    """
+    rng = random.Random(semente)
+    relogio = RelogioBusca(tempo_limite)
+    raiz = NoMCTS(None, None, turno)
+    simulacoes = 0
+    while limite_simulacoes is None or simulacoes < limite_simulacoes:
+        if relogio.esgotado():
+            break
+        _simular(jogo, raiz, rng)
+        simulacoes += 1
+    estatisticas = {filho.movimento: (filho.visitas, filho.vitorias) for filho in raiz.filhos}
+    return estatisticas, simulacoes
+
+
+# Executado nos processos de trabalho do pool (ver paralelo.obter_pool)
+def _buscar_mcts_processo(tarefa):
+    jogo, turno, tempo_limite, limite_simulacoes, semente = tarefa
+    return buscar_mcts(jogo, turno, tempo_limite, limite_simulacoes, semente)
+
+
+def escolher_movimento_ai(jogo, turno, tempo_limite=TEMPO_PADRAO, limite_simulacoes=None, num_processos=1, semente=None):
+    """
+    Escolhe o movimento com MCTS: o filho da raiz mais visitado.
+
+    Args:
+        jogo: Estado atual do jogo
+        turno: Turno atual (0 para J1, 1 para J2)
+        tempo_limite: Tempo máximo em segundos (None para limitar só pelas simulações)
+        limite_simulacoes: Número máximo de simulações, somando todos os processos
+        num_processos: Com mais de um, cada processo constrói uma árvore independente
+            (paralelismo na raiz) e as visitas são somadas
+        semente: Semente dos rollouts (cada processo usa semente + índice)
+
+    Returns:
+        Melhor movimento encontrado, codificado como inteiro (ver src/core/codificacao.py),
+        ou None se não houver movimento legal
+    """
+    # Posição resolvida na tablebase, abertura do livro ou corrida já decidida:
+    # não há o que simular (os mesmos atalhos do minimax)
+    movimento = movimento_sem_busca(jogo, turno)
+    if movimento is not None:
+        return None if movimento == SEM_JOGADA else movimento
+
+    if tempo_limite is None and limite_simulacoes is None:
+        tempo_limite = TEMPO_PADRAO
+
+    if num_processos > 1:
+        from .paralelo import obter_pool
+
+        if semente is None:
+            semente = random.randrange(1 << 30)
+        limite_processo = None
+        if limite_simulacoes is not None:
+            limite_processo = max(1, limite_simulacoes // num_processos)
+        tarefas = [
+            (jogo, turno, tempo_limite, limite_processo, semente + indice)
+            for indice in range(num_processos)
+        ]
+        resultados = obter_pool(num_processos).map(_buscar_mcts_processo, tarefas)
+    else:
+        resultados = [buscar_mcts(jogo, turno, tempo_limite, limite_simulacoes, semente)]
+
+    visitas = {}
+    vitorias = {}
+    simulacoes = 0
+    for estatisticas, simulacoes_processo in resultados:
+        simulacoes += simulacoes_processo
+        for movimento, (n, w) in estatisticas.items():
+            visitas[movimento] = visitas.get(movimento, 0) + n
+            vitorias[movimento] = vitorias.get(movimento, 0) + w
+
+    if not visitas:
+        return None
+    melhor = max(visitas, key=lambda movimento: (visitas[movimento], vitorias[movimento]))
+    logger.info(
+        "MCTS: %d simulações, melhor movimento %s (%d visitas, %.0f%% de vitórias)",
+        simulacoes,
+        notacao_movimento(melhor, jogo.linhas, jogo.colunas),
+        visitas[melhor],
+        100.0 * vitorias[melhor] / visitas[melhor],
+    )
+    return melhor
@@ -1,96 +1,267 @@
-import time
-from src.core.movimento_util import gerar_movimentos_possiveis, criar_mover_info, aplicar_movimento, atualizar_mover_info, hash_estado, BEST_FIRST_MOVES
-from .minimax_core import melhor_jogada_agente_poda_com_valor
+import logging
+from functools import partial
+from src.core.movimento_util import gerar_movimentos_possiveis, gerar_movimentos_em_estagios, criar_mover_info, aplicar_movimento, atualizar_mover_info, hash_estado
+from src.core.paredes_candidatas import POLITICA_PADRAO
+from src.core.codificacao import notacao_movimento
+from src.utils.log import obter_logger
+from .controle_tempo import RelogioBusca
+from .corrida import SEM_JOGADA, movimento_corrida
+from .livro_abertura import movimento_livro
+from .minimax_core import extrair_variacao_principal, melhor_jogada_agente_poda_com_valor
+from .ordenacao import HeuristicasOrdenacao
+from .tablebase import movimento_tablebase
+from .transposicao import TabelaTransposicao
 
-# Tabela de transposição para armazenar estados já calculados
-# Formato: {hash_estado: (profundidade, valor, melhor_movimento)}
-transposition_table = {}
+logger = obter_logger(__name__)
+
+# Tabela de transposição para armazenar estados já calculados (tamanho fixo, ver transposicao.py)
+transposition_table = TabelaTransposicao()
+
+# Killer moves e history para ordenar os nós internos (ver ordenacao.py)
+heuristicas = HeuristicasOrdenacao()
+
+# Meia largura da janela de aspiração em torno do valor da profundidade anterior.
+# Entre profundidades pares e ímpares o valor costuma oscilar uma casa de diferença
+# nos caminhos (peso 2.5, ver utilidade.py), então a janela cobre um pouco mais que isso
+JANELA_ASPIRACAO = 3.0
+
+# Paredes consideradas nos nós internos (ver core/paredes_candidatas.py); a raiz
+# sempre considera todas. POLITICA_TODAS desliga o corte, para verificação
+POLITICA_PAREDES = POLITICA_PADRAO
+
+# Nos nós internos, gera os movimentos sob demanda (TT, peões, paredes killer, demais
+# paredes) em vez de validar todas as paredes antes do primeiro filho. Não vale com
+# heuristicas.ordenacao_estatica, que precisa da lista completa
+GERACAO_EM_ESTAGIOS = True
+
+# Late move reductions e poda de futilidade nos nós internos (ver minimax_core.py).
+# Ambas podem mudar a jogada escolhida; desligue para comparar a força do agente
+USAR_LMR = True
+USAR_FUTILIDADE = True
+
+# Movimento do livro de aberturas da variante (None fora do livro ou sem livro gerado)
+def movimento_de_abertura(jogo, turno):
+    return movimento_livro(jogo, turno)
+
+# Movimento decidido sem busca: posição resolvida na tablebase da variante, abertura
+# coberta pelo livro ou corrida já decidida (o oponente está sem paredes). None se
+# a posição precisa de busca; corrida.SEM_JOGADA se está decidida sem jogada possível
+def movimento_sem_busca(jogo, turno):
+    movimento = movimento_tablebase(jogo, turno)
+    if movimento is None:
+        movimento = movimento_de_abertura(jogo, turno)
+    if movimento is None:
+        movimento = movimento_corrida(jogo, turno)
+    return movimento
 
 # Implementação de aprofundamento iterativo (iterative deepening)
-def iterative_deepening(jogo, turno, tempo_limite=2.0, profundidade_maxima=6, usar_poda=True):
+def aprofundamento_iterativo(jogo, relogio, profundidade_maxima, buscar_profundidade):
+    """
+    Laço do aprofundamento iterativo, comum à busca sequencial e à paralela (paralelo.py).
+
+    Cada profundidade começa numa janela de aspiração centrada no valor da anterior e é
+    buscada de novo, abrindo o lado que falhou, enquanto o valor cair fora da janela.
+    Uma profundidade interrompida só substitui o resultado da anterior por um movimento
+    que comprovadamente a supere.
+
+    Args:
+        jogo: Estado atual do jogo (usado apenas no log da variação principal)
+        relogio: RelogioBusca da busca; o tempo e os nós são conferidos entre as buscas
+        profundidade_maxima: Profundidade máxima de busca
+        buscar_profundidade: Função (profundidade, alfa, beta, variacao_principal) que busca
+            a raiz na janela dada e devolve (melhor_jogada, valor, interrompida,
+            pv_concluida, variacao): pv_concluida diz se o movimento da variação principal
+            foi avaliado por completo e variacao é a nova variação principal (vazia se não
+            puder ser extraída). A profundidade 1 deve ser sempre concluída
+
+    Returns:
+        Melhor movimento encontrado, ou None se nenhuma profundidade produziu movimento
+    """
+    melhor_jogada_global = None
+    # Resultados da profundidade anterior, usados para ordenar a seguinte:
+    # a variação principal é buscada primeiro
+    variacao_principal = []
+    valor_anterior = None
+
+    # Começa com profundidade 1 e vai aumentando
+    for profundidade in range(1, profundidade_maxima + 1):
+        # Verifica se ainda há tempo disponível
+        if relogio.esgotado():
+            logger.debug("Tempo limite atingido na profundidade %d", profundidade - 1)
+            break
+
+        logger.debug("Buscando na profundidade %d...", profundidade)
+
+        # Janela de aspiração centrada no valor da profundidade anterior
+        if profundidade > 1 and valor_anterior is not None:
+            alfa, beta = valor_anterior - JANELA_ASPIRACAO, valor_anterior + JANELA_ASPIRACAO
+        else:
+            alfa, beta = float("-inf"), float("inf")
+
+        while True:
+            melhor_jogada, valor, interrompida, pv_concluida, variacao = buscar_profundidade(
+                profundidade, alfa, beta, variacao_principal
+            )
+            if interrompida or alfa < valor < beta or melhor_jogada is None:
+                # Sem movimento na raiz não há o que buscar de novo
+                break
+            if profundidade > 1 and relogio.esgotado():
+                # Sem tempo para buscar de novo: vale como busca interrompida (só um
+                # movimento que falhou alto substitui o da profundidade anterior)
+                interrompida = True
+                break
+            # Fora da janela: busca de novo abrindo o lado que falhou. Se esse lado já
+            # estava aberto (valor infinito, como numa posição decidida), o valor é exato
+            if valor <= alfa:
+                if alfa == float("-inf"):
+                    break
+                alfa = float("-inf")
+            else:
+                if beta == float("inf"):
+                    break
+                beta = float("inf")
+                # O movimento que falhou alto é buscado primeiro na nova busca
+                variacao_principal = [melhor_jogada]
+            logger.debug("Janela de aspiração falhou com valor %.2f; nova janela (%.2f, %.2f)", valor, alfa, beta)
+
+        if interrompida:
+            logger.debug("Busca interrompida na profundidade %d após %d nós", profundidade, relogio.nos)
+            # Só um movimento que supera o da variação principal, avaliado por completo,
+            # é preferível ao da iteração anterior; sem essa garantia, só vale um
+            # movimento acima do valor da iteração anterior
+            if melhor_jogada is not None and valor > alfa and (
+                pv_concluida or (valor_anterior is not None and valor > valor_anterior)
+            ):
+                melhor_jogada_global = melhor_jogada
+            break
+
+        # Atualiza o melhor movimento global
+        if melhor_jogada is not None:
+            melhor_jogada_global = melhor_jogada
+            valor_anterior = valor
+            variacao_principal = variacao or [melhor_jogada]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Profundidade %d: melhor movimento = %s, valor = %.2f, variação principal = %s",
+                    profundidade,
+                    melhor_jogada,
+                    valor,
+                    " ".join(notacao_movimento(m, jogo.linhas, jogo.colunas) for m in variacao_principal),
+                )
+
+    return melhor_jogada_global
+
+# Aprofundamento iterativo sequencial, buscando a raiz inteira neste processo
+def iterative_deepening(jogo, turno, tempo_limite=2.0, profundidade_maxima=6, usar_poda=True, usar_lote=False, limite_nos=None, politica_paredes=POLITICA_PAREDES, relogio=None):
     """
     Realiza busca com aprofundamento iterativo até atingir o tempo limite ou a profundidade máxima.
     
+    O tempo (e o orçamento de nós) é verificado também dentro da busca: uma iteração que
+    estoura o limite é interrompida e vale o resultado da última iteração completa, ou o
+    melhor movimento da raiz já avaliado por completo na iteração interrompida.
+    
     Args:
         jogo: Estado atual do jogo
         turno: Turno atual (0 para J1, 1 para J2)
-        tempo_limite: Tempo máximo em segundos para a busca
+        tempo_limite: Tempo máximo em segundos para a busca (None para não limitar)
         profundidade_maxima: Profundidade máxima de busca
         usar_poda: Se True, usa minimax com poda alfa-beta; se False, usa minimax padrão
+        usar_lote: Se True, valida as paredes em lote com NumPy na geração de movimentos
+        limite_nos: Número máximo de nós visitados na busca (None para não limitar)
+        politica_paredes: Política de paredes candidatas dos nós internos
+        relogio: RelogioBusca criado por quem chama, para poder interromper a busca de
+            fora (ver ponderacao.py); nesse caso tempo_limite e limite_nos são ignorados
     
     Returns:
         Melhor movimento encontrado até o momento
     """
-    jogador = 'J1' if turno == 0 else 'J2'
-    melhor_jogada_global = None
-    tempo_inicio = time.time()
+    if relogio is None:
+        relogio = RelogioBusca(tempo_limite, limite_nos)
     
-    # Limpar a tabela de transposição para cada nova busca
-    transposition_table.clear()
+    # A tabela de transposição é mantida entre as jogadas: os resultados da busca
+    # anterior continuam válidos, mas passam a ser os primeiros a ser substituídos
+    transposition_table.nova_busca()
+    heuristicas.nova_busca()
     
-    # Verifica se é a primeira jogada e usa movimentos otimizados de abertura
-    posicao_inicial_j1 = (0, 4)
-    posicao_inicial_j2 = (8, 4)
-    if jogo.jogadores['J1'] == posicao_inicial_j1 and jogo.jogadores['J2'] == posicao_inicial_j2:
-        movimento_otimizado = BEST_FIRST_MOVES[jogador][0]
-        movimentos_legais = gerar_movimentos_possiveis(jogo, turno, ordenar=False) # Não precisa ordenar aqui
-
-        if movimento_otimizado in movimentos_legais:
-            print(f"Usando movimento otimizado de abertura para {jogador}: {movimento_otimizado}")
-            return movimento_otimizado
-        else:
-            print(f"Movimento otimizado {movimento_otimizado} bloqueado. Buscando a melhor jogada..." )
+    # Sem movimento legal (peão cercado e sem paredes) não há busca a fazer
+    if not gerar_movimentos_possiveis(jogo, turno, ordenar=False, usar_lote=usar_lote):
+        logger.debug("Nenhum movimento legal para o jogador %d", turno + 1)
+        return None
     
-    # Começa com profundidade 1 e vai aumentando
-    for profundidade in range(1, profundidade_maxima + 1):
-        # Verifica se ainda há tempo disponível
-        if time.time() - tempo_inicio > tempo_limite:
-            print(f"Tempo limite atingido na profundidade {profundidade-1}")
-            break
-        
-        print(f"Buscando na profundidade {profundidade}...")
-        
-        # Busca o melhor movimento para a profundidade atual
-        melhor_jogada, valor = melhor_jogada_agente_poda(jogo, turno, profundidade)
-        
-        # Atualiza o melhor movimento global
-        if melhor_jogada is not None:
-            melhor_jogada_global = melhor_jogada
-            print(f"Profundidade {profundidade}: melhor movimento = {melhor_jogada}, valor = {valor:.2f}")
+    # Valores da raiz na profundidade anterior, usados para ordenar a seguinte
+    valores_raiz = {}
+
+    def buscar_profundidade(profundidade, alfa, beta, variacao_principal):
+        # A profundidade 1 é sempre concluída, para que haja um movimento a devolver
+        melhor_jogada, valor = melhor_jogada_agente_poda(
+            jogo, turno, profundidade, usar_lote, variacao_principal, valores_raiz,
+            relogio if profundidade > 1 else None, alfa, beta, politica_paredes
+        )
+        variacao = []
+        if melhor_jogada is not None and not relogio.interrompida:
+            variacao = extrair_variacao_principal(
+                jogo, turno, profundidade, transposition_table, aplicar_movimento, hash_estado,
+                melhor_jogada
+            )
+        # O movimento da variação principal é avaliado primeiro: se algum movimento foi
+        # avaliado por completo, ele também foi
+        return melhor_jogada, valor, relogio.interrompida, True, variacao
+
+    melhor_jogada = aprofundamento_iterativo(jogo, relogio, profundidade_maxima, buscar_profundidade)
     
-    tempo_total = time.time() - tempo_inicio
-    print(f"Busca concluída em {tempo_total:.2f} segundos")
-    print(f"Tamanho da tabela de transposição: {len(transposition_table)} estados")
+    logger.info("Busca concluída em %.2f segundos", relogio.tempo_decorrido())
+    logger.debug("Tamanho da tabela de transposição: %d estados", len(transposition_table))
     
-    return melhor_jogada_global
+    return melhor_jogada
 
-# Encontrar o melhor movimento do computador usando minimax com poda alfa-beta
-def melhor_jogada_agente_poda(jogo, turno, profundidade_maxima=4):
+# Encontrar o melhor movimento do computador usando negamax com poda alfa-beta e PVS
+def melhor_jogada_agente_poda(jogo, turno, profundidade_maxima=4, usar_lote=False, variacao_principal=None, valores_raiz=None, relogio=None, alfa=float("-inf"), beta=float("inf"), politica_paredes=POLITICA_PAREDES, movimentos_raiz=None):
     """
-    Encontra o melhor movimento para o jogador atual usando minimax com poda alfa-beta.
+    Encontra o melhor movimento para o jogador atual usando negamax com poda alfa-beta e PVS.
     
     Args:
         jogo: Estado atual do jogo
         turno: Turno atual (0 para J1, 1 para J2)
         profundidade_maxima: Profundidade máxima de busca
+        usar_lote: Se True, valida as paredes em lote com NumPy na geração de movimentos
+        variacao_principal: Variação principal da iteração anterior, buscada primeiro
+        valores_raiz: Valores dos movimentos da raiz na iteração anterior (atualizado por esta busca)
+        relogio: RelogioBusca que pode interromper a busca (ver controle_tempo.py)
+        alfa, beta: Janela de aspiração da raiz; fora dela o valor devolvido é só um limite
+        politica_paredes: Política de paredes candidatas dos nós internos (ver core/paredes_candidatas.py)
+        movimentos_raiz: Subconjunto dos movimentos da raiz a buscar (None para todos)
     
     Returns:
         Tupla (melhor_jogada, valor) com o melhor movimento encontrado e seu valor
     """
+    gerar = partial(gerar_movimentos_possiveis, usar_lote=usar_lote, politica_paredes=politica_paredes)
+    gerar_em_estagios = None
+    if GERACAO_EM_ESTAGIOS and not heuristicas.ordenacao_estatica:
+        gerar_em_estagios = partial(gerar_movimentos_em_estagios, usar_lote=usar_lote, politica_paredes=politica_paredes)
     return melhor_jogada_agente_poda_com_valor(
         jogo, 
         turno, 
         profundidade_maxima, 
         transposition_table,
-        gerar_movimentos_possiveis,
+        gerar,
         criar_mover_info,
         aplicar_movimento,
         atualizar_mover_info,
-        hash_estado
+        hash_estado,
+        variacao_principal,
+        valores_raiz,
+        heuristicas,
+        relogio,
+        alfa,
+        beta,
+        gerar_em_estagios,
+        USAR_LMR,
+        USAR_FUTILIDADE,
+        movimentos_raiz,
     )
 
 # Função para o AI escolher o melhor movimento
-def escolher_movimento_ai(jogo, turno, profundidade=3, usar_poda=True, usar_iterative_deepening=True, tempo_limite=1.5):
+def escolher_movimento_ai(jogo, turno, profundidade=3, usar_poda=True, usar_iterative_deepening=True, tempo_limite=1.5, usar_lote=False, limite_nos=None, politica_paredes=POLITICA_PAREDES, num_processos=1):
     """
     Escolhe o melhor movimento para o AI usando diferentes estratégias de busca.
     
@@ -101,17 +272,30 @@ def escolher_movimento_ai(jogo, turno, profundidade=3, usar_poda=True, usar_iter
         usar_poda: Se True, usa minimax com poda alfa-beta; se False, usa minimax padrão
         usar_iterative_deepening: Se True, usa aprofundamento iterativo com limite de tempo
         tempo_limite: Tempo máximo em segundos para a busca com iterative deepening
+        usar_lote: Se True, valida as paredes em lote com NumPy (requer numpy instalado)
+        limite_nos: Orçamento de nós por busca com iterative deepening (None para não limitar)
+        politica_paredes: Paredes consideradas abaixo da raiz (POLITICA_TODAS para todas)
+        num_processos: Com mais de um, os movimentos da raiz do aprofundamento iterativo
+            são divididos entre esse número de processos (ver paralelo.py)
     
     Returns:
-        Melhor movimento encontrado
+        Melhor movimento encontrado, codificado como inteiro (ver src/core/codificacao.py)
     """
     # Documentação sobre a profundidade ideal
     # Profundidade 3-4 é um bom equilíbrio entre tempo de computação e qualidade da jogada
     # Com a poda alfa-beta e a tabela de transposição, podemos ir até profundidade 5-6 em tempo razoável
     # Iterative deepening permite encontrar a melhor jogada possível dentro do tempo disponível
     
+    movimento = movimento_sem_busca(jogo, turno)
+    if movimento is not None:
+        return None if movimento == SEM_JOGADA else movimento
+    
+    if usar_iterative_deepening and num_processos > 1:
+        from .paralelo import iterative_deepening_paralelo
+
+        return iterative_deepening_paralelo(jogo, turno, num_processos, tempo_limite, profundidade_maxima=6, usar_lote=usar_lote, limite_nos=limite_nos, politica_paredes=politica_paredes)
     if usar_iterative_deepening:
-        return iterative_deepening(jogo, turno, tempo_limite, profundidade_maxima=6, usar_poda=usar_poda)
+        return iterative_deepening(jogo, turno, tempo_limite, profundidade_maxima=6, usar_poda=usar_poda, usar_lote=usar_lote, limite_nos=limite_nos, politica_paredes=politica_paredes)
     else:
-        melhor_jogada, _ = melhor_jogada_agente_poda(jogo, turno, profundidade)
+        melhor_jogada, _ = melhor_jogada_agente_poda(jogo, turno, profundidade, usar_lote, politica_paredes=politica_paredes)
         return melhor_jogada
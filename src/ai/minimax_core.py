@@ -1,12 +1,46 @@
-import copy
+from .controle_tempo import BuscaInterrompida
+from .transposicao import EXATO, LIMITE_INFERIOR, LIMITE_SUPERIOR, tipo_do_valor
 
+# Largura da janela nula da PVS. A utilidade é uma soma de múltiplos de 2.5 e 0.1,
+# então dois valores diferentes nunca ficam tão próximos
+JANELA_NULA = 1e-6
 
-# Minimax com poda alfa-beta e tabela de transposição
-def minimax_alfabeta(
+# Late move reductions: a partir do LMR_LANCES_COMPLETOS-ésimo filho, as paredes que não
+# são killer nem da tabela de transposição são buscadas com LMR_REDUCAO de profundidade
+# a menos, em nós com pelo menos LMR_PROFUNDIDADE_MINIMA de profundidade restante
+LMR_LANCES_COMPLETOS = 3
+LMR_PROFUNDIDADE_MINIMA = 3
+LMR_REDUCAO = 1
+
+# Poda de futilidade: margem por profundidade restante (índice). Cada casa de diferença
+# nos caminhos vale 2.5 na utilidade; se a avaliação estática mais a margem não chega a
+# alfa, o nó busca só os peões e os movimentos da tabela de transposição
+MARGENS_FUTILIDADE = (0.0, 5.0, 10.0)
+
+
+# Na forma negamax os valores são do ponto de vista de quem joga no nó; a chave na
+# tabela de transposição inclui esse jogador, já que a vez guardada no hash Zobrist
+# pode não coincidir com o turno passado para a busca na raiz
+def chave_transposicao(jogo, jogador, hash_estado):
+    chave = hash_estado(jogo)
+    if jogador == "J2":
+        chave ^= jogo.zobrist["perspectiva"]
+    return chave
+
+
+# Coloca o melhor movimento guardado na tabela de transposição na frente da lista
+def _priorizar_movimento(movimentos, melhor_movimento):
+    if melhor_movimento is not None and melhor_movimento in movimentos:
+        movimentos.remove(melhor_movimento)
+        movimentos.insert(0, melhor_movimento)
+    return movimentos
+
+
+# Negamax com poda alfa-beta, Principal Variation Search e tabela de transposição
+def negamax_alfabeta(
     jogo,
     profundidade,
-    turno_max,
-    jogador,
+    turno,
     transposition_table,
     gerar_movimentos_possiveis,
     criar_mover_info,
@@ -16,104 +50,141 @@ def minimax_alfabeta(
     profundidade_maxima=4,
     alfa=float("-inf"),
     beta=float("inf"),
+    variacao_principal=None,
+    heuristicas=None,
+    relogio=None,
+    gerar_em_estagios=None,
+    usar_lmr=False,
+    usar_futilidade=False,
 ):
     """
-    Implementação do algoritmo Minimax com poda alfa-beta e tabela de transposição.
+    Implementação do minimax na forma negamax, com poda alfa-beta, PVS e tabela de transposição.
+
+    A utilidade é de soma zero (a de J2 é o negativo da de J1), então cada nó maximiza
+    o próprio valor e devolve o negativo ao pai. O primeiro filho é buscado com a
+    janela completa e os demais com janela nula; um filho que supera alfa na janela
+    nula é buscado de novo com a janela completa.
 
     Args:
         jogo: Estado atual do jogo
         profundidade: Profundidade atual da busca
-        turno_max: Se True, é o turno do jogador MAX; se False, é o turno do jogador MIN
-        jogador: Jogador para o qual calcular a utilidade ('J1' ou 'J2')
-        transposition_table: Tabela de transposição para armazenar estados já calculados
+        turno: Jogador da vez neste nó (0 para J1, 1 para J2); o valor é do ponto de vista dele
+        transposition_table: TabelaTransposicao com valores e limites de estados já calculados
         gerar_movimentos_possiveis: Função para gerar movimentos possíveis
         criar_mover_info: Função para criar informações sobre o movimento
-        aplicar_movimento: Função para aplicar um movimento ao jogo
+        aplicar_movimento: Função que aplica um movimento in-place e retorna o token para jogo.desfazer_movimento
         atualizar_mover_info: Função para atualizar informações do movimento
-        hash_estado: Função para gerar um hash do estado do jogo
+        hash_estado: Função que retorna a chave do jogo na tabela de transposição (hash Zobrist)
         profundidade_maxima: Profundidade máxima de busca
         alfa: Valor alfa para poda alfa-beta
         beta: Valor beta para poda alfa-beta
+        variacao_principal: Continuação da variação principal da iteração anterior a partir
+            deste nó (ou None se o nó estiver fora dela); o primeiro movimento é buscado primeiro
+        heuristicas: HeuristicasOrdenacao com killer moves e history (ou None para usar só a
+            ordenação estática de gerar_movimentos_possiveis)
+        relogio: RelogioBusca com prazo e orçamento de nós; ao esgotar, BuscaInterrompida é
+            lançada e os movimentos em andamento são desfeitos antes de ela chegar à raiz
+        gerar_em_estagios: Gerador de movimentos sob demanda (ver
+            movimento_util.gerar_movimentos_em_estagios); se informado, substitui
+            gerar_movimentos_possiveis e a ordenação das heurísticas
+        usar_lmr: Se True, aplica late move reductions às paredes tardias (ver LMR_*)
+        usar_futilidade: Se True, descarta as paredes perto das folhas quando a avaliação
+            estática mais MARGENS_FUTILIDADE não chega a alfa
 
     Returns:
-        Valor da utilidade do estado atual
+        Valor da utilidade do estado atual para o jogador da vez
     """
+    if relogio is not None:
+        relogio.contar_no()
+
     # Verifica a tabela de transposição
-    estado = jogo.serializar_estado()
-    estado_hash = hash_estado(estado)
+    jogador = "J1" if turno == 0 else "J2"
+    estado_hash = chave_transposicao(jogo, jogador, hash_estado)
+    movimento_tt = None
 
-    if estado_hash in transposition_table:
-        prof_armazenada, valor, _ = transposition_table[estado_hash]
+    # Um limite guardado só encerra o nó se ficar fora da janela atual;
+    # caso contrário ele apenas estreita a janela
+    entrada = transposition_table.consultar(estado_hash)
+    if entrada is not None:
+        prof_armazenada, valor, tipo, movimento_tt = entrada
         if prof_armazenada >= profundidade:
-            return valor
+            if tipo == EXATO:
+                return valor
+            if tipo == LIMITE_INFERIOR:
+                alfa = max(alfa, valor)
+            elif tipo == LIMITE_SUPERIOR:
+                beta = min(beta, valor)
+            if alfa >= beta:
+                return valor
+
+    # Janela original, para classificar o valor calculado ao armazená-lo
+    alfa_original, beta_original = alfa, beta
 
     # Se o jogo acabou ou se a profundidade é máxima
     if jogo.verificar_vitoria() or profundidade == 0:
-        valor = jogo.calcular_utilidade(estado, jogador)
-        transposition_table[estado_hash] = (profundidade, valor, None)
+        valor = jogo.calcular_utilidade(jogo.serializar_estado(), jogador)
+        transposition_table.armazenar(estado_hash, profundidade, valor, EXATO)
         return valor
 
     melhor_movimento = None
+    movimento_pv = variacao_principal[0] if variacao_principal else None
+    ply = profundidade_maxima - profundidade
+    ordenar = heuristicas is None or heuristicas.ordenacao_estatica
+    killers = heuristicas.killers_do_ply(ply) if heuristicas is not None else []
+    casas = jogo.linhas * jogo.colunas
 
-    if turno_max:  # turno do MAX
-        valor = float("-inf")
-        for movimento in gerar_movimentos_possiveis(jogo, 0 if jogador == "J1" else 1):
-            jogo_copia = copy.deepcopy(jogo)
-            mover_info = criar_mover_info(
-                jogo_copia, movimento, 0 if jogador == "J1" else 1
-            )
-            aplicar_movimento(jogo_copia, movimento, 0 if jogador == "J1" else 1)
-            mover_info = atualizar_mover_info(
-                jogo_copia, mover_info, 0 if jogador == "J1" else 1
-            )
+    # Poda de futilidade: perto das folhas, um nó muito abaixo de alfa só é salvo por
+    # uma parede que aumente muito o caminho do oponente, o que a margem supõe não haver
+    limite_futilidade = None
+    if usar_futilidade and profundidade < len(MARGENS_FUTILIDADE) and alfa > float("-inf"):
+        avaliacao = jogo.calcular_utilidade(jogo.serializar_estado(), jogador)
+        if avaliacao + MARGENS_FUTILIDADE[profundidade] <= alfa:
+            limite_futilidade = avaliacao + MARGENS_FUTILIDADE[profundidade]
 
-            # Use the direct result from the recursive call
-            eval_do_filho = minimax_alfabeta(
-                jogo_copia,
-                profundidade - 1,
-                False,  # Turno do MIN
-                jogador,
-                transposition_table,
-                gerar_movimentos_possiveis,
-                criar_mover_info,
-                aplicar_movimento,
-                atualizar_mover_info,
-                hash_estado,
-                profundidade_maxima,
-                alfa,
-                beta,
-            )
-
-            if eval_do_filho > valor:
-                valor = eval_do_filho
-                melhor_movimento = movimento
+    if gerar_em_estagios is not None:
+        # As paredes só são validadas quando a busca chega nelas: um corte nos
+        # primeiros filhos não paga a verificação das demais
+        movimentos = gerar_em_estagios(
+            jogo,
+            turno,
+            (movimento_pv, movimento_tt),
+            killers,
+            heuristicas.historia[turno] if heuristicas is not None else None,
+            paredes=limite_futilidade is None,
+        )
+    else:
+        movimentos = gerar_movimentos_possiveis(jogo, turno, ordenar=ordenar)
+        if limite_futilidade is not None:
+            movimentos = [m for m in movimentos if m < casas or m in (movimento_pv, movimento_tt)]
+        if heuristicas is not None:
+            heuristicas.ordenar(movimentos, ply, turno)
+        _priorizar_movimento(movimentos, movimento_tt)
+        _priorizar_movimento(movimentos, movimento_pv)
 
-            alfa = max(alfa, valor)
-            if beta <= alfa:
-                break  # Poda beta
+    valor = float("-inf")
+    for indice, movimento in enumerate(movimentos):
+        # Paredes tardias e sem indício de serem boas são buscadas primeiro com profundidade reduzida
+        reducao = 0
+        if (
+            usar_lmr
+            and profundidade >= LMR_PROFUNDIDADE_MINIMA
+            and indice >= LMR_LANCES_COMPLETOS
+            and movimento >= casas
+            and movimento not in killers
+            and movimento not in (movimento_pv, movimento_tt)
+        ):
+            reducao = LMR_REDUCAO
 
-        # Armazena na tabela de transposição
-        transposition_table[estado_hash] = (profundidade, valor, melhor_movimento)
-        return valor
-    else:  # turno no MIN
-        valor = float("inf")
-        oponente = "J2" if jogador == "J1" else "J1"
-        for movimento in gerar_movimentos_possiveis(jogo, 0 if oponente == "J1" else 1):
-            jogo_copia = copy.deepcopy(jogo)
-            mover_info = criar_mover_info(
-                jogo_copia, movimento, 0 if oponente == "J1" else 1
-            )
-            aplicar_movimento(jogo_copia, movimento, 0 if oponente == "J1" else 1)
-            mover_info = atualizar_mover_info(
-                jogo_copia, mover_info, 0 if oponente == "J1" else 1
-            )
+        mover_info = criar_mover_info(jogo, movimento, turno)
+        token = aplicar_movimento(jogo, movimento, turno)
+        mover_info = atualizar_mover_info(jogo, mover_info, turno)
 
-            # Use the direct result from the recursive call
-            eval_do_filho = minimax_alfabeta(
-                jogo_copia,
+        # O movimento é desfeito mesmo se a busca for interrompida
+        try:
+            eval_do_filho = _buscar_filho(
+                jogo,
                 profundidade - 1,
-                True,  # Turno do MAX
-                jogador,
+                1 - turno,
                 transposition_table,
                 gerar_movimentos_possiveis,
                 criar_mover_info,
@@ -123,22 +194,119 @@ def minimax_alfabeta(
                 profundidade_maxima,
                 alfa,
                 beta,
+                melhor_movimento is None,
+                variacao_principal[1:] if movimento == movimento_pv else None,
+                heuristicas,
+                relogio,
+                gerar_em_estagios,
+                usar_lmr,
+                usar_futilidade,
+                reducao,
             )
+        finally:
+            jogo.desfazer_movimento(token)
 
-            if eval_do_filho < valor:
-                valor = eval_do_filho
-                melhor_movimento = movimento
+        if eval_do_filho > valor:
+            valor = eval_do_filho
+            melhor_movimento = movimento
 
-            beta = min(beta, valor)
-            if beta <= alfa:
-                break  # Poda alfa
+        alfa = max(alfa, valor)
+        if beta <= alfa:
+            if heuristicas is not None:
+                heuristicas.registrar_corte(movimento, ply, profundidade, turno)
+            break  # Poda
 
-        # Armazena na tabela de transposição
-        transposition_table[estado_hash] = (profundidade, valor, melhor_movimento)
-        return valor
+    # As paredes descartadas pela futilidade valem no máximo limite_futilidade (<= alfa)
+    if limite_futilidade is not None:
+        valor = max(valor, limite_futilidade)
+
+    # Armazena na tabela de transposição
+    transposition_table.armazenar(
+        estado_hash,
+        profundidade,
+        valor,
+        tipo_do_valor(valor, alfa_original, beta_original),
+        melhor_movimento,
+    )
+    return valor
+
+
+# Valor de um filho (já aplicado no jogo) para o pai, com a janela nula da PVS
+def _buscar_filho(
+    jogo,
+    profundidade,
+    turno_filho,
+    transposition_table,
+    gerar_movimentos_possiveis,
+    criar_mover_info,
+    aplicar_movimento,
+    atualizar_mover_info,
+    hash_estado,
+    profundidade_maxima,
+    alfa,
+    beta,
+    primeiro_filho,
+    variacao_principal,
+    heuristicas,
+    relogio,
+    gerar_em_estagios,
+    usar_lmr=False,
+    usar_futilidade=False,
+    reducao=0,
+):
+    argumentos = (
+        transposition_table,
+        gerar_movimentos_possiveis,
+        criar_mover_info,
+        aplicar_movimento,
+        atualizar_mover_info,
+        hash_estado,
+        profundidade_maxima,
+    )
+    opcoes = (heuristicas, relogio, gerar_em_estagios, usar_lmr, usar_futilidade)
+    if reducao and not primeiro_filho and alfa > float("-inf"):
+        # Late move reduction: busca rasa com janela nula; só um filho que supera alfa
+        # nela é buscado de novo na profundidade normal
+        valor = -negamax_alfabeta(
+            jogo,
+            profundidade - reducao,
+            turno_filho,
+            *argumentos,
+            -alfa - JANELA_NULA,
+            -alfa,
+            variacao_principal,
+            *opcoes,
+        )
+        if valor <= alfa:
+            return valor
+    if not primeiro_filho and alfa > float("-inf") and beta - alfa > JANELA_NULA:
+        # Janela nula: só prova que o filho não é melhor que o melhor até agora
+        valor = -negamax_alfabeta(
+            jogo,
+            profundidade,
+            turno_filho,
+            *argumentos,
+            -alfa - JANELA_NULA,
+            -alfa,
+            variacao_principal,
+            *opcoes,
+        )
+        if valor <= alfa or valor >= beta:
+            return valor
+        # Superou alfa: busca de novo com a janela completa para obter o valor exato
+    return -negamax_alfabeta(
+        jogo,
+        profundidade,
+        turno_filho,
+        *argumentos,
+        -beta,
+        -alfa,
+        variacao_principal,
+        *opcoes,
+    )
 
 
-# Encontrar o melhor movimento do computador usando minimax com poda alfa-beta (retorna também o valor)
+# Encontrar o melhor movimento do computador usando negamax com PVS (retorna também o valor)
 def melhor_jogada_agente_poda_com_valor(
     jogo,
     turno,
@@ -149,20 +317,47 @@ def melhor_jogada_agente_poda_com_valor(
     aplicar_movimento,
     atualizar_mover_info,
     hash_estado,
+    variacao_principal=None,
+    valores_raiz=None,
+    heuristicas=None,
+    relogio=None,
+    alfa=float("-inf"),
+    beta=float("inf"),
+    gerar_em_estagios=None,
+    usar_lmr=False,
+    usar_futilidade=False,
+    movimentos_raiz=None,
 ):
     """
-    Encontra o melhor movimento para o jogador atual usando minimax com poda alfa-beta.
+    Encontra o melhor movimento para o jogador atual usando negamax com poda alfa-beta e PVS.
 
     Args:
         jogo: Estado atual do jogo
         turno: Turno atual (0 para J1, 1 para J2)
         profundidade_maxima: Profundidade máxima de busca
-        transposition_table: Tabela de transposição para armazenar estados já calculados
+        transposition_table: TabelaTransposicao com valores e limites de estados já calculados
         gerar_movimentos_possiveis: Função para gerar movimentos possíveis
         criar_mover_info: Função para criar informações sobre o movimento
-        aplicar_movimento: Função para aplicar um movimento ao jogo
+        aplicar_movimento: Função que aplica um movimento in-place e retorna o token para jogo.desfazer_movimento
         atualizar_mover_info: Função para atualizar informações do movimento
-        hash_estado: Função para gerar um hash do estado do jogo
+        hash_estado: Função que retorna a chave do jogo na tabela de transposição (hash Zobrist)
+        variacao_principal: Variação principal da iteração anterior (lista de movimentos), buscada primeiro
+        valores_raiz: Dicionário {movimento: valor} da iteração anterior. Os movimentos da raiz são
+            ordenados por esses valores e o dicionário é atualizado com os valores desta busca
+        heuristicas: HeuristicasOrdenacao usada para ordenar os nós internos (opcional)
+        relogio: RelogioBusca com prazo e orçamento de nós (opcional). Se a busca for
+            interrompida, relogio.interrompida fica True e o resultado considera apenas os
+            movimentos da raiz avaliados por completo (melhor_jogada é None se nenhum foi)
+        alfa: Limite inferior da janela de aspiração (um valor <= alfa é só um limite superior)
+        beta: Limite superior da janela de aspiração (a busca para no primeiro movimento
+            com valor >= beta, que é então só um limite inferior)
+        gerar_em_estagios: Gerador de movimentos sob demanda dos nós internos (opcional);
+            a raiz sempre gera a lista completa, para ordená-la pelos valores anteriores
+        usar_lmr: Se True, aplica late move reductions nos nós internos
+        usar_futilidade: Se True, aplica a poda de futilidade nos nós internos
+        movimentos_raiz: Subconjunto dos movimentos da raiz a buscar (ou None para todos),
+            usado na divisão da raiz entre processos (ver paralelo.py). Nesse caso o
+            resultado vale só para o subconjunto e não é guardado na tabela de transposição
 
     Returns:
         Tupla (melhor_jogada, valor) com o melhor movimento encontrado e seu valor
@@ -170,40 +365,126 @@ def melhor_jogada_agente_poda_com_valor(
     jogador = "J1" if turno == 0 else "J2"
     melhor_valor = float("-inf")
     melhor_jogada = None
-    alfa = float("-inf")
-    beta = float("inf")
-
-    for movimento in gerar_movimentos_possiveis(
-        jogo, turno, transposition_table=transposition_table
-    ):
-        jogo_copia = copy.deepcopy(jogo)
-        mover_info = criar_mover_info(jogo_copia, movimento, turno)
-        aplicar_movimento(jogo_copia, movimento, turno)
-        mover_info = atualizar_mover_info(jogo_copia, mover_info, turno)
-
-        # Use the direct result from the minimax_alfabeta call
-        valor_do_movimento = minimax_alfabeta(
-            jogo_copia,
-            profundidade_maxima - 1,
-            False,  # Após o MAX jogar, é a vez do MIN
-            jogador,
-            transposition_table,
-            gerar_movimentos_possiveis,
-            criar_mover_info,
-            aplicar_movimento,
-            atualizar_mover_info,
-            hash_estado,
-            profundidade_maxima,
-            alfa,
-            beta,
+    alfa_original = alfa
+
+    chave_raiz = chave_transposicao(jogo, jogador, hash_estado)
+    # A raiz considera todas as paredes, mesmo que os nós internos usem uma política
+    # de paredes candidatas (ver core/paredes_candidatas.py)
+    if movimentos_raiz is not None:
+        movimentos = list(movimentos_raiz)
+    else:
+        movimentos = gerar_movimentos_possiveis(
+            jogo, turno, transposition_table=transposition_table, politica_paredes=None
         )
+    if valores_raiz:
+        # A ordenação é estável: movimentos sem valor anterior mantêm a ordem heurística
+        movimentos.sort(key=lambda m: valores_raiz.get(m, float("-inf")), reverse=True)
+    _priorizar_movimento(movimentos, transposition_table.melhor_movimento(chave_raiz))
+    movimento_pv = variacao_principal[0] if variacao_principal else None
+    for movimento in _priorizar_movimento(movimentos, movimento_pv):
+        mover_info = criar_mover_info(jogo, movimento, turno)
+        token = aplicar_movimento(jogo, movimento, turno)
+        mover_info = atualizar_mover_info(jogo, mover_info, turno)
+
+        try:
+            valor_do_movimento = _buscar_filho(
+                jogo,
+                profundidade_maxima - 1,
+                1 - turno,
+                transposition_table,
+                gerar_movimentos_possiveis,
+                criar_mover_info,
+                aplicar_movimento,
+                atualizar_mover_info,
+                hash_estado,
+                profundidade_maxima,
+                alfa,
+                beta,
+                melhor_jogada is None,
+                variacao_principal[1:] if movimento == movimento_pv else None,
+                heuristicas,
+                relogio,
+                gerar_em_estagios,
+                usar_lmr,
+                usar_futilidade,
+            )
+        except BuscaInterrompida:
+            # Fica o melhor entre os movimentos já avaliados por completo nesta profundidade
+            return melhor_jogada, melhor_valor
+        finally:
+            jogo.desfazer_movimento(token)
+        if valores_raiz is not None:
+            # Só valores dentro da janela são exatos; os demais são apenas limites
+            # e não dizem quanto o movimento é bom, então não entram na ordenação
+            if alfa < valor_do_movimento < beta:
+                valores_raiz[movimento] = valor_do_movimento
+            else:
+                valores_raiz.pop(movimento, None)
 
         if valor_do_movimento > melhor_valor:
             melhor_valor = valor_do_movimento
             melhor_jogada = movimento
 
         alfa = max(alfa, melhor_valor)
-        # Não há poda beta aqui, pois este é o nível raiz para o jogador MAX
+        if beta <= alfa:
+            break  # Falhou alto na janela de aspiração
 
-    # Armazena o resultado da raiz na tabela de transposição se necessário
+    # Armazena o resultado da raiz, para que a próxima iteração comece pelo melhor movimento
+    if melhor_jogada is not None and movimentos_raiz is None:
+        transposition_table.armazenar(
+            chave_raiz,
+            profundidade_maxima,
+            melhor_valor,
+            tipo_do_valor(melhor_valor, alfa_original, beta),
+            melhor_jogada,
+        )
     return melhor_jogada, melhor_valor
+
+
+# Segue os melhores movimentos guardados na tabela de transposição a partir da raiz
+def extrair_variacao_principal(
+    jogo,
+    turno,
+    profundidade_maxima,
+    transposition_table,
+    aplicar_movimento,
+    hash_estado,
+    movimento_raiz=None,
+):
+    """
+    Reconstrói a variação principal da última busca a partir da tabela de transposição.
+
+    Args:
+        jogo: Estado do jogo na raiz da busca (é restaurado ao final)
+        turno: Turno da raiz (0 para J1, 1 para J2)
+        profundidade_maxima: Número máximo de movimentos da variação
+        transposition_table: TabelaTransposicao usada na busca
+        aplicar_movimento: Função que aplica um movimento in-place e retorna o token para jogo.desfazer_movimento
+        hash_estado: Função que retorna a chave do jogo na tabela de transposição (hash Zobrist)
+        movimento_raiz: Melhor movimento da raiz, se conhecido; a entrada da raiz na tabela
+            pode ser de uma busca anterior mais profunda e apontar para outro movimento
+
+    Returns:
+        Lista com os movimentos da variação principal, começando pelo da raiz
+    """
+    variacao = []
+    tokens = []
+    vez = turno
+    while len(variacao) < profundidade_maxima and not jogo.verificar_vitoria():
+        if not variacao and movimento_raiz is not None:
+            movimento = movimento_raiz
+        else:
+            movimento = transposition_table.melhor_movimento(
+                chave_transposicao(jogo, "J1" if vez == 0 else "J2", hash_estado)
+            )
+        if movimento is None:
+            break
+        token = aplicar_movimento(jogo, movimento, vez)
+        if token is None:
+            break
+        tokens.append(token)
+        variacao.append(movimento)
+        vez = 1 - vez
+    for token in reversed(tokens):
+        jogo.desfazer_movimento(token)
+    return variacao
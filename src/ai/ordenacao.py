@@ -0,0 +1,70 @@
+# Heurísticas de ordenação de movimentos aprendidas durante a busca.
+#
+# Killer moves: por ply, os dois últimos movimentos que causaram poda. Em Quoridor
+# uma boa parede costuma continuar boa nos nós irmãos, onde ainda é legal.
+# History: pontuação por movimento (inteiro, ver codificacao.py) e por lado, somada
+# a cada poda com peso profundidade², que vale em qualquer parte da árvore.
+
+# Killer moves guardados por ply
+NUM_KILLERS = 2
+
+
+class HeuristicasOrdenacao:
+    """Killer moves por ply e tabela de history, mantidos pela busca e usados no negamax_alfabeta."""
+
+    def __init__(self, ordenacao_estatica=False):
+        """
+        Args:
+            ordenacao_estatica (bool): Se True, os filhos também são ordenados por
+                avaliar_movimento_rapido (gerar_movimentos_possiveis com ordenar=True),
+                que passa a servir de desempate; se False, usa só killers e history.
+        """
+        self.ordenacao_estatica = ordenacao_estatica
+        self.killers = []
+        self.historia = ({}, {})
+
+    def nova_busca(self):
+        """Descarta os killers (dependem da posição da raiz) e reduz o history pela metade."""
+        self.killers = []
+        for historia in self.historia:
+            for movimento in list(historia):
+                pontos = historia[movimento] // 2
+                if pontos:
+                    historia[movimento] = pontos
+                else:
+                    del historia[movimento]
+
+    def registrar_corte(self, movimento, ply, profundidade, turno):
+        """Registra um movimento que causou poda no ply dado, com profundidade restante ``profundidade``."""
+        while len(self.killers) <= ply:
+            self.killers.append([None] * NUM_KILLERS)
+        killers = self.killers[ply]
+        if killers[0] != movimento:
+            killers.pop()
+            killers.insert(0, movimento)
+        historia = self.historia[turno]
+        historia[movimento] = historia.get(movimento, 0) + profundidade * profundidade
+
+    def killers_do_ply(self, ply):
+        """Killer moves do ply, do mais recente para o mais antigo."""
+        if ply < len(self.killers):
+            return [killer for killer in self.killers[ply] if killer is not None]
+        return []
+
+    def ordenar(self, movimentos, ply, turno):
+        """
+        Ordena a lista in-place: killers do ply primeiro, depois por history.
+        A ordenação é estável, então a ordem recebida desempata os movimentos sem pontuação.
+
+        Returns:
+            list: A própria lista ``movimentos``.
+        """
+        historia = self.historia[turno]
+        if historia:
+            movimentos.sort(key=lambda m: historia.get(m, 0), reverse=True)
+        if ply < len(self.killers):
+            for killer in reversed(self.killers[ply]):
+                if killer is not None and killer in movimentos:
+                    movimentos.remove(killer)
+                    movimentos.insert(0, killer)
+        return movimentos
@@ -0,0 +1,176 @@
+# Busca em paralelo por divisão da raiz (root splitting).
+#
+# Por causa do GIL a busca usa processos, não threads. A cada profundidade do
+# aprofundamento iterativo, os movimentos da raiz são repartidos em blocos, um por
+# processo, e cada processo busca o seu bloco com a busca sequencial de minimax.py
+# (tabela de transposição, killers e history próprios, mantidos entre as buscas).
+# O processo principal junta os blocos, controla a janela de aspiração e o tempo.
+
+import atexit
+import multiprocessing
+import time
+
+from src.core.movimento_util import gerar_movimentos_possiveis, aplicar_movimento, hash_estado
+from src.utils.log import obter_logger
+from . import minimax
+from .controle_tempo import RelogioBusca
+from .minimax_core import extrair_variacao_principal
+
+logger = obter_logger(__name__)
+
+# Pool de processos reaproveitado entre as jogadas (criado na primeira busca)
+_pool = None
+_num_processos_pool = 0
+
+# Identificador da busca atual: no processo principal conta as buscas; nos processos
+# de trabalho guarda a última vista, para envelhecer a tabela uma vez por busca
+_busca_atual = 0
+
+
+def obter_pool(num_processos):
+    """Devolve o pool com num_processos processos, recriando-o se o número mudou."""
+    global _pool, _num_processos_pool
+    if _pool is None or _num_processos_pool != num_processos:
+        encerrar_pool()
+        # Com fork os processos já começam com o conteúdo das tabelas do processo
+        # principal; onde não há fork (Windows, macOS por padrão) fica o método padrão,
+        # e a configuração da busca chega em cada tarefa (ver _configuracao_busca)
+        if "fork" in multiprocessing.get_all_start_methods():
+            contexto = multiprocessing.get_context("fork")
+        else:
+            contexto = multiprocessing.get_context()
+        _pool = contexto.Pool(num_processos)
+        _num_processos_pool = num_processos
+    return _pool
+
+
+def encerrar_pool():
+    """Encerra os processos de trabalho, se houver."""
+    global _pool, _num_processos_pool
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+        _num_processos_pool = 0
+
+
+atexit.register(encerrar_pool)
+
+
+# Configuração de minimax.py que muda a busca, enviada com as tarefas: sem fork os
+# processos de trabalho importam minimax.py com os valores padrão
+def _configuracao_busca():
+    return (minimax.USAR_LMR, minimax.USAR_FUTILIDADE, minimax.GERACAO_EM_ESTAGIOS,
+            minimax.heuristicas.ordenacao_estatica)
+
+
+def _aplicar_configuracao(configuracao):
+    (minimax.USAR_LMR, minimax.USAR_FUTILIDADE, minimax.GERACAO_EM_ESTAGIOS,
+     minimax.heuristicas.ordenacao_estatica) = configuracao
+
+
+# Executado nos processos de trabalho: busca um bloco de movimentos da raiz
+def _buscar_bloco(tarefa):
+    global _busca_atual
+    (jogo, turno, profundidade, movimentos, variacao_principal, valores_raiz,
+     alfa, beta, prazo, limite_nos, usar_lote, politica_paredes, busca, configuracao) = tarefa
+
+    _aplicar_configuracao(configuracao)
+    if busca != _busca_atual:
+        minimax.transposition_table.nova_busca()
+        minimax.heuristicas.nova_busca()
+        _busca_atual = busca
+
+    tempo_restante = None if prazo is None else max(0.0, prazo - time.time())
+    relogio = RelogioBusca(tempo_restante, limite_nos)
+    melhor_jogada, valor = minimax.melhor_jogada_agente_poda(
+        jogo, turno, profundidade, usar_lote, variacao_principal, valores_raiz,
+        relogio, alfa, beta, politica_paredes, movimentos
+    )
+
+    # A variação principal só pode ser extraída aqui, onde está a tabela de transposição
+    variacao = []
+    if melhor_jogada is not None and not relogio.interrompida:
+        variacao = extrair_variacao_principal(
+            jogo, turno, profundidade, minimax.transposition_table, aplicar_movimento, hash_estado,
+            melhor_jogada
+        )
+    return melhor_jogada, valor, relogio.interrompida, relogio.nos, valores_raiz, variacao
+
+
+def iterative_deepening_paralelo(jogo, turno, num_processos, tempo_limite=2.0, profundidade_maxima=6, usar_lote=False, limite_nos=None, politica_paredes=minimax.POLITICA_PAREDES):
+    """
+    Aprofundamento iterativo com os movimentos da raiz divididos entre processos.
+
+    O laço das profundidades é o de minimax.aprofundamento_iterativo; aqui cada
+    profundidade é buscada pelo pool, um bloco de movimentos da raiz por processo.
+
+    Args:
+        jogo: Estado atual do jogo
+        turno: Turno atual (0 para J1, 1 para J2)
+        num_processos: Número de processos de trabalho (e de blocos da raiz)
+        tempo_limite: Tempo máximo em segundos para a busca (None para não limitar)
+        profundidade_maxima: Profundidade máxima de busca
+        usar_lote: Se True, valida as paredes em lote com NumPy na geração de movimentos
+        limite_nos: Número máximo de nós visitados, somando todos os processos
+        politica_paredes: Política de paredes candidatas dos nós internos
+
+    Returns:
+        Melhor movimento encontrado, codificado como inteiro (ver src/core/codificacao.py)
+    """
+    global _busca_atual
+    _busca_atual += 1
+    relogio = RelogioBusca(tempo_limite, limite_nos)
+
+    movimentos = gerar_movimentos_possiveis(jogo, turno, usar_lote=usar_lote)
+    if len(movimentos) <= 1:
+        return movimentos[0] if movimentos else None
+
+    pool = obter_pool(num_processos)
+    configuracao = _configuracao_busca()
+    # Valores da raiz na profundidade anterior, usados para ordenar a seguinte
+    valores_raiz = {}
+
+    def buscar_profundidade(profundidade, alfa, beta, variacao_principal):
+        # Variação principal primeiro, depois pelos valores anteriores; a repartição
+        # em rodízio faz cada bloco começar por um dos melhores movimentos
+        ordem = sorted(movimentos, key=lambda m: valores_raiz.get(m, float("-inf")), reverse=True)
+        if variacao_principal and variacao_principal[0] in ordem:
+            ordem.remove(variacao_principal[0])
+            ordem.insert(0, variacao_principal[0])
+        blocos = [ordem[i::num_processos] for i in range(min(num_processos, len(ordem)))]
+
+        # A profundidade 1 é sempre concluída, para que haja um movimento a devolver
+        prazo = relogio.prazo if profundidade > 1 else None
+        limite_bloco = None
+        if limite_nos is not None and profundidade > 1:
+            limite_bloco = max(1, (limite_nos - relogio.nos) // len(blocos))
+        tarefas = [
+            (jogo, turno, profundidade, bloco, variacao_principal,
+             {m: valores_raiz[m] for m in bloco if m in valores_raiz},
+             alfa, beta, prazo, limite_bloco, usar_lote, politica_paredes, _busca_atual, configuracao)
+            for bloco in blocos
+        ]
+
+        melhor_jogada, valor, variacao = None, float("-inf"), []
+        interrompida = False
+        for bloco, resultado in zip(blocos, pool.map(_buscar_bloco, tarefas)):
+            jogada, valor_bloco, interrompido, nos, valores_bloco, variacao_bloco = resultado
+            relogio.nos += nos
+            interrompida = interrompida or interrompido
+            if bloco is blocos[0]:
+                # O primeiro bloco começa pela variação principal. Cada bloco devolve o
+                # melhor dos seus movimentos já avaliados, mas só esse bloco concluído
+                # garante que o movimento supera o da variação principal
+                pv_concluida = not interrompido
+            for movimento in bloco:
+                valores_raiz.pop(movimento, None)
+            valores_raiz.update(valores_bloco)
+            if jogada is not None and valor_bloco > valor:
+                melhor_jogada, valor, variacao = jogada, valor_bloco, variacao_bloco
+        return melhor_jogada, valor, interrompida, pv_concluida, variacao
+
+    melhor_jogada = minimax.aprofundamento_iterativo(jogo, relogio, profundidade_maxima, buscar_profundidade)
+
+    logger.info("Busca paralela (%d processos) concluída em %.2f segundos", num_processos, relogio.tempo_decorrido())
+    return melhor_jogada
@@ -0,0 +1,158 @@
+# Ponderação: busca durante a vez do oponente.
+#
+# Depois que o agente joga, uma thread busca a posição que surge da resposta
+# prevista do oponente (o melhor movimento dele guardado na tabela de
+# transposição, ou o do livro de aberturas), sem limite de tempo. Quando chega a
+# vez do agente:
+# - se o oponente jogou o previsto (acerto), a própria busca em andamento continua,
+#   agora com o limite de tempo da jogada; se já tinha terminado, o movimento sai na hora;
+# - senão ela é interrompida e a busca normal começa, com a tabela de transposição
+#   aquecida pelas posições que as duas têm em comum.
+# Sem previsão, a thread busca a própria posição do oponente, o que aquece a tabela
+# com as respostas dele em ordem de qualidade.
+#
+# Thread, e não processo, justamente para compartilhar as tabelas de minimax.py. Ela
+# sempre termina (ou é interrompida e aguardada) antes de outra busca começar, então
+# duas buscas nunca usam as tabelas ao mesmo tempo.
+
+import copy
+import threading
+import time
+
+from src.core.movimento_util import hash_estado
+from src.utils.log import obter_logger
+from . import minimax
+from .controle_tempo import RelogioBusca
+from .livro_abertura import chave_posicao, movimento_livro
+from .minimax_core import chave_transposicao
+
+logger = obter_logger(__name__)
+
+
+def movimento_previsto(jogo, turno):
+    """
+    Resposta esperada do jogador ``turno`` na posição atual, ou None se não houver previsão.
+
+    Vem da tabela de transposição (a variação principal da última busca passa por
+    essa posição) ou, na abertura, do livro.
+    """
+    jogador = "J1" if turno == 0 else "J2"
+    chave = chave_transposicao(jogo, jogador, hash_estado)
+    movimento = minimax.transposition_table.melhor_movimento(chave)
+    if movimento is None:
+        movimento = movimento_livro(jogo, turno)
+    return movimento
+
+
+class Ponderador:
+    """Mantém a busca em segundo plano do agente minimax entre as jogadas."""
+
+    def __init__(self, profundidade_maxima=6, usar_lote=False, politica_paredes=minimax.POLITICA_PAREDES):
+        """
+        Args:
+            profundidade_maxima (int): Profundidade máxima da busca em segundo plano
+                (a mesma de escolher_movimento_ai, para que um acerto valha a busca normal).
+            usar_lote (bool): Se True, valida as paredes em lote com NumPy.
+            politica_paredes: Política de paredes candidatas dos nós internos.
+        """
+        self.profundidade_maxima = profundidade_maxima
+        self.usar_lote = usar_lote
+        self.politica_paredes = politica_paredes
+        self._thread = None
+        self._relogio = None
+        # Chave (ver livro_abertura.chave_posicao) da posição buscada quando há previsão
+        self._chave_prevista = None
+        # Movimento devolvido pela busca da ponderação quando ela termina
+        self._resultado = None
+
+    def iniciar(self, jogo, turno):
+        """
+        Começa a ponderar logo depois de o agente jogar.
+
+        Args:
+            jogo (JogoQuoridor): Jogo após o movimento do agente (não é alterado; a
+                thread trabalha numa cópia).
+            turno (int): Jogador do agente (0 para J1, 1 para J2); a vez é do oponente.
+        """
+        self.parar()
+        self._chave_prevista = None
+        self._resultado = None
+        if jogo.verificar_vitoria_jogador("J1") or jogo.verificar_vitoria_jogador("J2"):
+            return
+
+        oponente = 1 - turno
+        copia = copy.deepcopy(jogo)
+        # A cópia do tabuleiro compartilha os caches de caminhos com o original (ver
+        # TabuleiroBitboard.copiar); a thread usa os seus, para não disputá-los com a GUI
+        copia.tabuleiro.cache_distancias = {}
+        copia.tabuleiro.cache_caminhos = {}
+        previsto = movimento_previsto(copia, oponente)
+        if previsto is not None and copia.fazer_movimento(previsto, oponente) is not None:
+            if minimax.movimento_sem_busca(copia, turno) is not None:
+                # A resposta já sai sem busca (tablebase, livro ou corrida)
+                return
+            self._chave_prevista = chave_posicao(copia, turno)
+            turno_busca = turno
+            logger.debug("Ponderando a resposta prevista %s", previsto)
+        else:
+            # Sem previsão: busca a posição do oponente, aquecendo a tabela com as respostas
+            turno_busca = oponente
+            logger.debug("Ponderando sem previsão (posição do oponente)")
+
+        self._relogio = RelogioBusca()
+        self._thread = threading.Thread(
+            target=self._ponderar, args=(copia, turno_busca, self._relogio), daemon=True
+        )
+        self._thread.start()
+
+    def _ponderar(self, jogo, turno, relogio):
+        self._resultado = minimax.iterative_deepening(
+            jogo, turno, None, self.profundidade_maxima, usar_lote=self.usar_lote,
+            politica_paredes=self.politica_paredes, relogio=relogio
+        )
+
+    def parar(self):
+        """Interrompe a ponderação em andamento e espera a thread terminar."""
+        if self._thread is None:
+            return
+        # A busca confere o pedido a cada poucos nós (ver RelogioBusca), então a espera é
+        # curta; sem ela a próxima busca usaria as tabelas junto com a thread
+        self._relogio.interromper()
+        self._thread.join()
+        self._thread = None
+
+    def escolher_movimento(self, jogo, turno, tempo_limite=1.5, **opcoes):
+        """
+        Movimento do agente na vez dele, aproveitando a ponderação.
+
+        Args:
+            jogo (JogoQuoridor): Estado atual do jogo.
+            turno (int): Jogador do agente (0 para J1, 1 para J2).
+            tempo_limite (float | None): Tempo da jogada em segundos, contado a partir
+                desta chamada (None para não limitar).
+            **opcoes: Repassadas para minimax.escolher_movimento_ai quando não há acerto.
+
+        Returns:
+            int | None: Movimento codificado (ver codificacao.py).
+        """
+        if (
+            self._thread is not None
+            and self._chave_prevista is not None
+            and chave_posicao(jogo, turno) == self._chave_prevista
+        ):
+            # Acerto: a busca da ponderação vale para esta posição e só ganha um prazo.
+            # Passado o prazo ela é interrompida e devolve o melhor movimento até ali
+            if tempo_limite is not None:
+                self._relogio.prazo = time.time() + tempo_limite
+            self._thread.join(tempo_limite)
+            self.parar()
+            movimento = self._resultado
+            if movimento is not None:
+                token = jogo.fazer_movimento(movimento, turno)
+                if token is not None:
+                    jogo.desfazer_movimento(token)
+                    logger.info("Acerto da ponderação: %s", movimento)
+                    return movimento
+
+        self.parar()
+        return minimax.escolher_movimento_ai(jogo, turno, tempo_limite=tempo_limite, **opcoes)
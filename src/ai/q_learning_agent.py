@@ -5,6 +5,11 @@ from collections import defaultdict
 
 import numpy as np
 
+from src.core.codificacao import casa_na_direcao, codificar_parede, direcao_legada
+from src.utils.log import obter_logger
+
+logger = obter_logger(__name__)
+
 
 class AgenteQLearningTabular:
     def __init__(
@@ -15,6 +20,7 @@ class AgenteQLearningTabular:
         min_epsilon=0.01,
         epsilon_decay=0.9995,
         nome_arquivo_q_tabela=None,
+        dimensoes_tabuleiro=None,
     ):
         """
         Agente que aprende usando Q-Learning tabular.
@@ -26,12 +32,15 @@ class AgenteQLearningTabular:
             min_epsilon (float): Valor mínimo de epsilon.
             epsilon_decay (float): Fator pelo qual epsilon é multiplicado a cada passo de aprendizado.
             nome_arquivo_q_tabela (str, optional): Nome do arquivo para carregar/salvar a Q-tabela.
+            dimensoes_tabuleiro (tuple, optional): (linhas, colunas) do tabuleiro. Necessário para
+                converter Q-tabelas antigas, com ações em tupla, para os movimentos inteiros.
         """
         self.alpha = taxa_aprendizado
         self.gamma = fator_desconto
         self.epsilon = epsilon
         self.min_epsilon = min_epsilon
         self.epsilon_decay = epsilon_decay
+        self.dimensoes_tabuleiro = dimensoes_tabuleiro
 
         self.q_tabela = defaultdict(lambda: defaultdict(float))
 
@@ -45,7 +54,7 @@ class AgenteQLearningTabular:
 
     def escolher_acao(self, estado, acoes_disponiveis):
         if not acoes_disponiveis:
-            print(f"[WARN] Sem ações válidas disponíveis no estado {estado}")
+            logger.warning("Sem ações válidas disponíveis no estado %s", estado)
             return None
 
         if np.random.random() < self.epsilon:
@@ -103,36 +112,63 @@ class AgenteQLearningTabular:
         if nome_arquivo is None:
             nome_arquivo = self.nome_arquivo_q_tabela
         if nome_arquivo is None:
-            print("Erro: Nome do arquivo para salvar a Q-tabela não especificado.")
+            logger.error("Nome do arquivo para salvar a Q-tabela não especificado.")
             return
 
         q_tabela_serializavel = {k: dict(v) for k, v in self.q_tabela.items()}
         try:
             with open(nome_arquivo, "wb") as f:
                 pickle.dump(q_tabela_serializavel, f)
-            print(f"Q-tabela salva em {nome_arquivo}")
+            logger.info("Q-tabela salva em %s", nome_arquivo)
         except Exception as e:
-            print(f"Erro ao salvar Q-tabela: {e}")
+            logger.error("Erro ao salvar Q-tabela: %s", e)
+
+    def _converter_acao(self, estado, acao):
+        """Converte uma ação antiga em tupla para o movimento inteiro (ver codificacao.py).
+
+        ('mover', (linha, coluna)) é um passo na direção da casa vizinha, como em
+        converter_movimento_legado: se o oponente estiver nela, o movimento é o salto. As
+        posições dos peões e o jogador da vez vêm do estado (ver JogoQuoridor.get_estado_tupla).
+        ('parede', (linha, coluna, orientacao)) vira o slot da parede. Sem dimensoes_tabuleiro,
+        ou se não houver equivalente, a ação é mantida.
+        """
+        if isinstance(acao, int) or self.dimensoes_tabuleiro is None:
+            return acao
+        linhas, colunas = self.dimensoes_tabuleiro
+        tipo, valor = acao
+        if tipo == "mover":
+            pos_j1, pos_j2, turno = estado[0], estado[1], estado[-1]
+            origem, oponente = (pos_j1, pos_j2) if turno == 0 else (pos_j2, pos_j1)
+            movimento = casa_na_direcao(origem, oponente, direcao_legada(origem, valor), linhas, colunas)
+            if movimento is not None:
+                return movimento
+        elif tipo == "parede":
+            movimento = codificar_parede(*valor, linhas, colunas)
+            if movimento is not None:
+                return movimento
+        return acao
 
     def carregar_q_tabela(self, nome_arquivo=None):
         """Carrega a Q-tabela de um arquivo usando pickle."""
         if nome_arquivo is None:
             nome_arquivo = self.nome_arquivo_q_tabela
         if nome_arquivo is None:
-            print("Erro: Nome do arquivo para carregar a Q-tabela não especificado.")
+            logger.error("Nome do arquivo para carregar a Q-tabela não especificado.")
             return
         try:
             with open(nome_arquivo, "rb") as f:
                 q_tabela_carregada = pickle.load(f)
                 self.q_tabela = defaultdict(lambda: defaultdict(float))
                 for estado, acoes_q_valores in q_tabela_carregada.items():
-                    # As chaves do estado (tuplas) e ações (tuplas) devem ser preservadas pelo pickle
+                    # As chaves do estado (tuplas) e ações (inteiros) são preservadas pelo pickle;
+                    # ações em tupla de Q-tabelas antigas são convertidas para inteiros
                     for acao, q_valor in acoes_q_valores.items():
-                        self.q_tabela[estado][acao] = q_valor
-            print(f"Q-tabela carregada de {nome_arquivo}")
+                        self.q_tabela[estado][self._converter_acao(estado, acao)] = q_valor
+            logger.info("Q-tabela carregada de %s", nome_arquivo)
         except FileNotFoundError:
-            print(
-                f"Arquivo da Q-tabela '{nome_arquivo}' não encontrado. Iniciando com Q-tabela vazia."
+            logger.warning(
+                "Arquivo da Q-tabela '%s' não encontrado. Iniciando com Q-tabela vazia.",
+                nome_arquivo,
             )
         except Exception as e:
-            print(f"Erro ao carregar Q-tabela: {e}. Iniciando com Q-tabela vazia.")
+            logger.error("Erro ao carregar Q-tabela: %s. Iniciando com Q-tabela vazia.", e)
@@ -0,0 +1,579 @@
+# Solução exata e tablebase de variantes pequenas do Quoridor.
+#
+# resolver_variante enumera todos os estados de uma variante (paredes no tabuleiro,
+# paredes restantes de cada jogador, posições dos peões e vez) e calcula o valor
+# teórico e o melhor movimento de cada um por análise retrógrada, como corrida.py
+# faz só com os peões. O resultado vai para um arquivo binário lido com mmap:
+#
+#   cabeçalho | chaves das configurações de paredes (ordenadas) | registros
+#
+# A configuração de paredes é achada por busca binária nas chaves; dentro dela os
+# registros são indexados diretamente por (casa_j1, casa_j2, vez), dois bytes cada
+# (resultado e melhor movimento). Nada é lido ou convertido ao abrir o arquivo.
+#
+# O número de estados cresce muito rápido com as paredes: 5x5 com 1 parede por
+# jogador tem ~650 mil estados, mas com 3 paredes são ~540 mil configurações de
+# paredes e ~870 milhões de estados, fora do alcance de uma solução em Python puro.
+# Por isso variantes maiores são resolvidas em fatias (resolver_fatias): a partir de
+# configurações de paredes dadas, só o que elas alcançam colocando as paredes que
+# restam. gerar_tablebase.py usa as configurações em que partidas reais do agente
+# chegam com no máximo uma parede para cada jogador; as posições com uma única parede
+# restante são resolvidas durante a partida (consultar_fatia).
+
+import mmap
+import os
+import struct
+from array import array
+from collections import deque
+
+from src.core.bitboard import TabuleiroBitboard
+from src.core.caminho import SEM_CAMINHO, campo_distancias
+from src.core.movimentos import destino_andar
+from src.utils.log import obter_logger
+from .corrida import DERROTA, DESCONHECIDO, VITORIA
+
+logger = obter_logger(__name__)
+
+# Pasta e nome padrão dos arquivos gerados por gerar_tablebase.py
+PASTA_TABLEBASES = "tablebases"
+
+MAGIA = b"QTBL"
+VERSAO = 2
+# magia, versão, linhas, colunas, paredes por jogador, máximo de paredes restantes de
+# cada jogador nas configurações do arquivo, largura da chave, número de chaves
+FORMATO_CABECALHO = "<4sBBBBBHI"
+TAMANHO_CABECALHO = struct.calcsize(FORMATO_CABECALHO)
+TAMANHO_REGISTRO = 2
+
+# Movimento guardado para estados sem jogada (terminais ou impossíveis). O movimento
+# ocupa um byte do registro, então todos os movimentos do tabuleiro precisam ser menores
+SEM_MOVIMENTO = 255
+MAXIMO_PAREDES = 15  # As paredes restantes ocupam 4 bits da chave
+
+
+def nome_arquivo(linhas, colunas, paredes):
+    return f"quoridor_{linhas}x{colunas}_{paredes}p.qtb"
+
+
+def chave_paredes(paredes_h, paredes_v, restantes_j1, restantes_j2, casas):
+    """Inteiro que identifica a configuração de paredes (ordem das chaves no arquivo)."""
+    return ((((paredes_v << casas) | paredes_h) << 8) | (restantes_j1 << 4)) | restantes_j2
+
+
+def restantes_chave(chave):
+    """(restantes_j1, restantes_j2) de uma chave de chave_paredes."""
+    return (chave >> 4) & 0xF, chave & 0xF
+
+
+def largura_chave(casas):
+    """Bytes de cada chave no arquivo (big-endian, para comparar como bytes)."""
+    return (2 * casas + 8 + 7) // 8
+
+
+def verificar_variante(linhas, colunas, paredes):
+    """
+    Confere se a variante cabe no formato do arquivo.
+
+    Raises:
+        ValueError: Se algum movimento codificado não couber no byte do registro (a
+            partir do 10x10, com 262 movimentos) ou se houver mais de MAXIMO_PAREDES paredes.
+    """
+    num_movimentos = linhas * colunas + 2 * (linhas - 1) * (colunas - 1)
+    if num_movimentos > SEM_MOVIMENTO:
+        raise ValueError(
+            f"Tabuleiro {linhas}x{colunas} grande demais para a tablebase: "
+            f"{num_movimentos} movimentos não cabem em um byte"
+        )
+    if paredes > MAXIMO_PAREDES:
+        raise ValueError(f"A tablebase aceita até {MAXIMO_PAREDES} paredes por jogador, não {paredes}")
+
+
+class _Posicoes:
+    """Apenas o que destino_andar consulta do jogo, com peões e paredes arbitrários."""
+
+    def __init__(self, tabuleiro):
+        self.linhas = tabuleiro.linhas
+        self.colunas = tabuleiro.colunas
+        self.tabuleiro = tabuleiro
+        self.jogadores = {"J1": None, "J2": None}
+
+
+def _configuracoes_alcancaveis(tabuleiro, raizes):
+    """
+    Configurações (paredes_h, paredes_v, restantes_j1, restantes_j2) alcançáveis a partir
+    das raízes colocando as paredes que restam (sem sobrepor nem cruzar).
+    """
+    alcancadas = set(raizes)
+    pilha = list(alcancadas)
+    num_slots = len(tabuleiro.arestas_slots)
+    while pilha:
+        paredes_h, paredes_v, restantes_j1, restantes_j2 = pilha.pop()
+        if not (restantes_j1 or restantes_j2):
+            continue
+        tabuleiro.paredes_h, tabuleiro.paredes_v = paredes_h, paredes_v
+        for slot in range(num_slots):
+            mascaras = tabuleiro.mascaras_slot(slot)
+            if mascaras is None:
+                continue
+            novo_h, novo_v = paredes_h | mascaras[0], paredes_v | mascaras[1]
+            filhos = []
+            if restantes_j1:
+                filhos.append((novo_h, novo_v, restantes_j1 - 1, restantes_j2))
+            if restantes_j2:
+                filhos.append((novo_h, novo_v, restantes_j1, restantes_j2 - 1))
+            for filho in filhos:
+                if filho not in alcancadas:
+                    alcancadas.add(filho)
+                    pilha.append(filho)
+    tabuleiro.paredes_h = tabuleiro.paredes_v = 0
+    return alcancadas
+
+
+def resolver_variante(linhas, colunas, paredes):
+    """
+    Resolve exatamente a variante com o tamanho e as paredes por jogador dados.
+
+    Args:
+        linhas (int): Linhas do tabuleiro.
+        colunas (int): Colunas do tabuleiro.
+        paredes (int): Paredes por jogador (até MAXIMO_PAREDES).
+
+    Returns:
+        tuple: (chaves, resultados, movimentos). chaves é a lista ordenada de
+            chave_paredes; resultados e movimentos são bytearrays indexados por
+            ((indice_chave * casas + casa_j1) * casas + casa_j2) * 2 + vez, com VITORIA,
+            DERROTA ou DESCONHECIDO para o jogador da vez e o melhor movimento codificado
+            (ver codificacao.py), ou SEM_MOVIMENTO.
+
+    Raises:
+        ValueError: Se a variante não couber no formato do arquivo (ver verificar_variante).
+    """
+    verificar_variante(linhas, colunas, paredes)
+    return resolver_fatia(linhas, colunas, [(0, 0, paredes, paredes)])
+
+
+def resolver_fatia(linhas, colunas, raizes):
+    """
+    Resolve exatamente as configurações alcançáveis a partir das raízes.
+
+    Args:
+        linhas (int): Linhas do tabuleiro.
+        colunas (int): Colunas do tabuleiro.
+        raizes (list): Configurações (paredes_h, paredes_v, restantes_j1, restantes_j2).
+
+    Returns:
+        tuple: (chaves, resultados, movimentos), no formato de resolver_variante.
+    """
+    casas = linhas * colunas
+    ultima_linha = (linhas - 1) * colunas
+    tabuleiro = TabuleiroBitboard(linhas, colunas)
+    posicoes = _Posicoes(tabuleiro)
+    num_slots = len(tabuleiro.arestas_slots)
+
+    # Configurações de paredes: conjunto no tabuleiro e paredes restantes de cada jogador
+    configuracoes = sorted(
+        (chave_paredes(paredes_h, paredes_v, restantes_j1, restantes_j2, casas),
+         paredes_h, paredes_v, restantes_j1, restantes_j2)
+        for paredes_h, paredes_v, restantes_j1, restantes_j2 in _configuracoes_alcancaveis(tabuleiro, raizes)
+    )
+    # Conjuntos de paredes no tabuleiro e se algum jogador ainda coloca paredes sobre eles
+    conjuntos = {}
+    for _, paredes_h, paredes_v, restantes_j1, restantes_j2 in configuracoes:
+        conjuntos[(paredes_h, paredes_v)] = conjuntos.get((paredes_h, paredes_v)) or bool(restantes_j1 or restantes_j2)
+    chaves = [configuracao[0] for configuracao in configuracoes]
+    indice_chave = {chave: indice for indice, chave in enumerate(chaves)}
+    logger.debug("%d configurações de paredes, %d estados", len(chaves), len(chaves) * casas * casas * 2)
+
+    # Por conjunto de paredes: destinos dos peões e paredes que ainda cabem
+    destinos_por_conjunto = {}
+    paredes_por_conjunto = {}
+    for (paredes_h, paredes_v), com_paredes in conjuntos.items():
+        tabuleiro.paredes_h, tabuleiro.paredes_v = paredes_h, paredes_v
+        destinos = [()] * (casas * casas * 2)
+        for casa_j1 in range(casas):
+            for casa_j2 in range(casas):
+                if casa_j1 == casa_j2:
+                    continue
+                posicoes.jogadores["J1"] = divmod(casa_j1, colunas)
+                posicoes.jogadores["J2"] = divmod(casa_j2, colunas)
+                for vez in (0, 1):
+                    lista = []
+                    for direcao in ("w", "s", "a", "d"):
+                        destino = destino_andar(posicoes, direcao, vez)
+                        if destino is not None:
+                            lista.append(destino[0] * colunas + destino[1])
+                    destinos[(casa_j1 * casas + casa_j2) * 2 + vez] = tuple(lista)
+        destinos_por_conjunto[(paredes_h, paredes_v)] = destinos
+
+        novas = []
+        if not com_paredes:
+            paredes_por_conjunto[(paredes_h, paredes_v)] = novas
+            continue
+        for slot in range(num_slots):
+            tabuleiro.paredes_h, tabuleiro.paredes_v = paredes_h, paredes_v
+            mascaras = tabuleiro.mascaras_slot(slot)
+            if mascaras is None:
+                continue
+            tabuleiro.paredes_h |= mascaras[0]
+            tabuleiro.paredes_v |= mascaras[1]
+            novas.append(
+                (casas + slot, tabuleiro.paredes_h, tabuleiro.paredes_v,
+                 campo_distancias("J1", tabuleiro), campo_distancias("J2", tabuleiro))
+            )
+        paredes_por_conjunto[(paredes_h, paredes_v)] = novas
+    tabuleiro.paredes_h = tabuleiro.paredes_v = 0
+
+    # Grafo de estados: sucessores (com o movimento) de cada estado não terminal
+    total = len(chaves) * casas * casas * 2
+    resultados = bytearray(total)
+    distancias = array("H", bytes(2 * total))
+    pendentes = array("B", bytes(total))
+    inicio_sucessores = array("i", [0])
+    sucessores = array("i")
+    movimentos_sucessores = array("B")
+    fila = deque()
+
+    for indice, (_, paredes_h, paredes_v, restantes_j1, restantes_j2) in enumerate(configuracoes):
+        destinos = destinos_por_conjunto[(paredes_h, paredes_v)]
+        novas = paredes_por_conjunto[(paredes_h, paredes_v)]
+        base = indice * casas * casas * 2
+        for casa_j1 in range(casas):
+            for casa_j2 in range(casas):
+                for vez in (0, 1):
+                    local = (casa_j1 * casas + casa_j2) * 2 + vez
+                    estado = base + local
+                    if casa_j1 != casa_j2 and (casa_j1 >= ultima_linha or casa_j2 < colunas):
+                        # Quem chegou ao objetivo venceu na jogada anterior
+                        resultados[estado] = DERROTA
+                        fila.append(estado)
+                    elif casa_j1 != casa_j2:
+                        quantidade = 0
+                        for destino in destinos[local]:
+                            if vez == 0:
+                                sucessor = base + (destino * casas + casa_j2) * 2 + 1
+                            else:
+                                sucessor = base + (casa_j1 * casas + destino) * 2
+                            sucessores.append(sucessor)
+                            movimentos_sucessores.append(destino)
+                            quantidade += 1
+                        if (restantes_j1 if vez == 0 else restantes_j2) > 0:
+                            for movimento, novo_h, novo_v, campo_j1, campo_j2 in novas:
+                                if campo_j1[casa_j1] >= SEM_CAMINHO or campo_j2[casa_j2] >= SEM_CAMINHO:
+                                    continue  # Deixaria um jogador sem caminho
+                                if vez == 0:
+                                    chave = chave_paredes(novo_h, novo_v, restantes_j1 - 1, restantes_j2, casas)
+                                else:
+                                    chave = chave_paredes(novo_h, novo_v, restantes_j1, restantes_j2 - 1, casas)
+                                sucessor = indice_chave[chave] * casas * casas * 2 + local ^ 1
+                                sucessores.append(sucessor)
+                                movimentos_sucessores.append(movimento)
+                                quantidade += 1
+                        pendentes[estado] = quantidade
+                        if quantidade == 0:
+                            # Sem jogada: o jogador da vez não tem como continuar
+                            resultados[estado] = DERROTA
+                            fila.append(estado)
+                    inicio_sucessores.append(len(sucessores))
+
+    # Antecessores no mesmo formato (índices contíguos por estado)
+    contagem = array("i", bytes(4 * (total + 1)))
+    for sucessor in sucessores:
+        contagem[sucessor + 1] += 1
+    for estado in range(total):
+        contagem[estado + 1] += contagem[estado]
+    antecessores = array("i", bytes(4 * len(sucessores)))
+    posicao = array("i", contagem)
+    for estado in range(total):
+        for indice in range(inicio_sucessores[estado], inicio_sucessores[estado + 1]):
+            sucessor = sucessores[indice]
+            antecessores[posicao[sucessor]] = estado
+            posicao[sucessor] += 1
+
+    # Análise retrógrada em ordem de distância (ver corrida.resolver_corrida)
+    while fila:
+        estado = fila.popleft()
+        perdido = resultados[estado] == DERROTA
+        for indice in range(contagem[estado], contagem[estado + 1]):
+            anterior = antecessores[indice]
+            if resultados[anterior] != DESCONHECIDO:
+                continue
+            if perdido:
+                resultados[anterior] = VITORIA
+                distancias[anterior] = distancias[estado] + 1
+                fila.append(anterior)
+            else:
+                pendentes[anterior] -= 1
+                if pendentes[anterior] == 0:
+                    resultados[anterior] = DERROTA
+                    distancias[anterior] = distancias[estado] + 1
+                    fila.append(anterior)
+
+    # Melhor movimento: vitória mais rápida, empate mantido ou derrota mais lenta
+    movimentos = bytearray([SEM_MOVIMENTO]) * total
+    for estado in range(total):
+        resultado = resultados[estado]
+        melhor, melhor_distancia = SEM_MOVIMENTO, None
+        for indice in range(inicio_sucessores[estado], inicio_sucessores[estado + 1]):
+            sucessor = sucessores[indice]
+            resultado_sucessor = resultados[sucessor]
+            if resultado == VITORIA:
+                if resultado_sucessor == DERROTA and (
+                    melhor_distancia is None or distancias[sucessor] < melhor_distancia
+                ):
+                    melhor, melhor_distancia = movimentos_sucessores[indice], distancias[sucessor]
+            elif resultado == DESCONHECIDO:
+                if resultado_sucessor == DESCONHECIDO:
+                    melhor = movimentos_sucessores[indice]
+                    break
+            elif melhor_distancia is None or distancias[sucessor] > melhor_distancia:
+                melhor, melhor_distancia = movimentos_sucessores[indice], distancias[sucessor]
+        movimentos[estado] = melhor
+
+    return chaves, resultados, movimentos
+
+
+def resolver_fatias(linhas, colunas, paredes, raizes, minimo_restantes=1):
+    """
+    Resolve as configurações alcançáveis a partir de cada raiz e junta os resultados.
+
+    Cada raiz é resolvida separadamente (o grafo de todas juntas não caberia na memória),
+    e raízes já alcançadas por outra são puladas. Só são guardadas as configurações com
+    pelo menos ``minimo_restantes`` paredes restantes, somando os dois jogadores: as sem
+    nenhuma são corridas, resolvidas por corrida.py, e as com poucas podem ser resolvidas
+    durante a partida (ver consultar_fatia).
+
+    Args:
+        linhas (int): Linhas do tabuleiro.
+        colunas (int): Colunas do tabuleiro.
+        paredes (int): Paredes por jogador da variante.
+        raizes (list): Configurações (paredes_h, paredes_v, restantes_j1, restantes_j2).
+        minimo_restantes (int): Paredes restantes das configurações guardadas.
+
+    Returns:
+        tuple: (chaves, resultados, movimentos), no formato de resolver_variante.
+
+    Raises:
+        ValueError: Se a variante não couber no formato do arquivo (ver verificar_variante).
+    """
+    verificar_variante(linhas, colunas, paredes)
+    casas = linhas * colunas
+    tamanho = casas * casas * 2
+    # Mais paredes restantes primeiro: o fecho delas cobre as raízes que vêm depois
+    raizes = sorted(raizes, key=lambda raiz: raiz[2] + raiz[3], reverse=True)
+    blocos = {}
+    for numero, raiz in enumerate(raizes):
+        if raiz[2] + raiz[3] < minimo_restantes or chave_paredes(*raiz, casas) in blocos:
+            continue
+        chaves, resultados, movimentos = resolver_fatia(linhas, colunas, [raiz])
+        for indice, chave in enumerate(chaves):
+            if sum(restantes_chave(chave)) >= minimo_restantes and chave not in blocos:
+                inicio = indice * tamanho
+                blocos[chave] = (resultados[inicio:inicio + tamanho], movimentos[inicio:inicio + tamanho])
+        logger.info("Raiz %d de %d resolvida: %d configurações", numero + 1, len(raizes), len(blocos))
+
+    chaves = sorted(blocos)
+    resultados = bytearray().join(blocos[chave][0] for chave in chaves)
+    movimentos = bytearray().join(blocos[chave][1] for chave in chaves)
+    return chaves, resultados, movimentos
+
+
+def salvar_tablebase(caminho, linhas, colunas, paredes, chaves, resultados, movimentos):
+    """
+    Grava o resultado de resolver_variante ou resolver_fatias no formato lido por Tablebase.
+
+    Raises:
+        ValueError: Se a variante não couber no formato do arquivo (ver verificar_variante).
+    """
+    verificar_variante(linhas, colunas, paredes)
+    casas = linhas * colunas
+    largura = largura_chave(casas)
+    limite_restantes = max((max(restantes_chave(chave)) for chave in chaves), default=0)
+    registros = bytearray(TAMANHO_REGISTRO * len(resultados))
+    registros[0::2] = resultados
+    registros[1::2] = movimentos
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(
+            struct.pack(
+                FORMATO_CABECALHO, MAGIA, VERSAO, linhas, colunas, paredes, limite_restantes, largura, len(chaves)
+            )
+        )
+        for chave in chaves:
+            arquivo.write(chave.to_bytes(largura, "big"))
+        arquivo.write(registros)
+
+
+class Tablebase:
+    """Consulta a um arquivo gerado por salvar_tablebase, mapeado em memória com mmap."""
+
+    def __init__(self, caminho):
+        """
+        Args:
+            caminho (str): Arquivo da tablebase.
+
+        Raises:
+            ValueError: Se o arquivo não for uma tablebase desta versão.
+        """
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, versao, linhas, colunas, paredes, limite_restantes, largura, num_chaves = struct.unpack_from(
+            FORMATO_CABECALHO, self._mapa, 0
+        )
+        if magia != MAGIA or versao != VERSAO:
+            self._mapa.close()
+            raise ValueError(f"Arquivo de tablebase inválido: {caminho}")
+        self.linhas = linhas
+        self.colunas = colunas
+        self.paredes = paredes
+        # Nenhuma configuração do arquivo tem mais paredes restantes para um jogador
+        self.limite_restantes = limite_restantes
+        self._largura = largura
+        self._num_chaves = num_chaves
+        self._inicio_registros = TAMANHO_CABECALHO + largura * num_chaves
+
+    def fechar(self):
+        self._mapa.close()
+
+    def _indice_chave(self, chave):
+        """Busca binária da chave entre as chaves do arquivo (None se não existir)."""
+        procurada = chave.to_bytes(self._largura, "big")
+        baixo, alto = 0, self._num_chaves
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            inicio = TAMANHO_CABECALHO + meio * self._largura
+            atual = self._mapa[inicio:inicio + self._largura]
+            if atual < procurada:
+                baixo = meio + 1
+            elif atual > procurada:
+                alto = meio
+            else:
+                return meio
+        return None
+
+    def consultar(self, jogo, turno):
+        """
+        Valor teórico e melhor movimento da posição.
+
+        Args:
+            jogo (JogoQuoridor): Jogo atual.
+            turno (int): Jogador da vez (0 para J1, 1 para J2).
+
+        Returns:
+            tuple | None: (resultado, movimento) com VITORIA, DERROTA ou DESCONHECIDO para
+                o jogador da vez e o movimento codificado (SEM_MOVIMENTO se não houver), ou
+                None se a posição não for desta variante ou não estiver no arquivo.
+        """
+        if (jogo.linhas, jogo.colunas) != (self.linhas, self.colunas):
+            return None
+        if jogo.estado_inicial_paredes_restantes["J1"] != self.paredes:
+            return None
+        if max(jogo.paredes_restantes["J1"], jogo.paredes_restantes["J2"]) > self.limite_restantes:
+            return None
+        tabuleiro = jogo.tabuleiro
+        casas = self.linhas * self.colunas
+        indice = self._indice_chave(
+            chave_paredes(
+                tabuleiro.paredes_h,
+                tabuleiro.paredes_v,
+                jogo.paredes_restantes["J1"],
+                jogo.paredes_restantes["J2"],
+                casas,
+            )
+        )
+        if indice is None:
+            return None
+        estado = ((indice * casas + tabuleiro.pos_j1) * casas + tabuleiro.pos_j2) * 2 + turno
+        inicio = self._inicio_registros + TAMANHO_REGISTRO * estado
+        resultado, movimento = self._mapa[inicio], self._mapa[inicio + 1]
+        return resultado, movimento
+
+
+# Tablebases já abertas por variante (None quando não há arquivo)
+_TABLEBASES = {}
+
+# Posições fora do arquivo com até PAREDES_SOB_DEMANDA paredes restantes (somando os
+# dois jogadores) são resolvidas durante a partida: a fatia da configuração atual tem
+# poucos estados (~0,2 s no 5x5) e vale até a última parede. Em tabuleiros grandes,
+# cujas fatias passariam de LIMITE_ESTADOS_SOB_DEMANDA estados, a busca continua
+PAREDES_SOB_DEMANDA = 1
+LIMITE_ESTADOS_SOB_DEMANDA = 100000
+
+# Registros das configurações já resolvidas durante a partida: {chave_paredes: (resultados, movimentos)}
+LIMITE_CACHE_FATIAS = 256
+_FATIAS = {}
+
+
+def consultar_fatia(jogo, turno):
+    """
+    Valor teórico e melhor movimento da posição, resolvendo a fatia dela se preciso.
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual (não é alterado).
+        turno (int): Jogador da vez (0 para J1, 1 para J2).
+
+    Returns:
+        tuple | None: (resultado, movimento) como em Tablebase.consultar, ou None se a
+            posição tiver paredes restantes demais (ou nenhuma: é uma corrida) ou o
+            tabuleiro for grande demais.
+    """
+    restantes_j1, restantes_j2 = jogo.paredes_restantes["J1"], jogo.paredes_restantes["J2"]
+    if not 0 < restantes_j1 + restantes_j2 <= PAREDES_SOB_DEMANDA:
+        return None
+    tabuleiro = jogo.tabuleiro
+    casas = jogo.linhas * jogo.colunas
+    tamanho = casas * casas * 2
+    chave = chave_paredes(tabuleiro.paredes_h, tabuleiro.paredes_v, restantes_j1, restantes_j2, casas)
+    bloco = _FATIAS.get(chave)
+    if bloco is None:
+        # A fatia tem a configuração atual e, no máximo, uma corrida por parede possível
+        if tamanho * (1 + len(tabuleiro.arestas_slots)) > LIMITE_ESTADOS_SOB_DEMANDA:
+            return None
+        chaves, resultados, movimentos = resolver_fatia(
+            jogo.linhas, jogo.colunas, [(tabuleiro.paredes_h, tabuleiro.paredes_v, restantes_j1, restantes_j2)]
+        )
+        indice = chaves.index(chave) * tamanho
+        bloco = (resultados[indice:indice + tamanho], movimentos[indice:indice + tamanho])
+        if len(_FATIAS) >= LIMITE_CACHE_FATIAS:
+            _FATIAS.clear()
+        _FATIAS[chave] = bloco
+        logger.debug("Fatia da tablebase resolvida durante a partida (%d configurações)", len(chaves))
+    estado = (tabuleiro.pos_j1 * casas + tabuleiro.pos_j2) * 2 + turno
+    return bloco[0][estado], bloco[1][estado]
+
+
+def movimento_tablebase(jogo, turno, pasta=PASTA_TABLEBASES):
+    """
+    Melhor movimento segundo a tablebase da variante do jogo (o arquivo, se existir, ou
+    a fatia resolvida durante a partida, ver consultar_fatia).
+
+    Só posições decididas são respondidas: num empate por repetição qualquer movimento
+    que mantém o empate serve, e a busca escolhe melhor entre eles.
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual (não é alterado).
+        turno (int): Jogador da vez (0 para J1, 1 para J2).
+        pasta (str): Pasta dos arquivos gerados por gerar_tablebase.py.
+
+    Returns:
+        int | None: Movimento codificado (ver codificacao.py), ou None se não houver
+            resposta para a posição ou ela não estiver decidida.
+    """
+    paredes = jogo.estado_inicial_paredes_restantes["J1"]
+    caminho = os.path.join(pasta, nome_arquivo(jogo.linhas, jogo.colunas, paredes))
+    if caminho not in _TABLEBASES:
+        tablebase = None
+        if os.path.exists(caminho):
+            try:
+                tablebase = Tablebase(caminho)
+            except ValueError as erro:
+                # Arquivo de uma versão anterior: gere de novo com gerar_tablebase.py
+                logger.warning("%s", erro)
+        _TABLEBASES[caminho] = tablebase
+    tablebase = _TABLEBASES[caminho]
+    consulta = None if tablebase is None else tablebase.consultar(jogo, turno)
+    if consulta is None:
+        consulta = consultar_fatia(jogo, turno)
+    if consulta is None or consulta[0] == DESCONHECIDO or consulta[1] == SEM_MOVIMENTO:
+        return None
+    resultado, movimento = consulta
+    logger.debug("Tablebase: %s para o jogador da vez", "vitória" if resultado == VITORIA else "derrota")
+    return movimento
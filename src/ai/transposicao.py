@@ -0,0 +1,119 @@
+# Tabela de transposição com limites (exato / inferior / superior) e memória fixa.
+#
+# Cada bucket tem duas entradas: a primeira só é substituída por buscas de
+# profundidade maior ou igual (depth-preferred) e a segunda é sempre substituída
+# (always-replace). Assim resultados caros sobrevivem e os recentes também têm lugar.
+#
+# A tabela é mantida entre as profundidades do aprofundamento iterativo e entre as
+# jogadas; cada busca abre uma nova geração (nova_busca) e as entradas de gerações
+# anteriores são as primeiras a ser substituídas, mesmo por resultados menos profundos
+# da mesma posição.
+
+# Tipo do valor guardado, em relação à janela (alfa, beta) em que ele foi calculado
+EXATO = 0  # alfa < valor < beta: valor minimax exato
+LIMITE_INFERIOR = 1  # valor >= beta (poda): o valor real é pelo menos este
+LIMITE_SUPERIOR = 2  # valor <= alfa: o valor real é no máximo este
+
+# Número padrão de entradas (duas por bucket); cada entrada ocupa ~150 bytes quando usada
+ENTRADAS_PADRAO = 1 << 17
+
+
+def tipo_do_valor(valor, alfa, beta):
+    """Classifica um valor calculado com a janela original (alfa, beta) da busca."""
+    if valor <= alfa:
+        return LIMITE_SUPERIOR
+    if valor >= beta:
+        return LIMITE_INFERIOR
+    return EXATO
+
+
+class TabelaTransposicao:
+    """Tabela de transposição de tamanho fixo indexada pela chave Zobrist do jogo.
+
+    Cada entrada guarda (chave, profundidade, valor, tipo, melhor_movimento, geracao). A chave
+    completa é conferida na consulta, então colisões de índice não retornam valores errados.
+    """
+
+    def __init__(self, num_entradas=ENTRADAS_PADRAO):
+        """
+        Args:
+            num_entradas (int): Máximo de entradas guardadas (arredondado para uma potência de 2).
+        """
+        num_buckets = 1
+        while num_buckets * 2 < num_entradas:
+            num_buckets *= 2
+        self.num_buckets = num_buckets
+        self._mascara = num_buckets - 1
+        self._entradas = [None] * (2 * num_buckets)
+        self._ocupadas = 0
+        self.geracao = 0
+
+    def __len__(self):
+        return self._ocupadas
+
+    def clear(self):
+        self._entradas = [None] * (2 * self.num_buckets)
+        self._ocupadas = 0
+        self.geracao = 0
+
+    def nova_busca(self):
+        """Inicia uma nova geração: as entradas atuais continuam válidas, mas passam a ser substituíveis."""
+        self.geracao += 1
+
+    def consultar(self, chave):
+        """
+        Returns:
+            tuple | None: (profundidade, valor, tipo, melhor_movimento) ou None se a chave não estiver na tabela.
+        """
+        indice = (chave & self._mascara) << 1
+        entradas = self._entradas
+        for entrada in (entradas[indice], entradas[indice + 1]):
+            if entrada is not None and entrada[0] == chave:
+                return entrada[1:5]
+        return None
+
+    def melhor_movimento(self, chave):
+        """Melhor movimento guardado para a chave, ou None."""
+        entrada = self.consultar(chave)
+        return entrada[3] if entrada is not None else None
+
+    def armazenar(self, chave, profundidade, valor, tipo, melhor_movimento=None):
+        """Guarda o resultado de uma busca, substituindo entradas conforme o esquema de buckets."""
+        indice = (chave & self._mascara) << 1
+        entradas = self._entradas
+        preferida = entradas[indice]
+        sempre = entradas[indice + 1]
+        geracao = self.geracao
+
+        if preferida is not None and preferida[0] == chave:
+            if (
+                profundidade < preferida[1]
+                and preferida[5] == geracao
+                and (tipo != EXATO or preferida[3] == EXATO)
+            ):
+                # Já há um resultado mais profundo desta posição, desta busca e tão preciso
+                # quanto o novo. Um limite de uma busca anterior, ou um limite quando o novo
+                # valor é exato, dá lugar ao novo resultado
+                return
+            if melhor_movimento is None:
+                melhor_movimento = preferida[4]
+            entradas[indice] = (chave, profundidade, valor, tipo, melhor_movimento, geracao)
+            return
+        if sempre is not None and sempre[0] == chave:
+            if melhor_movimento is None:
+                melhor_movimento = sempre[4]
+            sempre = None  # Será substituída pela nova entrada
+
+        nova = (chave, profundidade, valor, tipo, melhor_movimento, geracao)
+        if preferida is None or preferida[5] != geracao:
+            # Posição vazia ou de uma busca anterior: a nova entrada ocupa o lugar
+            novas = (nova, sempre)
+        elif profundidade >= preferida[1]:
+            # A entrada substituída ainda é útil: desce para a posição always-replace
+            novas = (nova, preferida)
+        else:
+            novas = (preferida, nova)
+
+        antes = (entradas[indice] is not None) + (entradas[indice + 1] is not None)
+        entradas[indice], entradas[indice + 1] = novas
+        self._ocupadas += (novas[0] is not None) + (novas[1] is not None) - antes
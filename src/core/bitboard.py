@@ -0,0 +1,403 @@
+# Representação do tabuleiro em bitboards.
+#
+# Cada casa (linha, coluna) corresponde ao bit ``linha * colunas + coluna``.
+# As paredes ficam em duas máscaras inteiras de arestas bloqueadas:
+#   paredes_h: bit ligado em (l, c) quando não se pode mover de (l, c) para (l + 1, c)
+#   paredes_v: bit ligado em (l, c) quando não se pode mover de (l, c) para (l, c + 1)
+# Isso equivale exatamente às flags pode_mover_para_baixo/direita de Square,
+# então as regras de sobreposição e cruzamento continuam as mesmas.
+
+# Máscaras pré-calculadas por tamanho de tabuleiro: {(linhas, colunas): dict}
+_MASCARAS = {}
+
+
+def mascaras_tabuleiro(linhas, colunas):
+    """Retorna (e guarda em cache) as máscaras fixas de um tamanho de tabuleiro."""
+    chave = (linhas, colunas)
+    mascaras = _MASCARAS.get(chave)
+    if mascaras is None:
+        linha_cheia = (1 << colunas) - 1
+        primeira_coluna = 0
+        ultima_coluna = 0
+        for linha in range(linhas):
+            primeira_coluna |= 1 << (linha * colunas)
+            ultima_coluna |= 1 << (linha * colunas + colunas - 1)
+        mascaras = {
+            "todas": (1 << (linhas * colunas)) - 1,
+            "primeira_linha": linha_cheia,
+            "ultima_linha": linha_cheia << ((linhas - 1) * colunas),
+            "primeira_coluna": primeira_coluna,
+            "ultima_coluna": ultima_coluna,
+        }
+        _MASCARAS[chave] = mascaras
+    return mascaras
+
+
+# Posições de parede por tamanho de tabuleiro: {(linhas, colunas): tuple}
+_SLOTS = {}
+
+
+def slots_parede(linhas, colunas):
+    """
+    Lista (em cache) todas as 2 * (linhas - 1) * (colunas - 1) posições de parede do tabuleiro.
+
+    O slot ``2 * (linha * (colunas - 1) + c) + o`` é a parede horizontal em (linha, c)
+    quando o == 0 e a parede vertical entre as colunas c e c + 1 quando o == 1.
+
+    Returns:
+        tuple: Um item (linha, coluna, orientacao, notacao) por slot, com linha/coluna
+            no formato de TabuleiroBitboard.colocar_parede (para 'v', a coluna à direita da parede).
+    """
+    chave = (linhas, colunas)
+    slots = _SLOTS.get(chave)
+    if slots is None:
+        slots = []
+        for linha in range(linhas - 1):
+            for coluna in range(colunas - 1):
+                for orientacao, coluna_parede in (("h", coluna), ("v", coluna + 1)):
+                    notacao = f"{chr(ord('a') + coluna_parede)}{linha + 1}{orientacao}"
+                    slots.append((linha, coluna_parede, orientacao, notacao))
+        slots = tuple(slots)
+        _SLOTS[chave] = slots
+    return slots
+
+
+# Arestas de cada slot de parede por tamanho de tabuleiro: {(linhas, colunas): tuple}
+_ARESTAS_SLOTS = {}
+
+
+def arestas_slots(linhas, colunas):
+    """
+    Lista (em cache) as máscaras de cada slot de slots_parede.
+
+    Returns:
+        tuple: Um item (mascara_h, mascara_v, cruzamento_h, cruzamento_v) por slot: as arestas
+            que a parede bloqueia e as arestas que, se já estiverem todas bloqueadas,
+            indicam uma parede cruzada (0 quando não se aplica).
+    """
+    chave = (linhas, colunas)
+    arestas = _ARESTAS_SLOTS.get(chave)
+    if arestas is None:
+        arestas = []
+        for linha, coluna, orientacao, _ in slots_parede(linhas, colunas):
+            if orientacao == "h":
+                bit = linha * colunas + coluna
+                cruzamento = (1 << bit) | (1 << (bit + colunas))
+                arestas.append((3 << bit, 0, 0, cruzamento))
+            else:
+                bit = linha * colunas + coluna - 1
+                mascara = (1 << bit) | (1 << (bit + colunas))
+                arestas.append((0, mascara, 3 << bit, 0))
+        arestas = tuple(arestas)
+        _ARESTAS_SLOTS[chave] = arestas
+    return arestas
+
+
+class CasaBitboard:
+    """Visão de uma casa com a mesma interface de Square, lida dos bitboards."""
+
+    __slots__ = ("_tab", "_linha", "_coluna", "_bit")
+
+    def __init__(self, tabuleiro, linha, coluna):
+        self._tab = tabuleiro
+        self._linha = linha
+        self._coluna = coluna
+        self._bit = linha * tabuleiro.colunas + coluna
+
+    @property
+    def pode_mover_para_cima(self):
+        return self._tab.pode_mover(self._linha, self._coluna, "w")
+
+    @pode_mover_para_cima.setter
+    def pode_mover_para_cima(self, valor):
+        if self._linha > 0:
+            self._tab._definir_aresta_h(self._bit - self._tab.colunas, valor)
+
+    @property
+    def pode_mover_para_baixo(self):
+        return not (self._tab.paredes_h >> self._bit) & 1
+
+    @pode_mover_para_baixo.setter
+    def pode_mover_para_baixo(self, valor):
+        self._tab._definir_aresta_h(self._bit, valor)
+
+    @property
+    def pode_mover_para_esquerda(self):
+        return self._tab.pode_mover(self._linha, self._coluna, "a")
+
+    @pode_mover_para_esquerda.setter
+    def pode_mover_para_esquerda(self, valor):
+        if self._coluna > 0:
+            self._tab._definir_aresta_v(self._bit - 1, valor)
+
+    @property
+    def pode_mover_para_direita(self):
+        return not (self._tab.paredes_v >> self._bit) & 1
+
+    @pode_mover_para_direita.setter
+    def pode_mover_para_direita(self, valor):
+        self._tab._definir_aresta_v(self._bit, valor)
+
+    @property
+    def tem_jogador(self):
+        return self._bit in (self._tab.pos_j1, self._tab.pos_j2)
+
+    def __repr__(self):
+        return (f"Square(U:{self.pode_mover_para_cima}, D:{self.pode_mover_para_baixo}, "
+                f"L:{self.pode_mover_para_esquerda}, R:{self.pode_mover_para_direita}, "
+                f"P:{self.tem_jogador})")
+
+
+class _LinhaBitboard:
+    __slots__ = ("_tab", "_linha")
+
+    def __init__(self, tabuleiro, linha):
+        self._tab = tabuleiro
+        self._linha = linha
+
+    def __len__(self):
+        return self._tab.colunas
+
+    def __getitem__(self, coluna):
+        if coluna < 0:
+            coluna += self._tab.colunas
+        if not 0 <= coluna < self._tab.colunas:
+            raise IndexError("coluna fora do tabuleiro")
+        return CasaBitboard(self._tab, self._linha, coluna)
+
+    def __iter__(self):
+        for coluna in range(self._tab.colunas):
+            yield CasaBitboard(self._tab, self._linha, coluna)
+
+
+class TabuleiroBitboard:
+    """Tabuleiro com paredes em máscaras de bits e peões como índices inteiros.
+
+    Também se comporta como a antiga lista de listas de Square
+    (``tabuleiro[linha][coluna].pode_mover_para_baixo``), para que a GUI e o
+    código de depuração continuem funcionando sem mudanças.
+    """
+
+    def __init__(self, linhas, colunas):
+        self.linhas = linhas
+        self.colunas = colunas
+        self.mascaras = mascaras_tabuleiro(linhas, colunas)
+        self.arestas_slots = arestas_slots(linhas, colunas)
+        self.paredes_h = 0
+        self.paredes_v = 0
+        self.pos_j1 = 0
+        self.pos_j2 = 0
+        # Último resultado de paredes_congeladas: (paredes_h, paredes_v, frozenset_h, frozenset_v)
+        self._cache_paredes = (0, 0, frozenset(), frozenset())
+        # Campos de distância e menores caminhos já calculados (ver caminho.py). As chaves
+        # incluem paredes (e posição), então os dicionários podem ser compartilhados entre cópias.
+        self.cache_distancias = {}
+        self.cache_caminhos = {}
+
+    def copiar(self):
+        copia = TabuleiroBitboard.__new__(TabuleiroBitboard)
+        copia.__dict__.update(self.__dict__)
+        return copia
+
+    def __deepcopy__(self, memo):
+        # Só há inteiros e máscaras compartilhadas (imutáveis na prática)
+        return self.copiar()
+
+    def __getstate__(self):
+        # Serializado a cada tarefa da busca paralela: sem os caches de caminhos (que
+        # passam de 1 MB) nem as máscaras compartilhadas por tamanho de tabuleiro
+        estado = self.__dict__.copy()
+        for nome in ("mascaras", "arestas_slots", "cache_distancias", "cache_caminhos"):
+            estado.pop(nome, None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.mascaras = mascaras_tabuleiro(self.linhas, self.colunas)
+        self.arestas_slots = arestas_slots(self.linhas, self.colunas)
+        self.cache_distancias = {}
+        self.cache_caminhos = {}
+
+    # --- Compatibilidade com a interface de lista de Square ---
+
+    def __len__(self):
+        return self.linhas
+
+    def __getitem__(self, linha):
+        if linha < 0:
+            linha += self.linhas
+        if not 0 <= linha < self.linhas:
+            raise IndexError("linha fora do tabuleiro")
+        return _LinhaBitboard(self, linha)
+
+    def __iter__(self):
+        for linha in range(self.linhas):
+            yield _LinhaBitboard(self, linha)
+
+    def _definir_aresta_h(self, bit, livre):
+        if livre:
+            self.paredes_h &= ~(1 << bit)
+        else:
+            self.paredes_h |= 1 << bit
+
+    def _definir_aresta_v(self, bit, livre):
+        if livre:
+            self.paredes_v &= ~(1 << bit)
+        else:
+            self.paredes_v |= 1 << bit
+
+    # --- Peões ---
+
+    def indice(self, linha, coluna):
+        return linha * self.colunas + coluna
+
+    def coordenadas(self, indice):
+        return divmod(indice, self.colunas)
+
+    def posicionar_peao(self, jogador, linha, coluna):
+        if jogador == "J1":
+            self.pos_j1 = linha * self.colunas + coluna
+        else:
+            self.pos_j2 = linha * self.colunas + coluna
+
+    # --- Movimento ---
+
+    def pode_mover(self, linha, coluna, direcao):
+        """Indica se não há borda nem parede entre (linha, coluna) e a casa vizinha na direção."""
+        bit = linha * self.colunas + coluna
+        if direcao == "s":
+            return linha < self.linhas - 1 and not (self.paredes_h >> bit) & 1
+        if direcao == "w":
+            return linha > 0 and not (self.paredes_h >> (bit - self.colunas)) & 1
+        if direcao == "d":
+            return coluna < self.colunas - 1 and not (self.paredes_v >> bit) & 1
+        if direcao == "a":
+            return coluna > 0 and not (self.paredes_v >> (bit - 1)) & 1
+        return False
+
+    def vizinhos(self, indice):
+        """Lista os índices das casas alcançáveis a partir de ``indice`` em um passo."""
+        colunas = self.colunas
+        linha, coluna = divmod(indice, colunas)
+        resultado = []
+        if linha > 0 and not (self.paredes_h >> (indice - colunas)) & 1:
+            resultado.append(indice - colunas)
+        if linha < self.linhas - 1 and not (self.paredes_h >> indice) & 1:
+            resultado.append(indice + colunas)
+        if coluna > 0 and not (self.paredes_v >> (indice - 1)) & 1:
+            resultado.append(indice - 1)
+        if coluna < colunas - 1 and not (self.paredes_v >> indice) & 1:
+            resultado.append(indice + 1)
+        return resultado
+
+    def expandir(self, conjunto):
+        """
+        Expande um conjunto de casas (bitset) em um passo em todas as direções livres.
+
+        Cada direção é um deslocamento da máscara inteira filtrado pelas paredes, então
+        uma camada inteira de BFS custa algumas operações com inteiros grandes.
+        """
+        colunas = self.colunas
+        paredes_h = self.paredes_h
+        livre_v = ~self.paredes_v & ~self.mascaras["ultima_coluna"]
+        return (
+            conjunto
+            | ((conjunto & ~paredes_h) << colunas)
+            | ((conjunto >> colunas) & ~paredes_h)
+            | ((conjunto & livre_v) << 1)
+            | ((conjunto >> 1) & livre_v)
+        ) & self.mascaras["todas"]
+
+    # --- Paredes ---
+
+    def mascaras_parede(self, linha, coluna, orientacao):
+        """Valida uma parede e devolve as arestas que ela bloquearia.
+
+        Args:
+            linha (int): Linha da parede (notação numérica - 1).
+            coluna (int): Coluna da parede (letra da notação).
+            orientacao (str): 'h' ou 'v'.
+
+        Returns:
+            tuple | None: (mascara_h, mascara_v) se a parede pode ser colocada,
+            None se estiver fora do tabuleiro, sobrepuser ou cruzar outra parede.
+        """
+        colunas = self.colunas
+        if orientacao == "h":
+            if not (0 <= linha < self.linhas - 1 and 0 <= coluna < colunas - 1):
+                return None
+            bit = linha * colunas + coluna
+            mascara = 3 << bit
+            if self.paredes_h & mascara:
+                return None  # Sobreposição
+            if (self.paredes_v >> bit) & 1 and (self.paredes_v >> (bit + colunas)) & 1:
+                return None  # Cruzamento
+            return mascara, 0
+        if orientacao == "v":
+            if not (0 <= linha < self.linhas - 1 and 0 < coluna < colunas):
+                return None
+            bit = linha * colunas + coluna - 1
+            mascara = (1 << bit) | (1 << (bit + colunas))
+            if self.paredes_v & mascara:
+                return None  # Sobreposição
+            if (self.paredes_h >> bit) & 3 == 3:
+                return None  # Cruzamento
+            return 0, mascara
+        return None
+
+    def mascaras_slot(self, slot):
+        """Mesmo que mascaras_parede, para um slot de slots_parede (sem verificar limites)."""
+        mascara_h, mascara_v, cruzamento_h, cruzamento_v = self.arestas_slots[slot]
+        if self.paredes_h & mascara_h or self.paredes_v & mascara_v:
+            return None  # Sobreposição
+        if cruzamento_h and self.paredes_h & cruzamento_h == cruzamento_h:
+            return None  # Cruzamento
+        if cruzamento_v and self.paredes_v & cruzamento_v == cruzamento_v:
+            return None  # Cruzamento
+        return mascara_h, mascara_v
+
+    def colocar_parede(self, linha, coluna, orientacao):
+        """Coloca a parede se ela não sair do tabuleiro, sobrepuser ou cruzar outra."""
+        mascaras = self.mascaras_parede(linha, coluna, orientacao)
+        if mascaras is None:
+            return False
+        self.paredes_h |= mascaras[0]
+        self.paredes_v |= mascaras[1]
+        return True
+
+    def remover_parede(self, mascara_h, mascara_v):
+        self.paredes_h &= ~mascara_h
+        self.paredes_v &= ~mascara_v
+
+    def paredes_por_casa(self):
+        """Retorna (paredes_h, paredes_v) como conjuntos de (linha, coluna) das casas
+        com movimento bloqueado para baixo / para a direita, excluindo a última linha e coluna."""
+        colunas = self.colunas
+        limite = (self.linhas - 1) * colunas
+        horizontais = set()
+        verticais = set()
+        for mascara, destino in ((self.paredes_h, horizontais), (self.paredes_v, verticais)):
+            while mascara:
+                menor = mascara & -mascara
+                bit = menor.bit_length() - 1
+                mascara ^= menor
+                if bit >= limite:
+                    break
+                linha, coluna = divmod(bit, colunas)
+                if coluna < colunas - 1:
+                    destino.add((linha, coluna))
+        return horizontais, verticais
+
+    def paredes_congeladas(self):
+        """Versão em frozenset de paredes_por_casa, usada na chave de estado da Q-tabela.
+
+        O resultado fica guardado junto com as máscaras que o geraram e só é
+        recalculado quando alguma parede muda, então consultas repetidas são O(1).
+        """
+        paredes_h, paredes_v, congeladas_h, congeladas_v = self._cache_paredes
+        if paredes_h != self.paredes_h or paredes_v != self.paredes_v:
+            horizontais, verticais = self.paredes_por_casa()
+            congeladas_h = frozenset(horizontais)
+            congeladas_v = frozenset(verticais)
+            self._cache_paredes = (self.paredes_h, self.paredes_v, congeladas_h, congeladas_v)
+        return congeladas_h, congeladas_v
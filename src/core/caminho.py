@@ -1,6 +1,82 @@
 from collections import deque
 
+from .bitboard import TabuleiroBitboard
+
+# Distância usada para casas sem caminho até o objetivo (mesmo valor de shortest_path_length)
+SEM_CAMINHO = 99
+
+# Limite de entradas dos caches de distâncias e caminhos guardados em cada TabuleiroBitboard
+LIMITE_CACHE_DISTANCIAS = 8192
+LIMITE_CACHE_CAMINHOS = 4096
+
+# Marca de chave ausente no cache de caminhos, onde None é um resultado válido (sem caminho)
+_AUSENTE = object()
+
+
+def campo_distancias(jogador, tabuleiro):
+    """
+    Distância de cada casa até a linha objetivo do jogador, para a configuração de paredes atual.
+
+    Calculado uma vez por configuração de paredes com uma BFS reversa bit-paralela a partir
+    da linha objetivo e guardado em cache no tabuleiro; a distância de qualquer casa
+    (inclusive das casas vizinhas ao peão) passa a ser uma consulta na lista.
+
+    Args:
+        jogador (str): 'J1' (objetivo na última linha) ou 'J2' (objetivo na primeira linha).
+        tabuleiro (TabuleiroBitboard): Tabuleiro atual.
+
+    Returns:
+        list: Distância por índice de casa (linha * colunas + coluna); SEM_CAMINHO se inalcançável.
+    """
+    chave = (jogador, tabuleiro.paredes_h, tabuleiro.paredes_v)
+    cache = tabuleiro.cache_distancias
+    campo = cache.get(chave)
+    if campo is not None:
+        return campo
+
+    # BFS bit-paralela: cada camada é a expansão do conjunto alcançado, e as casas que
+    # entram na camada d estão a distância d do objetivo
+    campo = [SEM_CAMINHO] * (tabuleiro.linhas * tabuleiro.colunas)
+    alcance = tabuleiro.mascaras["ultima_linha" if jogador == "J1" else "primeira_linha"]
+    camada = alcance
+    distancia = 0
+    while camada:
+        while camada:
+            menor = camada & -camada
+            campo[menor.bit_length() - 1] = distancia
+            camada ^= menor
+        novo = tabuleiro.expandir(alcance)
+        camada = novo & ~alcance
+        alcance = novo
+        distancia += 1
+
+    if len(cache) >= LIMITE_CACHE_DISTANCIAS:
+        cache.clear()
+    cache[chave] = campo
+    return campo
+
+
+def _existe_caminho_bitboard(jogador, linha_inicial, coluna_inicial, tabuleiro):
+    inicio = linha_inicial * tabuleiro.colunas + coluna_inicial
+    campo = tabuleiro.cache_distancias.get((jogador, tabuleiro.paredes_h, tabuleiro.paredes_v))
+    if campo is not None:
+        return campo[inicio] < SEM_CAMINHO
+
+    # Flood fill bit-paralelo a partir do peão, parando assim que tocar a linha objetivo
+    objetivo = tabuleiro.mascaras["ultima_linha" if jogador == "J1" else "primeira_linha"]
+    alcance = 1 << inicio
+    while not alcance & objetivo:
+        novo = tabuleiro.expandir(alcance)
+        if novo == alcance:
+            return False
+        alcance = novo
+    return True
+
+
 def existe_caminho(jogador, linha_inicial, coluna_inicial, tabuleiro):
+    if isinstance(tabuleiro, TabuleiroBitboard):
+        return _existe_caminho_bitboard(jogador, linha_inicial, coluna_inicial, tabuleiro)
+
     # Determinar as dimensões do tabuleiro dinamicamente
     num_linhas = len(tabuleiro)
     num_colunas = len(tabuleiro[0]) if num_linhas > 0 else 0
@@ -52,3 +128,79 @@ def existe_caminho(jogador, linha_inicial, coluna_inicial, tabuleiro):
             fila.append((linha, coluna + 1))
 
     return False  # Nenhum caminho encontrado
+
+
+def arestas_menor_caminho(jogador, tabuleiro):
+    """
+    Encontra um menor caminho do peão do jogador até o objetivo e devolve as arestas usadas.
+
+    O caminho é obtido descendo pelo campo_distancias, e o resultado fica em cache no
+    tabuleiro, indexado pela posição do peão e pela configuração de paredes.
+
+    Args:
+        jogador (str): 'J1' ou 'J2'.
+        tabuleiro (TabuleiroBitboard): Tabuleiro atual.
+
+    Returns:
+        tuple | None: (mascara_h, mascara_v) com as arestas do caminho, no mesmo formato de
+            tabuleiro.paredes_h / paredes_v, ou None se não houver caminho.
+    """
+    inicio = tabuleiro.pos_j1 if jogador == "J1" else tabuleiro.pos_j2
+    chave = (jogador, inicio, tabuleiro.paredes_h, tabuleiro.paredes_v)
+    cache = tabuleiro.cache_caminhos
+    # Uma só leitura: o cache pode ser limpo por outra thread entre um teste e a leitura
+    resultado = cache.get(chave, _AUSENTE)
+    if resultado is not _AUSENTE:
+        return resultado
+
+    # Desce pelo campo de distâncias: cada passo vai para um vizinho uma casa mais perto
+    campo = campo_distancias(jogador, tabuleiro)
+    colunas = tabuleiro.colunas
+    resultado = None
+    if campo[inicio] < SEM_CAMINHO:
+        mascara_h = 0
+        mascara_v = 0
+        indice = inicio
+        while campo[indice] > 0:
+            alvo = campo[indice] - 1
+            for vizinho in tabuleiro.vizinhos(indice):
+                if campo[vizinho] == alvo:
+                    break
+            menor = min(indice, vizinho)
+            if abs(vizinho - indice) == colunas:
+                mascara_h |= 1 << menor
+            else:
+                mascara_v |= 1 << menor
+            indice = vizinho
+        resultado = (mascara_h, mascara_v)
+
+    if len(cache) >= LIMITE_CACHE_CAMINHOS:
+        cache.clear()
+    cache[chave] = resultado
+    return resultado
+
+
+def parede_preserva_caminhos(tabuleiro, caminhos, mascara_h, mascara_v):
+    """
+    Verifica se os dois jogadores ainda têm caminho depois de uma parede já colocada.
+
+    Só roda a busca de um jogador se a parede bloquear alguma aresta do menor caminho
+    que ele tinha antes dela; caso contrário esse caminho continua livre.
+
+    Args:
+        tabuleiro (TabuleiroBitboard): Tabuleiro já com a parede colocada.
+        caminhos (tuple): Resultado de arestas_menor_caminho para J1 e J2 antes da parede.
+        mascara_h (int): Arestas horizontais bloqueadas pela parede.
+        mascara_v (int): Arestas verticais bloqueadas pela parede.
+
+    Returns:
+        bool: True se nenhum jogador ficou sem caminho.
+    """
+    for jogador, caminho in zip(("J1", "J2"), caminhos):
+        if caminho is not None and not (caminho[0] & mascara_h or caminho[1] & mascara_v):
+            continue
+        inicio = tabuleiro.pos_j1 if jogador == "J1" else tabuleiro.pos_j2
+        linha, coluna = divmod(inicio, tabuleiro.colunas)
+        if not _existe_caminho_bitboard(jogador, linha, coluna, tabuleiro):
+            return False
+    return True
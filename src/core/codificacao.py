@@ -0,0 +1,191 @@
+# Codificação compacta de movimentos em inteiros.
+#
+# Para um tabuleiro com ``casas = linhas * colunas``:
+#   0 <= movimento < casas  -> mover o peão do jogador da vez para a casa ``movimento``
+#                              (índice linha * colunas + coluna, o mesmo do TabuleiroBitboard)
+#   movimento >= casas      -> colocar a parede do slot ``movimento - casas`` de
+#                              bitboard.slots_parede (orientação incluída no slot)
+#
+# Geração de movimentos, minimax e Q-learning trabalham só com esses inteiros;
+# a notação em texto ('e7h') existe apenas para exibição e entrada do usuário.
+
+from .bitboard import slots_parede
+
+DESLOCAMENTOS = {"w": (-1, 0), "s": (1, 0), "a": (0, -1), "d": (0, 1)}
+
+# Tabelas de decodificação por tamanho de tabuleiro: {(linhas, colunas): tuple}
+_TABELAS = {}
+
+
+def tabela_movimentos(linhas, colunas):
+    """
+    Retorna (e guarda em cache) a decodificação de todos os movimentos de um tamanho de tabuleiro.
+
+    Returns:
+        tuple: Um item por movimento codificado, ('mover', (linha, coluna)) para as casas
+            seguidos de ('parede', (linha, coluna, orientacao)) para os slots de parede.
+    """
+    chave = (linhas, colunas)
+    tabela = _TABELAS.get(chave)
+    if tabela is None:
+        tabela = tuple(
+            ("mover", divmod(indice, colunas)) for indice in range(linhas * colunas)
+        ) + tuple(
+            ("parede", (linha, coluna, orientacao))
+            for linha, coluna, orientacao, _ in slots_parede(linhas, colunas)
+        )
+        _TABELAS[chave] = tabela
+    return tabela
+
+
+def codificar_casa(linha, coluna, colunas):
+    """Movimento de peão para a casa (linha, coluna)."""
+    return linha * colunas + coluna
+
+
+def codificar_parede(linha, coluna, orientacao, linhas, colunas):
+    """
+    Movimento de parede em (linha, coluna, orientacao), com a coluna no formato da notação
+    (para 'v', a coluna à direita da parede).
+
+    Returns:
+        int | None: O movimento codificado, ou None se a posição não existir no tabuleiro.
+    """
+    if not 0 <= linha < linhas - 1:
+        return None
+    if orientacao == "h" and 0 <= coluna < colunas - 1:
+        slot = 2 * (linha * (colunas - 1) + coluna)
+    elif orientacao == "v" and 0 < coluna < colunas:
+        slot = 2 * (linha * (colunas - 1) + coluna - 1) + 1
+    else:
+        return None
+    return linhas * colunas + slot
+
+
+def interpretar_notacao(notacao):
+    """
+    Converte a notação de parede ('e7h', 'b12v') em (linha, coluna, orientacao).
+
+    Returns:
+        tuple | None: (linha, coluna, orientacao) com índices a partir de 0,
+            ou None se a notação for inválida.
+    """
+    if len(notacao) < 3:
+        return None
+    letra_coluna, numero_linha, orientacao = notacao[0], notacao[1:-1], notacao[-1]
+    if not numero_linha.isdigit() or orientacao not in ("h", "v") or not "a" <= letra_coluna <= "z":
+        return None
+    return int(numero_linha) - 1, ord(letra_coluna) - ord("a"), orientacao
+
+
+def codificar_notacao(notacao, linhas, colunas):
+    """Movimento de parede a partir da notação em texto, ou None se for inválida."""
+    coordenadas = interpretar_notacao(notacao)
+    if coordenadas is None:
+        return None
+    return codificar_parede(*coordenadas, linhas, colunas)
+
+
+def codificar_direcao(jogo, direcao, turno):
+    """
+    Movimento de peão na direção 'w', 'a', 's' ou 'd', saltando o oponente se ele
+    estiver na casa vizinha (mesma regra de movimentos.andar).
+
+    Returns:
+        int | None: A casa de destino codificada, ou None se ela ficar fora do tabuleiro.
+    """
+    jogador = "J1" if turno == 0 else "J2"
+    oponente = "J2" if turno == 0 else "J1"
+    return casa_na_direcao(
+        jogo.jogadores[jogador], jogo.jogadores[oponente], direcao, jogo.linhas, jogo.colunas
+    )
+
+
+def casa_na_direcao(origem, oponente, direcao, linhas, colunas):
+    """
+    Casa de destino de codificar_direcao a partir das posições dos peões.
+
+    Args:
+        origem (tuple): (linha, coluna) do peão que se move.
+        oponente (tuple): (linha, coluna) do peão do oponente.
+        direcao (str | None): 'w', 'a', 's' ou 'd'.
+        linhas (int): Linhas do tabuleiro.
+        colunas (int): Colunas do tabuleiro.
+
+    Returns:
+        int | None: A casa de destino codificada, ou None se a direção for inválida ou
+            a casa ficar fora do tabuleiro.
+    """
+    if direcao not in DESLOCAMENTOS:
+        return None
+    linha, coluna = origem
+    d_linha, d_coluna = DESLOCAMENTOS[direcao]
+    nova_linha, nova_coluna = linha + d_linha, coluna + d_coluna
+    if (nova_linha, nova_coluna) == tuple(oponente):
+        nova_linha += d_linha
+        nova_coluna += d_coluna
+    if not (0 <= nova_linha < linhas and 0 <= nova_coluna < colunas):
+        return None
+    return codificar_casa(nova_linha, nova_coluna, colunas)
+
+
+def decodificar_movimento(movimento, linhas, colunas):
+    """('mover', (linha, coluna)) ou ('parede', (linha, coluna, orientacao)) de um movimento."""
+    return tabela_movimentos(linhas, colunas)[movimento]
+
+
+def notacao_movimento(movimento, linhas, colunas):
+    """Texto para exibição: a casa de destino ('c2') ou a notação da parede ('e7h')."""
+    casas = linhas * colunas
+    if movimento >= casas:
+        return slots_parede(linhas, colunas)[movimento - casas][3]
+    linha, coluna = divmod(movimento, colunas)
+    return f"{chr(ord('a') + coluna)}{linha + 1}"
+
+
+def direcao_legada(origem, destino):
+    """
+    Direção ('w', 'a', 's' ou 'd') de um movimento de peão antigo ('mover', (linha, coluna)),
+    comparando o destino com a casa de origem do peão (primeiro a linha, depois a coluna).
+
+    Returns:
+        str | None: A direção, ou None se o destino for a própria casa de origem.
+    """
+    linha, coluna = origem
+    nova_linha, nova_coluna = destino
+    if nova_linha < linha:
+        return "w"
+    if nova_linha > linha:
+        return "s"
+    if nova_coluna < coluna:
+        return "a"
+    if nova_coluna > coluna:
+        return "d"
+    return None
+
+
+def converter_movimento_legado(jogo, movimento, turno):
+    """
+    Converte os formatos antigos de movimento em tupla para o inteiro equivalente.
+
+    Aceita ('mover', direcao), ('mover', (linha, coluna)), ('parede', notacao) e
+    ('parede', (linha, coluna, orientacao)), como nas Q-tabelas e na GUI antigas.
+    A casa de ('mover', (linha, coluna)) é sempre a vizinha na direção do passo, mesmo
+    com o oponente nela: como no formato antigo, ela vira uma direção a partir da casa
+    atual do jogador, e o salto sobre o oponente sai de codificar_direcao.
+
+    Returns:
+        int | None: O movimento codificado, ou None se não houver equivalente.
+    """
+    linhas, colunas = jogo.linhas, jogo.colunas
+    tipo, valor = movimento
+    if tipo == "mover":
+        if isinstance(valor, str):
+            return codificar_direcao(jogo, valor, turno)
+        origem = jogo.jogadores["J1" if turno == 0 else "J2"]
+        return codificar_direcao(jogo, direcao_legada(origem, valor), turno)
+    elif tipo == "parede":
+        if isinstance(valor, str):
+            return codificar_notacao(valor, linhas, colunas)
+        return codificar_parede(*valor, linhas, colunas)
+    return None
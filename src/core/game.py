@@ -1,10 +1,16 @@
 # import numpy removido - não mais necessário
 
+from .bitboard import TabuleiroBitboard
+from .caminho import arestas_menor_caminho, parede_preserva_caminhos
+from .codificacao import converter_movimento_legado
 from .movimento_util import gerar_movimentos_possiveis
-from .movimentos import andar
-from .paredes import colocar_parede
-from .square import Square
-from .utilidade import calcular_utilidade, shortest_path_length
+from .movimentos import andar, destino_andar
+from .paredes import mascaras_notacao
+from .utilidade import calcular_utilidade
+from .zobrist import calcular_hash_zobrist, hash_mascara, tabela_zobrist
+from ..utils.log import obter_logger
+
+logger = obter_logger(__name__)
 
 # Constantes e configurações DQN removidas
 
@@ -58,92 +64,138 @@ class JogoQuoridor:
         """Reseta o jogo para o estado inicial para um novo episódio."""
         self.jogadores = self.estado_inicial_jogadores.copy()
         self.paredes_restantes = self.estado_inicial_paredes_restantes.copy()
-        self.tabuleiro = [
-            [Square() for _ in range(self.colunas)] for _ in range(self.linhas)
-        ]
-
-        j1_linha, j1_coluna = self.jogadores["J1"]
-        j2_linha, j2_coluna = self.jogadores["J2"]
-        self.tabuleiro[j1_linha][j1_coluna].tem_jogador = True
-        self.tabuleiro[j2_linha][j2_coluna].tem_jogador = True
+        # Paredes em máscaras de bits; tabuleiro[linha][coluna] continua
+        # expondo a interface de Square para a GUI e a depuração
+        self.tabuleiro = TabuleiroBitboard(self.linhas, self.colunas)
+        self.tabuleiro.posicionar_peao("J1", *self.jogadores["J1"])
+        self.tabuleiro.posicionar_peao("J2", *self.jogadores["J2"])
 
         self.jogo_terminado = False
         self.vencedor = None  # Pode ser 'J1', 'J2', ou None para indicar que o jogo não acabou ou é empate
-        # O turno inicial pode ser definido aqui ou gerenciado pelo loop de treinamento
-        # self.turno_atual_idx = 0 # Exemplo: J1 (índice 0) começa
+        # O turno em si é gerenciado pelo loop de treinamento/GUI; aqui só se registra
+        # de quem é a vez após o último movimento, para compor a chave Zobrist
+        self.lado_a_jogar = 0  # J1 começa
+
+        # Chave Zobrist do estado, atualizada incrementalmente a cada movimento
+        self.zobrist = tabela_zobrist(self.linhas, self.colunas)
+        self.hash_zobrist = calcular_hash_zobrist(self)
+
+    def __getstate__(self):
+        # As chaves Zobrist são compartilhadas por tamanho de tabuleiro; não copiar nem serializar
+        estado = self.__dict__.copy()
+        estado.pop("zobrist", None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.zobrist = tabela_zobrist(self.linhas, self.colunas)
+
+    def _passar_vez(self, turno):
+        """Registra que o jogador do turno jogou; a vez passa para o outro."""
+        proximo = 1 - turno
+        if proximo != self.lado_a_jogar:
+            self.lado_a_jogar = proximo
+            self.hash_zobrist ^= self.zobrist["lado"]
+
+    def colocar_parede(self, notacao, turno, validar_caminhos=True):
+        """Coloca uma parede dada em notação de texto ('e7h'), como na entrada do usuário."""
+        return self._colocar_parede(mascaras_notacao(self, notacao), turno, validar_caminhos)
+
+    def _colocar_parede(self, mascaras, turno, validar_caminhos=True):
+        """
+        Coloca a parede que bloqueia as arestas ``mascaras``.
 
-    def colocar_parede(self, notacao, turno):
+        Args:
+            mascaras (tuple | None): (mascara_h, mascara_v) de TabuleiroBitboard.mascaras_parede
+                ou mascaras_slot; None quando a parede sobrepõe, cruza ou sai do tabuleiro.
+            turno (int): 0 para J1, 1 para J2.
+            validar_caminhos (bool): Se True, recusa paredes que deixem algum jogador sem caminho.
+        """
         jogador = "J1" if turno == 0 else "J2"
         if self.paredes_restantes[jogador] <= 0:
             # print(f"{jogador} não tem mais paredes!")
             return False
-        # Tentativamente coloca a parede (isso modifica self.tabuleiro diretamente)
-        # A função importada 'colocar_parede' já faz verificações de sobreposição e cruzamento.
-        sucesso_colocacao_basica = colocar_parede(self, notacao, turno)
-
-        if sucesso_colocacao_basica:
-            # Verificar se algum jogador ficou sem caminho
-            path_j1_exists = (
-                shortest_path_length("J1", self.jogadores["J1"], self.tabuleiro) < 99
-            )  # 99 indica sem caminho
-            path_j2_exists = (
-                shortest_path_length("J2", self.jogadores["J2"], self.tabuleiro) < 99
+        if mascaras is None:
+            # Sobreposição, cruzamento ou posição fora do tabuleiro
+            return False
+
+        tabuleiro = self.tabuleiro
+        mascara_h, mascara_v = mascaras
+        if validar_caminhos:
+            # Menores caminhos atuais (em cache enquanto peões e paredes não mudam)
+            caminhos = (
+                arestas_menor_caminho("J1", tabuleiro),
+                arestas_menor_caminho("J2", tabuleiro),
             )
 
-            if not path_j1_exists or not path_j2_exists:
-                # print("Colocação de parede inválida: bloquearia o caminho de um jogador.")
-                # Reverter a colocação da parede
-                letra_coluna, numero_linha, direcao_parede = notacao
-                col_idx = ord(letra_coluna) - ord("a")
-                linha_idx = int(numero_linha) - 1
-
-                if direcao_parede == "h":
-                    self.tabuleiro[linha_idx - 1][col_idx].pode_mover_para_baixo = True
-                    self.tabuleiro[linha_idx - 1][
-                        col_idx + 1
-                    ].pode_mover_para_baixo = True
-                    self.tabuleiro[linha_idx][col_idx].pode_mover_para_cima = True
-                    self.tabuleiro[linha_idx][col_idx + 1].pode_mover_para_cima = True
-                elif direcao_parede == "v":
-                    self.tabuleiro[linha_idx][
-                        col_idx - 1
-                    ].pode_mover_para_direita = True
-                    self.tabuleiro[linha_idx + 1][
-                        col_idx - 1
-                    ].pode_mover_para_direita = True
-                    self.tabuleiro[linha_idx][col_idx].pode_mover_para_esquerda = True
-                    self.tabuleiro[linha_idx + 1][
-                        col_idx
-                    ].pode_mover_para_esquerda = True
-                return False  # Falha na colocação da parede
-            else:
-                # Se os caminhos existem, a colocação é válida
-                self.paredes_restantes[jogador] -= 1
-                return True  # Sucesso na colocação da parede
-        else:
-            # A colocação básica já falhou (sobreposição, cruzamento, etc.)
-            return False
+        # Tentativamente coloca a parede
+        tabuleiro.paredes_h |= mascara_h
+        tabuleiro.paredes_v |= mascara_v
+
+        # Verificar se algum jogador ficou sem caminho. Uma parede que não corta
+        # nenhum dos menores caminhos atuais não precisa de busca.
+        if validar_caminhos and not parede_preserva_caminhos(
+            tabuleiro, caminhos, mascara_h, mascara_v
+        ):
+            # print("Colocação de parede inválida: bloquearia o caminho de um jogador.")
+            # Reverter a colocação da parede
+            tabuleiro.remover_parede(mascara_h, mascara_v)
+            return False  # Falha na colocação da parede
+
+        # Se os caminhos existem, a colocação é válida
+        idx = 0 if jogador == "J1" else 1
+        chaves_restantes = self.zobrist["paredes_restantes"][idx]
+        self.hash_zobrist ^= hash_mascara(self.zobrist["parede_h"], mascara_h)
+        self.hash_zobrist ^= hash_mascara(self.zobrist["parede_v"], mascara_v)
+        self.hash_zobrist ^= chaves_restantes[self.paredes_restantes[jogador]]
+        self.paredes_restantes[jogador] -= 1
+        self.hash_zobrist ^= chaves_restantes[self.paredes_restantes[jogador]]
+        self._passar_vez(turno)
+        return True  # Sucesso na colocação da parede
 
     def andar(self, direcao, turno):
-        return andar(self, direcao, turno)
+        tabuleiro = self.tabuleiro
+        indice_anterior = tabuleiro.pos_j1 if turno == 0 else tabuleiro.pos_j2
+        if not andar(self, direcao, turno):
+            return False
+        indice_novo = tabuleiro.pos_j1 if turno == 0 else tabuleiro.pos_j2
+        chaves_peao = self.zobrist["peao"][turno]
+        self.hash_zobrist ^= chaves_peao[indice_anterior] ^ chaves_peao[indice_novo]
+        self._passar_vez(turno)
+        return True
+
+    def _mover_peao_para(self, destino, turno):
+        """Move o peão do turno para a casa de índice ``destino``, se for um movimento válido."""
+        jogador = "J1" if turno == 0 else "J2"
+        linha, coluna = self.jogadores[jogador]
+        nova_linha, nova_coluna = divmod(destino, self.colunas)
+        if nova_linha < linha:
+            direcao = "w"
+        elif nova_linha > linha:
+            direcao = "s"
+        elif nova_coluna < coluna:
+            direcao = "a"
+        elif nova_coluna > coluna:
+            direcao = "d"
+        else:
+            return False
+        # A direção sozinha não basta: o destino precisa ser exatamente a casa
+        # onde o peão para (uma casa adiante, ou duas ao saltar o oponente)
+        if destino_andar(self, direcao, turno) != (nova_linha, nova_coluna):
+            return False
+        return self.andar(direcao, turno)
 
     # Dentro da classe JogoQuoridor
 
     def verificar_vitoria_jogador(self, jogador):
-        """Verifica se o jogador alcançou o lado oposto do tabuleiro"""
-        linha, coluna = self.jogadores[jogador]
+        """Verifica se o jogador alcançou o lado oposto do tabuleiro (sem efeitos colaterais)."""
+        linha = self.jogadores[jogador][0]
         # J1 vence ao alcançar a última linha (linha = self.linhas - 1)
         # J2 vence ao alcançar a primeira linha (linha = 0)
         if jogador == "J1":
-            venceu = linha == self.linhas - 1
-            if venceu:
-                print(f"[VITÓRIA] J1 alcançou linha {linha} (última linha)")
-            return venceu
+            return linha == self.linhas - 1
         elif jogador == "J2":
-            venceu = linha == 0
-            if venceu:
-                print(f"[VITÓRIA] J2 alcançou linha {linha} (primeira linha)")
-            return venceu
+            return linha == 0
         return False
 
     def verificar_vitoria(self):
@@ -155,7 +207,6 @@ class JogoQuoridor:
             vencedor = "J2"
 
         if vencedor:
-            print(f"[VITÓRIA] Jogo terminado! Vencedor: {vencedor}")
             self.jogo_terminado = True
             self.vencedor = vencedor
         return vencedor
@@ -190,27 +241,10 @@ class JogoQuoridor:
         paredes_restantes_j1 = self.paredes_restantes["J1"]
         paredes_restantes_j2 = self.paredes_restantes["J2"]
 
-        # Coletar posições de paredes horizontais e verticais
-        paredes_horizontais = set()
-        paredes_verticais = set()
-
-        for linha in range(
-            self.linhas - 1
-        ):  # -1 porque não pode colocar parede na última linha
-            for coluna in range(
-                self.colunas - 1
-            ):  # -1 porque não pode colocar parede na última coluna
-                # Verificar parede horizontal (impede movimento para baixo)
-                if not self.tabuleiro[linha][coluna].pode_mover_para_baixo:
-                    paredes_horizontais.add((linha, coluna))
-
-                # Verificar parede vertical (impede movimento para direita)
-                if not self.tabuleiro[linha][coluna].pode_mover_para_direita:
-                    paredes_verticais.add((linha, coluna))
-
-        # Converter para frozenset para torná-los hashable
-        paredes_h_frozen = frozenset(paredes_horizontais)
-        paredes_v_frozen = frozenset(paredes_verticais)
+        # Conjuntos de paredes horizontais e verticais (casas que não permitem mover
+        # para baixo / para a direita). O tabuleiro guarda os frozensets da última
+        # configuração de paredes, então não há varredura a cada chamada.
+        paredes_h_frozen, paredes_v_frozen = self.tabuleiro.paredes_congeladas()
 
         # Criar a tupla de estado
         estado_tupla = (
@@ -238,14 +272,13 @@ class JogoQuoridor:
 
     # Dentro da classe JogoQuoridor
 
-    def aplicar_movimento(self, movimento_tupla, turno_idx):
+    def aplicar_movimento(self, movimento, turno_idx):
         """
         Aplica um movimento ao jogo e atualiza o estado.
 
         Args:
-            movimento_tupla (tuple): O movimento a ser aplicado, podendo ser:
-                - ('mover', (nova_linha, nova_coluna)) para mover peão
-                - ('parede', (linha, coluna, orientacao)) para colocar parede
+            movimento (int | tuple): Movimento codificado (ver codificacao.py). Tuplas no
+                formato antigo, como ('mover', 'w') ou ('parede', 'e7h'), são convertidas.
             turno_idx (int): 0 para J1, 1 para J2.
 
         Returns:
@@ -256,87 +289,94 @@ class JogoQuoridor:
             # print("Tentativa de aplicar movimento em jogo já terminado.")
             return False  # Não permite movimentos se o jogo já terminou
 
-        tipo_movimento, valor_movimento = movimento_tupla
-        sucesso_movimento = False
-
-        if tipo_movimento == "mover":
-            direcao = None
-            # Se o valor for uma string (como 'w', 's'), é um movimento da GUI
-            if isinstance(valor_movimento, str):
-                direcao = valor_movimento
-            # Se for uma tupla, é um movimento do agente (coordenadas)
-            elif isinstance(valor_movimento, tuple):
-                nova_linha, nova_coluna = valor_movimento
-                jogador = "J1" if turno_idx == 0 else "J2"
-                linha_atual, coluna_atual = self.jogadores[jogador]
-
-                # Determinar direção baseado na diferença de posições
-                if nova_linha < linha_atual:
-                    direcao = "w"
-                elif nova_linha > linha_atual:
-                    direcao = "s"
-                elif nova_coluna < coluna_atual:
-                    direcao = "a"
-                elif nova_coluna > coluna_atual:
-                    direcao = "d"
-
-            if direcao:
-                sucesso_movimento = self.andar(direcao, turno_idx)
-            else:
-                sucesso_movimento = False
-        elif tipo_movimento == "parede":
-            # O valor do movimento pode ser uma tupla (formato antigo) ou uma string (formato da IA/GUI)
-            if isinstance(valor_movimento, str):
-                notacao_parede = valor_movimento
-            elif isinstance(valor_movimento, tuple):
-                # Converte a tupla para a notação de string
-                linha, coluna, orientacao = valor_movimento
-                coluna_letra = chr(ord("a") + coluna)
-                linha_numero = str(linha + 1)
-                notacao_parede = coluna_letra + linha_numero + orientacao
-            else:
-                notacao_parede = None
-
-            if notacao_parede:
-                sucesso_movimento = self.colocar_parede(notacao_parede, turno_idx)
-            else:
-                sucesso_movimento = False
+        sucesso_movimento = self.fazer_movimento(movimento, turno_idx) is not None
 
         if sucesso_movimento:
             # Após um movimento bem-sucedido, verifica se houve um vencedor
-            self.verificar_vitoria()
+            if self.verificar_vitoria():
+                logger.debug("[VITÓRIA] Jogo terminado! Vencedor: %s", self.vencedor)
 
         return sucesso_movimento
 
-    def get_acoes_validas(self, turno_idx):
-        movimentos = gerar_movimentos_possiveis(self, turno_idx, ordenar=False)
-
-        # Converter movimentos para o formato de ação
-        acoes = []
-        for tipo, valor in movimentos:
-            if tipo == "mover":
-                # Obter coordenadas do movimento
-                jogador = "J1" if turno_idx == 0 else "J2"
-                linha, coluna = self.jogadores[jogador]
+    def fazer_movimento(self, movimento, turno, validar=True):
+        """
+        Aplica um movimento no próprio jogo e devolve um token para desfazê-lo.
 
-                # Mapear direção para coordenadas
-                direcoes = {"w": (-1, 0), "s": (1, 0), "a": (0, -1), "d": (0, 1)}
-                d_linha, d_coluna = direcoes[valor]
-                nova_pos = (linha + d_linha, coluna + d_coluna)
+        Usado pela geração de movimentos e pelo minimax no lugar de copy.deepcopy:
+        o jogo é alterado in-place e restaurado com desfazer_movimento em O(1).
 
-                acoes.append(("mover", nova_pos))
-            elif tipo == "parede":
-                # Converter notação de parede para coordenadas
-                letra = valor[0]
-                numero = int(valor[1])
-                orientacao = valor[2]
+        Args:
+            movimento (int): Movimento codificado (ver codificacao.py); tuplas no formato
+                antigo são convertidas com converter_movimento_legado.
+            turno (int): 0 para J1, 1 para J2.
+            validar (bool): Se False, não verifica se a parede bloqueia o caminho de algum
+                jogador (use apenas com movimentos vindos de gerar_movimentos_possiveis).
 
-                coluna = ord(letra) - ord("a")
-                linha = numero - 1  # Ajuste para índice 0-based
+        Returns:
+            tuple | None: Token para desfazer_movimento, ou None se o movimento for inválido
+                (nesse caso o estado do jogo não é alterado).
+        """
+        if not isinstance(movimento, int):
+            movimento = converter_movimento_legado(self, movimento, turno)
+            if movimento is None:
+                return None
 
-                acoes.append(("parede", (linha, coluna, orientacao)))
+        jogador = "J1" if turno == 0 else "J2"
+        token = (
+            jogador,
+            self.jogadores[jogador],
+            self.tabuleiro.paredes_h,
+            self.tabuleiro.paredes_v,
+            self.paredes_restantes[jogador],
+            self.jogo_terminado,
+            self.vencedor,
+            self.lado_a_jogar,
+            self.hash_zobrist,
+        )
 
-        return acoes
+        casas = self.linhas * self.colunas
+        if 0 <= movimento < casas:
+            sucesso = self._mover_peao_para(movimento, turno)
+        elif casas <= movimento < casas + len(self.tabuleiro.arestas_slots):
+            sucesso = self._colocar_parede(
+                self.tabuleiro.mascaras_slot(movimento - casas), turno, validar_caminhos=validar
+            )
+        else:
+            sucesso = False
+
+        return token if sucesso else None
+
+    def desfazer_movimento(self, token):
+        """Desfaz o movimento aplicado por fazer_movimento, restaurando o estado anterior."""
+        (
+            jogador,
+            posicao,
+            paredes_h,
+            paredes_v,
+            paredes_restantes,
+            terminado,
+            vencedor,
+            lado_a_jogar,
+            hash_zobrist,
+        ) = token
+        self.jogadores[jogador] = posicao
+        self.tabuleiro.posicionar_peao(jogador, *posicao)
+        self.tabuleiro.paredes_h = paredes_h
+        self.tabuleiro.paredes_v = paredes_v
+        self.paredes_restantes[jogador] = paredes_restantes
+        self.jogo_terminado = terminado
+        self.vencedor = vencedor
+        self.lado_a_jogar = lado_a_jogar
+        self.hash_zobrist = hash_zobrist
+
+    def get_acoes_validas(self, turno_idx, usar_lote=False):
+        """Movimentos válidos do jogador, já codificados como inteiros (ações da Q-tabela).
+
+        usar_lote=True valida todas as paredes de uma vez com NumPy (ver paredes_lote.py).
+        """
+        return gerar_movimentos_possiveis(
+            self, turno_idx, ordenar=False, usar_lote=usar_lote
+        )
 
     def serializar_tabuleiro(self):
         """
@@ -375,20 +415,22 @@ class JogoQuoridor:
         Args:
             estado_serializado (dict): Dicionário com o estado do tabuleiro criado por serializar_tabuleiro()
         """
-        # Restaurar tabuleiro
+        # Restaurar tabuleiro (tem_jogador é derivado das posições dos jogadores)
+        self.tabuleiro.paredes_h = 0
+        self.tabuleiro.paredes_v = 0
         for linha in range(self.linhas):
             for coluna in range(self.colunas):
                 square_dict = estado_serializado["tabuleiro"][linha][coluna]
                 square = self.tabuleiro[linha][coluna]
 
-                square.pode_mover_para_cima = square_dict["pode_mover_para_cima"]
-                square.pode_mover_para_baixo = square_dict["pode_mover_para_baixo"]
-                square.pode_mover_para_esquerda = square_dict[
-                    "pode_mover_para_esquerda"
-                ]
-                square.pode_mover_para_direita = square_dict["pode_mover_para_direita"]
-                square.tem_jogador = square_dict["tem_jogador"]
+                if not square_dict["pode_mover_para_baixo"]:
+                    square.pode_mover_para_baixo = False
+                if not square_dict["pode_mover_para_direita"]:
+                    square.pode_mover_para_direita = False
 
         # Restaurar posições dos jogadores e paredes restantes
         self.jogadores = estado_serializado["jogadores"].copy()
         self.paredes_restantes = estado_serializado["paredes_restantes"].copy()
+        self.tabuleiro.posicionar_peao("J1", *self.jogadores["J1"])
+        self.tabuleiro.posicionar_peao("J2", *self.jogadores["J2"])
+        self.hash_zobrist = calcular_hash_zobrist(self)
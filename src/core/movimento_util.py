@@ -1,114 +1,90 @@
-import copy
-
-from .caminho import existe_caminho
+from .bitboard import slots_parede
+from .caminho import campo_distancias
+from .codificacao import codificar_casa
+from .movimentos import destino_andar
+from .paredes_candidatas import POLITICA_AUMENTAM, slots_candidatos
 from .utilidade import shortest_path_length
+from ..utils.log import obter_logger
+
+logger = obter_logger(__name__)
 
-# Representa um movimento: (tipo, valor)
-# tipo: 'mover' ou 'parede'
-# valor: para 'mover', direcao ('w', 'a', 's', 'd'); para 'parede', notacao (ex: 'e7h')
+# Representa um movimento: um inteiro (ver codificacao.py)
+# 0 <= movimento < linhas * colunas: mover o peão para a casa de índice movimento
+# movimento >= linhas * colunas: colocar a parede do slot movimento - linhas * colunas
 
 DIRECOES = ["w", "a", "s", "d"]
 LINHAS, COLUNAS = 9, 9
 
-# Melhores primeiras jogadas para otimização de abertura
-# Baseado em análise de jogos de Quoridor
-BEST_FIRST_MOVES = {
-    "J1": [
-        ("mover", "s"),
-        ("parede", "e5h"),
-        ("parede", "d5h"),
-    ],  # Movimento para frente ou paredes centrais
-    "J2": [
-        ("mover", "w"),
-        ("parede", "e5h"),
-        ("parede", "d5h"),
-    ],  # Movimento para frente ou paredes centrais
-}
-
-
-# Função para gerar um hash para o estado do jogo (para a tabela de transposição)
-def hash_estado(estado):
-    pos_j1, pos_j2, paredes_j1, paredes_j2 = estado
-    return hash((pos_j1, pos_j2, paredes_j1, paredes_j2))
+# Chave do estado do jogo para a tabela de transposição: o hash Zobrist mantido
+# incrementalmente pelo JogoQuoridor (posições, paredes, paredes restantes e vez)
+def hash_estado(jogo):
+    return jogo.hash_zobrist
 
 
 # Avaliação rápida de um movimento para ordenação
 def avaliar_movimento_rapido(jogo, movimento, turno, jogador):
-    tipo, valor = movimento
-
-    # Movimentos de peão são avaliados pela distância ao objetivo
-    if tipo == "move":
-        jogo_copia = copy.deepcopy(jogo)
-        aplicar_movimento(jogo_copia, movimento, turno)
-        estado = jogo_copia.serializar_estado()
-        pos = estado[0] if jogador == "J1" else estado[1]
-
-        # Distância ao objetivo (linha 8 para J1, linha 0 para J2)
-        objetivo = 8 if jogador == "J1" else 0
-        distancia = abs(pos[0] - objetivo)
+    tabuleiro = jogo.tabuleiro
 
-        # Quanto menor a distância, melhor o movimento
-        return -distancia
+    # Movimentos de peão são avaliados pelo quanto aproximam o peão do objetivo
+    if movimento < jogo.linhas * jogo.colunas:
+        campo = campo_distancias(jogador, tabuleiro)
+        origem = tabuleiro.pos_j1 if jogador == "J1" else tabuleiro.pos_j2
+        return campo[origem] - campo[movimento]
 
     # Paredes são avaliadas pelo impacto no caminho do oponente
-    elif tipo == "parede":
-        jogo_copia = copy.deepcopy(jogo)
-        estado_antes = jogo_copia.serializar_estado()
-        oponente = "J2" if jogador == "J1" else "J1"
-        pos_oponente = estado_antes[1] if oponente == "J2" else estado_antes[0]
-        caminho_antes = shortest_path_length(
-            oponente, pos_oponente, jogo_copia.tabuleiro
-        )
-
-        aplicar_movimento(jogo_copia, movimento, turno)
-        estado_depois = jogo_copia.serializar_estado()
-        pos_oponente_depois = estado_depois[1] if oponente == "J2" else estado_depois[0]
-        caminho_depois = shortest_path_length(
-            oponente, pos_oponente_depois, jogo_copia.tabuleiro
-        )
+    oponente = "J2" if jogador == "J1" else "J1"
+    pos_oponente = jogo.jogadores[oponente]
+    caminho_antes = shortest_path_length(oponente, pos_oponente, tabuleiro)
 
-        # Quanto maior o aumento no caminho do oponente, melhor a parede
-        return caminho_depois - caminho_antes
+    token = aplicar_movimento(jogo, movimento, turno)
+    caminho_depois = shortest_path_length(oponente, pos_oponente, tabuleiro)
+    if token is not None:
+        jogo.desfazer_movimento(token)
 
-    return 0
+    # Quanto maior o aumento no caminho do oponente, melhor a parede
+    return caminho_depois - caminho_antes
 
 
 # Gera todos os movimentos possíveis para o jogador atual com ordenação
 # turno: 0 (J1), 1 (J2)
-def gerar_movimentos_possiveis(jogo, turno, ordenar=True, transposition_table=None):
+# Os movimentos de peão são calculados sem alterar o jogo; as paredes são testadas
+# in-place com fazer_movimento/desfazer_movimento, sem copiar o jogo.
+# politica_paredes restringe as paredes consideradas (ver paredes_candidatas.py);
+# None considera todas.
+def gerar_movimentos_possiveis(jogo, turno, ordenar=True, transposition_table=None, usar_lote=False, politica_paredes=None):
     movimentos = []
     jogador = "J1" if turno == 0 else "J2"
     
-    # Verificar se o jogador já está na posição de vitória
+    # Verificar se o jogador já está na posição de vitória (nó terminal: sem movimentos)
     if jogo.verificar_vitoria_jogador(jogador):
-        print(f"[DEBUG] Jogador {jogador} já está na posição de vitória!")
         return []
         
     # Debug: posição atual
     #print(f"[DEBUG] Gerando movimentos para {jogador} na posição {jogo.jogadores[jogador]}")
     
-    # Movimentos de peão
-    for direcao in ["w", "s", "a", "d"]:
-        jogo_copia = copy.deepcopy(jogo)
-        if jogo_copia.andar(direcao, turno):
-            movimentos.append(('mover', direcao))
-            #print(f"[DEBUG] Movimento válido: ('mover', '{direcao}')")
+    # Movimentos de peão, codificados pela casa de destino
+    movimentos.extend(movimentos_peao(jogo, turno))
     
-    # Tentativas de colocar parede
-    num_linhas = len(jogo.tabuleiro)
-    num_colunas = len(jogo.tabuleiro[0]) if num_linhas > 0 else 0
-    
-    for linha_notacao_num in range(1, num_linhas):
-        for coluna_idx in range(num_colunas - 1):
-            letra_coluna = chr(ord('a') + coluna_idx)
-            for direcao in ["h", "v"]:
-                notacao = f"{letra_coluna}{linha_notacao_num}{direcao}"
-                jogo_copia = copy.deepcopy(jogo)
-                if jogo_copia.colocar_parede(notacao, turno):
-                    if existe_caminho("J1", jogo_copia.jogadores["J1"][0], jogo_copia.jogadores["J1"][1], jogo_copia.tabuleiro) and \
-                       existe_caminho("J2", jogo_copia.jogadores["J2"][0], jogo_copia.jogadores["J2"][1], jogo_copia.tabuleiro):
-                        movimentos.append(("parede", notacao))
-                        # print(f"[DEBUG] Parede válida: ('parede', '{notacao}')")
+    # Tentativas de colocar parede, em todas as posições de parede do tabuleiro
+    # Sem paredes restantes nenhuma parede é válida; evita testar todas as posições
+    if jogo.paredes_restantes[jogador] > 0:
+        casas = jogo.linhas * jogo.colunas
+        candidatos = slots_candidatos(jogo, turno, politica_paredes)
+        if candidatos is None:
+            candidatos = range(len(slots_parede(jogo.linhas, jogo.colunas)))
+        paredes = []
+        if usar_lote:
+            # Verificação vetorizada (NumPy) de todas as paredes de uma vez
+            from .paredes_lote import paredes_validas_lote
+
+            validas = paredes_validas_lote(jogo, turno)
+            paredes = [casas + slot for slot in candidatos if validas[slot]]
+        else:
+            paredes = [casas + slot for slot in candidatos if _parede_legal(jogo, casas + slot, turno)]
+        if politica_paredes == POLITICA_AUMENTAM:
+            # Só ficam as paredes que de fato aumentam o menor caminho do oponente
+            paredes = [m for m in paredes if avaliar_movimento_rapido(jogo, m, turno, jogador) > 0]
+        movimentos.extend(paredes)
     
     # Debug: total de movimentos encontrados
     #print(f"[DEBUG] Total de movimentos gerados para {jogador}: {len(movimentos)}")
@@ -119,19 +95,132 @@ def gerar_movimentos_possiveis(jogo, turno, ordenar=True, transposition_table=No
     return movimentos
 
 
-# Aplica um movimento ao jogo (muda o estado!)
+# Destinos do peão do jogador da vez, na ordem das direções w, s, a, d
+def movimentos_peao(jogo, turno):
+    movimentos = []
+    for direcao in ["w", "s", "a", "d"]:
+        destino = destino_andar(jogo, direcao, turno)
+        if destino is not None:
+            movimentos.append(codificar_casa(*destino, jogo.colunas))
+    return movimentos
+
+
+# Testa uma parede in-place. fazer_movimento já garante que ambos os jogadores mantêm
+# um caminho, e só faz busca quando a parede corta um dos menores caminhos atuais
+def _parede_legal(jogo, movimento, turno):
+    token = jogo.fazer_movimento(movimento, turno)
+    if token is None:
+        return False
+    jogo.desfazer_movimento(token)
+    return True
+
+
+# Ordena pela pontuação de history (estável) e põe os killers presentes na frente
+def _ordenar_por_historia(movimentos, killers, historia):
+    if historia:
+        movimentos.sort(key=lambda m: historia.get(m, 0), reverse=True)
+    for killer in reversed(killers):
+        if killer in movimentos:
+            movimentos.remove(killer)
+            movimentos.insert(0, killer)
+    return movimentos
+
+
+def gerar_movimentos_em_estagios(jogo, turno, prioritarios=(), killers=(), historia=None, usar_lote=False, politica_paredes=None, paredes=True):
+    """
+    Gera os mesmos movimentos de gerar_movimentos_possiveis, mas sob demanda e em estágios:
+    movimentos prioritários, peões, paredes killer e as demais paredes.
+
+    Cada parede só é validada quando a busca pede o próximo movimento, então um corte
+    logo nos primeiros filhos não paga a verificação das outras paredes. O jogo pode ser
+    alterado entre um movimento e outro, desde que volte ao mesmo estado.
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual.
+        turno (int): Jogador da vez (0 para J1, 1 para J2).
+        prioritarios (Iterable): Movimentos a gerar primeiro, nesta ordem (variação principal,
+            melhor movimento da tabela de transposição); None e movimentos ilegais são ignorados.
+        killers (Iterable): Killer moves do ply; os de peão vão na frente dos peões e os de
+            parede formam o estágio seguinte.
+        historia (dict | None): Pontuação de history {movimento: pontos} do jogador da vez,
+            usada para ordenar os peões e as demais paredes.
+        usar_lote (bool): Se True, as demais paredes são validadas em lote com NumPy, de uma
+            vez, quando a busca chega nesse estágio.
+        politica_paredes (str | None): Política de paredes candidatas (ver paredes_candidatas.py).
+        paredes (bool): Se False, para depois dos peões (só os prioritários podem ser paredes).
+
+    Yields:
+        int: Movimentos legais codificados (ver codificacao.py), sem repetição.
+    """
+    jogador = "J1" if turno == 0 else "J2"
+    if jogo.verificar_vitoria_jogador(jogador):
+        return
+
+    casas = jogo.linhas * jogo.colunas
+    peoes = movimentos_peao(jogo, turno)
+    vistos = set()
+
+    # Estágio 1: movimentos prioritários, que só precisam ser legais
+    for movimento in prioritarios:
+        if movimento is None or movimento in vistos:
+            continue
+        vistos.add(movimento)
+        if movimento in peoes or (movimento >= casas and _parede_legal(jogo, movimento, turno)):
+            yield movimento
+
+    # Estágio 2: peões (baratos de gerar e, em geral, os melhores candidatos a corte)
+    for movimento in _ordenar_por_historia(peoes, killers, historia):
+        if movimento not in vistos:
+            vistos.add(movimento)
+            yield movimento
+
+    if not paredes or jogo.paredes_restantes[jogador] <= 0:
+        return
+
+    # A partir daqui o conjunto de paredes é o mesmo de gerar_movimentos_possiveis
+    candidatos = slots_candidatos(jogo, turno, politica_paredes)
+    if candidatos is None:
+        candidatos = range(len(slots_parede(jogo.linhas, jogo.colunas)))
+    paredes = [casas + slot for slot in candidatos]
+    aumentam = politica_paredes == POLITICA_AUMENTAM
+
+    # Estágio 3: paredes killer, validadas uma a uma
+    conjunto = set(paredes)
+    for killer in killers:
+        if killer in conjunto and killer not in vistos:
+            vistos.add(killer)
+            if _parede_legal(jogo, killer, turno) and (
+                not aumentam or avaliar_movimento_rapido(jogo, killer, turno, jogador) > 0
+            ):
+                yield killer
+
+    # Estágio 4: demais paredes por history, validadas só quando a busca chega nelas
+    paredes = _ordenar_por_historia([m for m in paredes if m not in vistos], (), historia)
+    validas = None
+    if usar_lote and paredes:
+        from .paredes_lote import paredes_validas_lote
+
+        validas = paredes_validas_lote(jogo, turno)
+    for movimento in paredes:
+        if validas is not None:
+            if not validas[movimento - casas]:
+                continue
+        elif not _parede_legal(jogo, movimento, turno):
+            continue
+        if aumentam and avaliar_movimento_rapido(jogo, movimento, turno, jogador) <= 0:
+            continue
+        yield movimento
+
+
+# Aplica um movimento ao jogo (muda o estado!) e retorna o token para desfazê-lo
+# com jogo.desfazer_movimento. O movimento deve vir de gerar_movimentos_possiveis.
 def aplicar_movimento(jogo, movimento, turno):
-    tipo, valor = movimento
-    if tipo == "mover":
-        jogo.andar(valor, turno)
-    elif tipo == "parede":
-        jogo.colocar_parede(valor, turno)
-    return jogo
+    return jogo.fazer_movimento(movimento, turno, validar=False)
 
 
 # Cria informações adicionais sobre o movimento para a função de utilidade
 def criar_mover_info(jogo, movimento, turno):
-    tipo, valor = movimento
+    tipo = "parede" if movimento >= jogo.linhas * jogo.colunas else "mover"
     move_info = {"tipo": tipo}
 
     if tipo == "parede":
@@ -176,12 +265,12 @@ def movimento_valido(jogo, pos_atual, nova_pos):
     """
     # Verificar se a nova posição está dentro dos limites do tabuleiro
     if not (0 <= nova_pos[0] < jogo.linhas and 0 <= nova_pos[1] < jogo.colunas):
-        print(f"[VALIDACAO] Movimento para {nova_pos} fora dos limites do tabuleiro")
+        logger.debug("[VALIDACAO] Movimento para %s fora dos limites do tabuleiro", nova_pos)
         return False
         
     # Verificar se a nova posição está ocupada por outro jogador
     if nova_pos in jogo.jogadores.values():
-        print(f"[VALIDACAO] Movimento para {nova_pos} ocupado por outro jogador")
+        logger.debug("[VALIDACAO] Movimento para %s ocupado por outro jogador", nova_pos)
         return False
         
     # Verificar se há parede bloqueando o movimento
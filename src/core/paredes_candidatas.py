@@ -0,0 +1,102 @@
+# Políticas de paredes candidatas para a busca.
+#
+# Considerar todos os 2 * (n - 1)² slots em cada nó (128 no 9x9) deixa a árvore larga
+# demais; na prática só importam paredes perto dos peões ou no caminho de alguém.
+# Estas políticas escolhem um subconjunto dos slots; a legalidade continua sendo
+# verificada por gerar_movimentos_possiveis. A raiz da busca usa todas as paredes.
+
+from .caminho import arestas_menor_caminho
+
+POLITICA_TODAS = "todas"  # Todas as paredes (verificação / raiz)
+POLITICA_CAMINHOS = "caminhos"  # Paredes que cortam o menor caminho de algum jogador
+POLITICA_PROXIMAS = "proximas"  # Paredes a até `raio` casas de algum peão
+POLITICA_AUMENTAM = "aumentam"  # Paredes que aumentam o menor caminho do oponente
+POLITICA_PADRAO = "padrao"  # caminhos + proximas
+POLITICAS = (POLITICA_TODAS, POLITICA_CAMINHOS, POLITICA_PROXIMAS, POLITICA_AUMENTAM, POLITICA_PADRAO)
+
+# Distância (em casas, contando diagonais) entre o peão e a parede em POLITICA_PROXIMAS;
+# 0 considera só as paredes que encostam na casa do peão
+RAIO_PROXIMIDADE = 0
+
+# Casas encostadas em cada slot de parede, por tamanho de tabuleiro: {(linhas, colunas): tuple}
+_CASAS_SLOTS = {}
+
+
+def casas_slots(linhas, colunas):
+    """
+    Lista (em cache) as máscaras das quatro casas em volta de cada slot de bitboard.slots_parede.
+
+    Returns:
+        tuple: Uma máscara de casas (índice linha * colunas + coluna) por slot.
+    """
+    chave = (linhas, colunas)
+    casas = _CASAS_SLOTS.get(chave)
+    if casas is None:
+        bloco = 0b11 | (0b11 << colunas)
+        casas = tuple(
+            bloco << (linha * colunas + coluna)
+            for linha in range(linhas - 1)
+            for coluna in range(colunas - 1)
+            for _ in range(2)
+        )
+        _CASAS_SLOTS[chave] = casas
+    return casas
+
+
+def _regiao_peao(indice, raio, linhas, colunas):
+    """Máscara das casas a até `raio` casas (distância de Chebyshev) do índice dado."""
+    linha, coluna = divmod(indice, colunas)
+    regiao = 0
+    for l in range(max(0, linha - raio), min(linhas, linha + raio + 1)):
+        for c in range(max(0, coluna - raio), min(colunas, coluna + raio + 1)):
+            regiao |= 1 << (l * colunas + c)
+    return regiao
+
+
+def slots_candidatos(jogo, turno, politica, raio=RAIO_PROXIMIDADE):
+    """
+    Slots de parede a considerar segundo a política.
+
+    Para POLITICA_AUMENTAM devolve as paredes que cortam o menor caminho do oponente
+    (as únicas que podem aumentá-lo); o aumento em si só pode ser conferido depois de
+    colocar a parede, o que gerar_movimentos_possiveis faz junto com a legalidade.
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual.
+        turno (int): Jogador que coloca a parede (0 para J1, 1 para J2).
+        politica (str | None): Uma das POLITICAS; None equivale a POLITICA_TODAS.
+        raio (int): Raio de POLITICA_PROXIMAS (também usado em POLITICA_PADRAO).
+
+    Returns:
+        list | None: Índices dos slots candidatos em ordem crescente, ou None para todos.
+    """
+    if politica is None or politica == POLITICA_TODAS:
+        return None
+    if politica not in POLITICAS:
+        raise ValueError(f"Política de paredes desconhecida: {politica}")
+
+    tabuleiro = jogo.tabuleiro
+
+    caminho_h = caminho_v = 0
+    if politica in (POLITICA_CAMINHOS, POLITICA_AUMENTAM, POLITICA_PADRAO):
+        if politica == POLITICA_AUMENTAM:
+            jogadores = ("J2",) if turno == 0 else ("J1",)
+        else:
+            jogadores = ("J1", "J2")
+        for jogador in jogadores:
+            caminho = arestas_menor_caminho(jogador, tabuleiro)
+            if caminho is not None:
+                caminho_h |= caminho[0]
+                caminho_v |= caminho[1]
+
+    regiao = 0
+    if politica in (POLITICA_PROXIMAS, POLITICA_PADRAO):
+        for indice in (tabuleiro.pos_j1, tabuleiro.pos_j2):
+            regiao |= _regiao_peao(indice, raio, tabuleiro.linhas, tabuleiro.colunas)
+
+    casas = casas_slots(tabuleiro.linhas, tabuleiro.colunas)
+    candidatos = []
+    for slot, arestas in enumerate(tabuleiro.arestas_slots):
+        if (arestas[0] & caminho_h) or (arestas[1] & caminho_v) or (casas[slot] & regiao):
+            candidatos.append(slot)
+    return candidatos
@@ -0,0 +1,148 @@
+import numpy as np
+
+from .bitboard import slots_parede
+from .caminho import arestas_menor_caminho
+
+# Casas afetadas por cada slot de parede, por tamanho de tabuleiro: {(linhas, colunas): dict}
+_ARESTAS_SLOTS = {}
+
+
+def _arestas_slots(linhas, colunas):
+    """Índices (em cache) das duas arestas bloqueadas por cada slot de slots_parede."""
+    chave = (linhas, colunas)
+    arestas = _ARESTAS_SLOTS.get(chave)
+    if arestas is None:
+        linha_a, coluna_a, linha_b, coluna_b, horizontal = [], [], [], [], []
+        for linha, coluna, orientacao, _ in slots_parede(linhas, colunas):
+            if orientacao == "h":
+                # Bloqueia o movimento para baixo de (linha, coluna) e (linha, coluna + 1)
+                linha_a.append(linha)
+                coluna_a.append(coluna)
+                linha_b.append(linha)
+                coluna_b.append(coluna + 1)
+                horizontal.append(True)
+            else:
+                # Bloqueia o movimento para a direita de (linha, coluna - 1) e (linha + 1, coluna - 1)
+                linha_a.append(linha)
+                coluna_a.append(coluna - 1)
+                linha_b.append(linha + 1)
+                coluna_b.append(coluna - 1)
+                horizontal.append(False)
+        arestas = {
+            "linha_a": np.array(linha_a),
+            "coluna_a": np.array(coluna_a),
+            "linha_b": np.array(linha_b),
+            "coluna_b": np.array(coluna_b),
+            "horizontal": np.array(horizontal),
+        }
+        _ARESTAS_SLOTS[chave] = arestas
+    return arestas
+
+
+def _mascara_para_matriz(mascara, linhas, colunas):
+    """Converte uma máscara de bits do TabuleiroBitboard em uma matriz booleana (linhas, colunas)."""
+    total = linhas * colunas
+    dados = np.frombuffer(mascara.to_bytes((total + 7) // 8, "little"), dtype=np.uint8)
+    bits = np.unpackbits(dados, bitorder="little")[:total]
+    return bits.astype(bool).reshape(linhas, colunas)
+
+
+def _alcanca_objetivo(baixo, direita, linha, coluna, linha_objetivo):
+    """
+    Flood fill simultâneo em um lote de tabuleiros.
+
+    Args:
+        baixo (np.ndarray): (B, linhas, colunas), True se é possível mover da casa para baixo.
+        direita (np.ndarray): (B, linhas, colunas), True se é possível mover da casa para a direita.
+        linha, coluna (int): Casa de partida (a mesma em todos os tabuleiros do lote).
+        linha_objetivo (int): Linha que o jogador precisa alcançar.
+
+    Returns:
+        np.ndarray: (B,) True nos tabuleiros em que a linha objetivo é alcançável.
+    """
+    alcance = np.zeros(baixo.shape, dtype=bool)
+    alcance[:, linha, coluna] = True
+    baixo_interno = baixo[:, :-1, :]
+    direita_interna = direita[:, :, :-1]
+    while True:
+        chegou = alcance[:, linha_objetivo, :].any(axis=1)
+        if chegou.all():
+            return chegou
+        novo = alcance.copy()
+        novo[:, 1:, :] |= alcance[:, :-1, :] & baixo_interno
+        novo[:, :-1, :] |= alcance[:, 1:, :] & baixo_interno
+        novo[:, :, 1:] |= alcance[:, :, :-1] & direita_interna
+        novo[:, :, :-1] |= alcance[:, :, 1:] & direita_interna
+        if np.array_equal(novo, alcance):
+            return chegou
+        alcance = novo
+
+
+def paredes_validas_lote(jogo, turno):
+    """
+    Decide de uma vez quais paredes o jogador do turno pode colocar.
+
+    As regras de limite, sobreposição e cruzamento são verificadas nas máscaras de bits.
+    As paredes que cortam o menor caminho atual de algum jogador são aplicadas em lote
+    sobre matrizes NumPy de adjacência, e um único flood fill vetorizado por jogador
+    verifica se alguém ficou sem caminho.
+
+    Args:
+        jogo (JogoQuoridor): Jogo atual (não é alterado).
+        turno (int): 0 para J1, 1 para J2.
+
+    Returns:
+        np.ndarray: Máscara booleana com um item por slot de slots_parede
+            (2 * (linhas - 1) * (colunas - 1) itens).
+    """
+    linhas, colunas = jogo.linhas, jogo.colunas
+    tabuleiro = jogo.tabuleiro
+    slots = slots_parede(linhas, colunas)
+    validas = np.zeros(len(slots), dtype=bool)
+    jogador = "J1" if turno == 0 else "J2"
+    if jogo.paredes_restantes[jogador] <= 0:
+        return validas
+
+    caminho_j1 = arestas_menor_caminho("J1", tabuleiro)
+    caminho_j2 = arestas_menor_caminho("J2", tabuleiro)
+    corta_caminho = np.zeros(len(slots), dtype=bool)
+    for slot, (linha, coluna, orientacao, _) in enumerate(slots):
+        mascaras = tabuleiro.mascaras_parede(linha, coluna, orientacao)
+        if mascaras is None:
+            continue
+        validas[slot] = True
+        mascara_h, mascara_v = mascaras
+        for caminho in (caminho_j1, caminho_j2):
+            if caminho is None or caminho[0] & mascara_h or caminho[1] & mascara_v:
+                corta_caminho[slot] = True
+
+    candidatos = np.flatnonzero(corta_caminho)
+    if len(candidatos) == 0:
+        return validas
+
+    # Adjacência atual repetida para cada candidato, com as duas arestas da parede removidas
+    ultima_linha = np.zeros((linhas, colunas), dtype=bool)
+    ultima_linha[-1, :] = True
+    ultima_coluna = np.zeros((linhas, colunas), dtype=bool)
+    ultima_coluna[:, -1] = True
+    baixo_base = ~_mascara_para_matriz(tabuleiro.paredes_h, linhas, colunas) & ~ultima_linha
+    direita_base = ~_mascara_para_matriz(tabuleiro.paredes_v, linhas, colunas) & ~ultima_coluna
+
+    lote = len(candidatos)
+    baixo = np.repeat(baixo_base[np.newaxis], lote, axis=0)
+    direita = np.repeat(direita_base[np.newaxis], lote, axis=0)
+    arestas = _arestas_slots(linhas, colunas)
+    horizontal = arestas["horizontal"][candidatos]
+    indices_lote = np.arange(lote)
+    for extremo in ("a", "b"):
+        linhas_aresta = arestas["linha_" + extremo][candidatos]
+        colunas_aresta = arestas["coluna_" + extremo][candidatos]
+        baixo[indices_lote[horizontal], linhas_aresta[horizontal], colunas_aresta[horizontal]] = False
+        direita[indices_lote[~horizontal], linhas_aresta[~horizontal], colunas_aresta[~horizontal]] = False
+
+    j1_linha, j1_coluna = jogo.jogadores["J1"]
+    j2_linha, j2_coluna = jogo.jogadores["J2"]
+    conectado = _alcanca_objetivo(baixo, direita, j1_linha, j1_coluna, linhas - 1)
+    conectado &= _alcanca_objetivo(baixo, direita, j2_linha, j2_coluna, 0)
+    validas[candidatos] &= conectado
+    return validas
@@ -1,6 +1,14 @@
 from collections import deque
 
+from .bitboard import TabuleiroBitboard
+from .caminho import campo_distancias
+
+
 def shortest_path_length(jogador, pos, tabuleiro):
+    if isinstance(tabuleiro, TabuleiroBitboard):
+        # Consulta no campo de distâncias da configuração de paredes atual (em cache)
+        return campo_distancias(jogador, tabuleiro)[pos[0] * tabuleiro.colunas + pos[1]]
+
     # Determinar as dimensões do tabuleiro dinamicamente
     num_linhas = len(tabuleiro)
     num_colunas = len(tabuleiro[0]) if num_linhas > 0 else 0
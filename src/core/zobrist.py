@@ -0,0 +1,63 @@
+import random
+
+# Chaves Zobrist por tamanho de tabuleiro: {(linhas, colunas): dict}
+# A semente depende só do tamanho, então as chaves são as mesmas em qualquer
+# processo e podem ser usadas em tabelas salvas em disco.
+_TABELAS = {}
+
+
+def tabela_zobrist(linhas, colunas):
+    """Retorna (e guarda em cache) as chaves Zobrist de 64 bits de um tamanho de tabuleiro.
+
+    Returns:
+        dict: Com as chaves:
+            - 'peao': duas listas (J1, J2) com uma chave por casa
+            - 'parede_h' / 'parede_v': uma chave por bit de aresta bloqueada
+            - 'paredes_restantes': duas listas (J1, J2) indexadas pela contagem
+            - 'lado': chave aplicada quando é a vez de J2
+            - 'perspectiva': chave aplicada pela busca quando os valores são do ponto de vista de J2
+    """
+    chave = (linhas, colunas)
+    tabela = _TABELAS.get(chave)
+    if tabela is None:
+        rng = random.Random(f"zobrist-quoridor-{linhas}x{colunas}")
+        casas = linhas * colunas
+        tabela = {
+            "peao": tuple(
+                [rng.getrandbits(64) for _ in range(casas)] for _ in range(2)
+            ),
+            "parede_h": [rng.getrandbits(64) for _ in range(casas)],
+            "parede_v": [rng.getrandbits(64) for _ in range(casas)],
+            # Nunca há mais paredes restantes do que casas no tabuleiro
+            "paredes_restantes": tuple(
+                [rng.getrandbits(64) for _ in range(casas + 1)] for _ in range(2)
+            ),
+            "lado": rng.getrandbits(64),
+            "perspectiva": rng.getrandbits(64),
+        }
+        _TABELAS[chave] = tabela
+    return tabela
+
+
+def hash_mascara(chaves, mascara):
+    """XOR das chaves de todos os bits ligados em ``mascara``."""
+    resultado = 0
+    while mascara:
+        menor = mascara & -mascara
+        resultado ^= chaves[menor.bit_length() - 1]
+        mascara ^= menor
+    return resultado
+
+
+def calcular_hash_zobrist(jogo):
+    """Calcula do zero a chave Zobrist de um JogoQuoridor (posições, paredes, contagens e vez)."""
+    tabela = tabela_zobrist(jogo.linhas, jogo.colunas)
+    tabuleiro = jogo.tabuleiro
+    chave = tabela["peao"][0][tabuleiro.pos_j1] ^ tabela["peao"][1][tabuleiro.pos_j2]
+    chave ^= hash_mascara(tabela["parede_h"], tabuleiro.paredes_h)
+    chave ^= hash_mascara(tabela["parede_v"], tabuleiro.paredes_v)
+    chave ^= tabela["paredes_restantes"][0][jogo.paredes_restantes["J1"]]
+    chave ^= tabela["paredes_restantes"][1][jogo.paredes_restantes["J2"]]
+    if jogo.lado_a_jogar == 1:
+        chave ^= tabela["lado"]
+    return chave
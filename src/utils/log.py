@@ -0,0 +1,61 @@
+# Camada de log do projeto, sobre o módulo logging da biblioteca padrão.
+#
+# Os módulos obtêm um logger com obter_logger(__name__) e registram mensagens com
+# formatação preguiçosa (logger.debug("valor %s", x)), então nada é formatado quando o
+# nível está desligado. Em laços quentes, proteja a chamada com
+# ``if logger.isEnabledFor(logging.DEBUG):`` para que o custo seja uma comparação.
+# Sem configurar_verbosidade só aparecem avisos e erros (comportamento padrão do logging).
+
+import logging
+import os
+import sys
+
+NOME_RAIZ = "quoridor"
+
+# Nível extra acima de CRITICAL: não mostra nada
+SILENCIOSO = logging.CRITICAL + 10
+
+NIVEIS = {
+    "silencioso": SILENCIOSO,
+    "erro": logging.ERROR,
+    "aviso": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+# Variável de ambiente consultada quando configurar_verbosidade é chamada sem nível
+VARIAVEL_AMBIENTE = "QUORIDOR_VERBOSIDADE"
+
+_handler = None
+
+
+def obter_logger(nome):
+    """Logger filho de 'quoridor' (ex.: obter_logger(__name__) -> 'quoridor.src.ai.minimax')."""
+    return logging.getLogger(f"{NOME_RAIZ}.{nome}")
+
+
+def configurar_verbosidade(nivel=None):
+    """
+    Define o nível de log do projeto e envia as mensagens para stdout.
+
+    Args:
+        nivel (str | int, opcional): 'silencioso', 'erro', 'aviso', 'info', 'debug' ou um nível
+            de logging. Se None, usa a variável de ambiente QUORIDOR_VERBOSIDADE ('info' se ausente).
+
+    Returns:
+        int: O nível aplicado.
+    """
+    global _handler
+    if nivel is None:
+        nivel = os.environ.get(VARIAVEL_AMBIENTE, "info")
+    if isinstance(nivel, str):
+        nivel = NIVEIS[nivel.lower()]
+
+    raiz = logging.getLogger(NOME_RAIZ)
+    if _handler is None:
+        _handler = logging.StreamHandler(sys.stdout)
+        _handler.setFormatter(logging.Formatter("%(message)s"))
+        raiz.addHandler(_handler)
+        raiz.propagate = False
+    raiz.setLevel(nivel)
+    return nivel
@@ -0,0 +1,27 @@
+import pickle
+
+from src.ai.q_learning_agent import AgenteQLearningTabular
+from src.core.codificacao import converter_movimento_legado
+from src.core.game import JogoQuoridor
+
+
+def test_q_tabela_antiga_com_salto(tmp_path):
+    # J1 em (1, 2) e J2 em (2, 2), vez de J1: a ação antiga para a casa do oponente é o salto
+    jogo = JogoQuoridor(linhas=5, colunas=5, total_paredes_jogador=3)
+    for movimento, turno in ((("mover", (1, 2)), 0), (("mover", (3, 2)), 1), (("mover", (2, 2)), 1)):
+        assert jogo.aplicar_movimento(movimento, turno)
+    estado = jogo.get_estado_tupla(0)
+    acoes_antigas = {("mover", (2, 2)): 1.5, ("mover", (1, 1)): 0.5, ("parede", (0, 0, "h")): 0.25}
+    arquivo = tmp_path / "q_tabela.pkl"
+    with open(arquivo, "wb") as f:
+        pickle.dump({estado: acoes_antigas}, f)
+
+    agente = AgenteQLearningTabular(nome_arquivo_q_tabela=str(arquivo), dimensoes_tabuleiro=(5, 5))
+    agente.salvar_q_tabela()
+    recarregado = AgenteQLearningTabular(nome_arquivo_q_tabela=str(arquivo), dimensoes_tabuleiro=(5, 5))
+
+    esperado = {converter_movimento_legado(jogo, acao, 0): q for acao, q in acoes_antigas.items()}
+    assert 3 * 5 + 2 in esperado  # o salto cai em (3, 2), atrás do oponente
+    assert set(esperado) <= set(jogo.get_acoes_validas(0))
+    assert dict(agente.q_tabela[estado]) == esperado
+    assert dict(recarregado.q_tabela[estado]) == esperado
@@ -1,4 +1,5 @@
 import datetime
+import logging
 import os
 import random
 import sys
@@ -7,10 +8,13 @@ import numpy as np
 
 from src.ai.q_learning_agent import AgenteQLearningTabular
 from src.core.game import JogoQuoridor
+from src.utils.log import configurar_verbosidade, obter_logger
 
 sys.path.append("src/core")
 from debug_utils import visualizar_tabuleiro
 
+logger = obter_logger("treinar_qtabular")
+
 # Garante que o diretório raiz do projeto esteja no sys.path
 project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
@@ -21,6 +25,9 @@ NUM_EPISODIOS = 10000  # Aumentado para 1000 episódios
 TAMANHO_TABULEIRO = 5  # Tabuleiro 5x5
 PAREDES_POR_JOGADOR = 3  # 3 paredes por jogador
 MAX_MOVIMENTOS_POR_EPISODIO = 200  # Aumentado para 200 para permitir jogos mais longos
+# Verbosidade do log: 'silencioso', 'erro', 'aviso', 'info' ou 'debug'
+# (None usa a variável de ambiente QUORIDOR_VERBOSIDADE, ou 'info')
+VERBOSIDADE = None
 
 
 # Parâmetros para AgenteQLearningTabular
@@ -94,14 +101,14 @@ def calcular_recompensa(jogo, turno_idx, estado_anterior, estado_atual):
 
 
 def treinar():
-    print(
-        "Iniciando treinamento Q-Learning Tabular para Quoridor simplificado.",
-        flush=True,
-    )
-    print(
-        f"Tabuleiro: {TAMANHO_TABULEIRO}x{TAMANHO_TABULEIRO}, Paredes por jogador: {PAREDES_POR_JOGADOR}"
+    logger.info("Iniciando treinamento Q-Learning Tabular para Quoridor simplificado.")
+    logger.info(
+        "Tabuleiro: %dx%d, Paredes por jogador: %d",
+        TAMANHO_TABULEIRO,
+        TAMANHO_TABULEIRO,
+        PAREDES_POR_JOGADOR,
     )
-    print(f"Número de Episódios: {NUM_EPISODIOS}")
+    logger.info("Número de Episódios: %d", NUM_EPISODIOS)
 
     # Cria a pasta para salvar modelos, se não existir
     os.makedirs(PASTA_MODELOS, exist_ok=True)
@@ -120,15 +127,15 @@ def treinar():
         epsilon=EPSILON_INICIAL,
         min_epsilon=MIN_EPSILON,
         epsilon_decay=EPSILON_DECAY,
+        dimensoes_tabuleiro=(TAMANHO_TABULEIRO, TAMANHO_TABULEIRO),
     )
 
     if CARREGAR_MODELO and CAMINHO_MODELO_CARREGAR:
         try:
             agente.carregar_q_tabela(CAMINHO_MODELO_CARREGAR)
-            print(f"Q-tabela carregada de {CAMINHO_MODELO_CARREGAR}")
         except Exception as e:
-            print(f"Erro ao carregar Q-tabela: {e}")
-            print("Continuando com Q-tabela nova.")
+            logger.error("Erro ao carregar Q-tabela: %s", e)
+            logger.error("Continuando com Q-tabela nova.")
 
     # Estatísticas de treinamento
     vitorias_j1 = 0
@@ -138,9 +145,7 @@ def treinar():
 
     # Loop principal de treinamento
     for episodio in range(1, NUM_EPISODIOS + 1):
-        print(
-            f"[DEBUG] Iniciando Episódio: {episodio}/{NUM_EPISODIOS}"
-        )  # Added debug print
+        logger.debug("Iniciando Episódio: %d/%d", episodio, NUM_EPISODIOS)
         jogo.resetar_jogo()
         total_movimentos = 0
         estado_atual_j1 = jogo.get_estado_tupla(0)  # Estado inicial J1
@@ -174,9 +179,7 @@ def treinar():
 
                 # Se muitos movimentos inválidos consecutivos, terminar episódio
                 if movimentos_invalidos_consecutivos >= MAX_MOVIMENTOS_INVALIDOS:
-                    print(
-                        f"[DEBUG] Muitos movimentos inválidos consecutivos, terminando episódio."
-                    )
+                    logger.debug("Muitos movimentos inválidos consecutivos, terminando episódio.")
                     jogo.jogo_terminado = True
                     break
 
@@ -187,11 +190,11 @@ def treinar():
                     if not sucesso:
                         continue  # Tenta novamente na próxima iteração
 
-                print(f"[DEBUG] Tabuleiro atual:")
-                print(visualizar_tabuleiro(jogo))
-                print(f"[DEBUG] Posição J1: {jogo.jogadores['J1']}")
-                print(f"[DEBUG] Ações válidas: {acoes_validas_j1[:3]}...")
-                print(f"[DEBUG] Movimento inválido para J1: {acao_j1}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Tabuleiro atual:\n%s", visualizar_tabuleiro(jogo))
+                    logger.debug("Posição J1: %s", jogo.jogadores["J1"])
+                    logger.debug("Ações válidas: %s...", acoes_validas_j1[:3])
+                    logger.debug("Movimento inválido para J1: %s", acao_j1)
                 continue
 
             # Resetar contador de movimentos inválidos se o movimento foi bem-sucedido
@@ -209,8 +212,10 @@ def treinar():
                 jogo.jogo_terminado = True
                 jogo.vencedor = "J1"
                 vitorias_j1 += 1
-                print(
-                    f"[VITÓRIA] J1 venceu no episódio {episodio} após {total_movimentos} movimentos!"
+                logger.debug(
+                    "[VITÓRIA] J1 venceu no episódio %d após %d movimentos!",
+                    episodio,
+                    total_movimentos,
                 )
 
             # Atualiza Q-valores para J1
@@ -252,9 +257,7 @@ def treinar():
 
                 # Se muitos movimentos inválidos consecutivos, terminar episódio
                 if movimentos_invalidos_consecutivos >= MAX_MOVIMENTOS_INVALIDOS:
-                    print(
-                        f"[DEBUG] Muitos movimentos inválidos consecutivos, terminando episódio."
-                    )
+                    logger.debug("Muitos movimentos inválidos consecutivos, terminando episódio.")
                     jogo.jogo_terminado = True
                     break
 
@@ -265,11 +268,11 @@ def treinar():
                     if not sucesso:
                         continue  # Tenta novamente na próxima iteração
 
-                print(f"[DEBUG] Tabuleiro atual:")
-                print(visualizar_tabuleiro(jogo))
-                print(f"[DEBUG] Posição J2: {jogo.jogadores['J2']}")
-                print(f"[DEBUG] Ações válidas: {acoes_validas_j2[:3]}...")
-                print(f"[DEBUG] Movimento inválido para J2: {acao_j2}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Tabuleiro atual:\n%s", visualizar_tabuleiro(jogo))
+                    logger.debug("Posição J2: %s", jogo.jogadores["J2"])
+                    logger.debug("Ações válidas: %s...", acoes_validas_j2[:3])
+                    logger.debug("Movimento inválido para J2: %s", acao_j2)
                 continue
 
             # Resetar contador de movimentos inválidos se o movimento foi bem-sucedido
@@ -287,8 +290,10 @@ def treinar():
                 jogo.jogo_terminado = True
                 jogo.vencedor = "J2"
                 vitorias_j2 += 1
-                print(
-                    f"[VITÓRIA] J2 venceu no episódio {episodio} após {total_movimentos} movimentos!"
+                logger.debug(
+                    "[VITÓRIA] J2 venceu no episódio %d após %d movimentos!",
+                    episodio,
+                    total_movimentos,
                 )
 
             # Atualiza Q-valores para J2
@@ -322,7 +327,6 @@ def treinar():
                 f"{PASTA_MODELOS}/{NOME_BASE_MODELO}_episodio_{episodio}.pkl"
             )
             agente.salvar_q_tabela(caminho_modelo)
-            print(f"Q-tabela salva em {caminho_modelo}")
 
         # Imprime progresso a cada 10 episódios ou quando há uma vitória
         if episodio % 10 == 0 or vitorias_j1 > 0 or vitorias_j2 > 0:
@@ -333,31 +337,35 @@ def treinar():
                 else np.mean(movimentos_por_episodio)
             )
 
-            print(
-                f"Episódio {episodio}/{NUM_EPISODIOS} | "
-                + f"Epsilon: {agente.epsilon:.4f} | "
-                + f"Movimentos médios: {media_movimentos:.2f} | "
-                + f"Tempo decorrido: {tempo_decorrido} | "
-                + f"Vitórias J1/J2: {vitorias_j1}/{vitorias_j2} | "
-                + f"Tamanho Q-tabela: {len(agente.q_tabela)}"
+            logger.info(
+                "Episódio %d/%d | Epsilon: %.4f | Movimentos médios: %.2f | "
+                "Tempo decorrido: %s | Vitórias J1/J2: %d/%d | Tamanho Q-tabela: %d",
+                episodio,
+                NUM_EPISODIOS,
+                agente.epsilon,
+                media_movimentos,
+                tempo_decorrido,
+                vitorias_j1,
+                vitorias_j2,
+                len(agente.q_tabela),
             )
 
     # Estatísticas finais
     tempo_total = datetime.datetime.now() - timestamp_inicio
-    print("\n=== Estatísticas finais de treinamento ===")
-    print(f"Tempo total de treinamento: {tempo_total}")
-    print(f"Tamanho final da Q-tabela: {len(agente.q_tabela)} estados")
-    print(f"Vitórias J1: {vitorias_j1}, Vitórias J2: {vitorias_j2}")
-    print(f"Movimentos médios por episódio: {np.mean(movimentos_por_episodio):.2f}")
+    logger.info("\n=== Estatísticas finais de treinamento ===")
+    logger.info("Tempo total de treinamento: %s", tempo_total)
+    logger.info("Tamanho final da Q-tabela: %d estados", len(agente.q_tabela))
+    logger.info("Vitórias J1: %d, Vitórias J2: %d", vitorias_j1, vitorias_j2)
+    logger.info("Movimentos médios por episódio: %.2f", np.mean(movimentos_por_episodio))
 
     # Salvar modelo final
     caminho_final = f"{PASTA_MODELOS}/{NOME_BASE_MODELO}_final.pkl"
     agente.salvar_q_tabela(caminho_final)
-    print(f"Q-tabela final salva em {caminho_final}")
 
     return agente
 
 
 if __name__ == "__main__":
-    print("[DEBUG] Iniciando execução do script treinar_qtabular.py", flush=True)
+    configurar_verbosidade(VERBOSIDADE)
+    logger.debug("Iniciando execução do script treinar_qtabular.py")
     treinar()